@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from redis import Redis
-import celery.exceptions
+"""
+Health endpoints answer from the snapshot the background health prober
+keeps up to date (see app/interface/health_prober.py), so they never block
+on Redis or on a broadcast to the Celery workers.
+"""
+from fastapi import APIRouter, HTTPException
 import logging
-from app.core.celery_app import celery_app
-from app.core.redis_client import get_redis_client
+from app.interface.health_prober import health_prober
 
 logger = logging.getLogger("api")
 router = APIRouter(prefix="/health", tags=["health"])
@@ -14,8 +16,9 @@ async def health_check():
     """Overall system health check"""
     logger.debug("Performing complete health check")
 
-    redis_health = check_redis_health()
-    celery_health = check_celery_health()
+    snapshot = health_prober.snapshot()
+    redis_health = snapshot["redis"]
+    celery_health = snapshot["celery"]
 
     # Determine overall status
     overall_status = "ok"
@@ -28,7 +31,10 @@ async def health_check():
             "api": "healthy",
             "celery": celery_health,
             "redis": redis_health
-        }
+        },
+        "workers": snapshot["workers"],
+        "checked_at": snapshot["checked_at"],
+        "staleness_seconds": snapshot["staleness_seconds"]
     }
 
 
@@ -39,59 +45,26 @@ async def ping():
 
 
 @router.get("/redis")
-async def redis_health(redis: Redis = Depends(get_redis_client)):
+async def redis_health():
     """Check Redis connection"""
     logger.debug("Checking Redis health")
-    try:
-        redis.ping()
-        return {"status": "healthy"}
-    except Exception as e:
-        logger.error(f"Redis health check failed: {str(e)}")
-        raise HTTPException(
-            status_code=503, detail=f"Redis unhealthy: {str(e)}")
+    snapshot = health_prober.snapshot()
+    if snapshot["redis"] == "healthy":
+        return {"status": "healthy", "staleness_seconds": snapshot["staleness_seconds"]}
+    raise HTTPException(
+        status_code=503, detail=f"Redis unhealthy: {snapshot['redis']}")
 
 
 @router.get("/celery")
 async def celery_health():
     """Check Celery workers status"""
     logger.debug("Checking Celery health")
-    status = check_celery_health()
-    if status == "healthy":
-        return {"status": "healthy"}
-    else:
-        raise HTTPException(
-            status_code=503, detail=f"Celery unhealthy: {status}")
-
-
-def check_redis_health():
-    """Check Redis connection and return status string"""
-    try:
-        redis = get_redis_client()
-        redis.ping()
-        return "healthy"
-    except Exception as e:
-        logger.error(f"Redis health check failed: {str(e)}")
-        return f"unhealthy: {str(e)}"
-
-
-def check_celery_health():
-    """Check Celery workers and return status string"""
-    try:
-        inspector = celery_app.control.inspect()
-        workers = inspector.ping()
-
-        if not workers:
-            return "no workers available"
-
-        # Check if all workers responded successfully
-        for worker, response in workers.items():
-            if not response.get('ok'):
-                return f"worker {worker} not responding properly"
-
-        return "healthy"
-    except celery.exceptions.CeleryError as e:
-        logger.error(f"Celery health check failed: {str(e)}")
-        return f"error: {str(e)}"
-    except Exception as e:
-        logger.exception(f"Unexpected error in Celery health check: {str(e)}")
-        return f"error: {str(e)}"
+    snapshot = health_prober.snapshot()
+    if snapshot["celery"] == "healthy":
+        return {
+            "status": "healthy",
+            "workers": snapshot["workers"],
+            "staleness_seconds": snapshot["staleness_seconds"]
+        }
+    raise HTTPException(
+        status_code=503, detail=f"Celery unhealthy: {snapshot['celery']}")
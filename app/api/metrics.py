@@ -1,54 +1,108 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import PlainTextResponse, Response
 import logging
-from app.core.redis_client import get_redis_client
+from app.core.celery_app import celery_app
+from app.core.redis_client import get_async_broker_client, get_async_redis_client
+from app.core.result_cache import CACHE_STATS_PREFIX
+from app.core.telemetry import (
+    CIRCUITS_KEY,
+    HISTOGRAM_PREFIX,
+    ROUTING_KEY,
+    STAGES,
+    STARTUP_PHASES,
+    STARTUP_PREFIX,
+    render_histograms,
+    render_metric,
+)
 
 logger = logging.getLogger("api")
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
+# Hash in which the Redis broker transport keeps delivered, unacked messages
+BROKER_UNACKED_KEY = "unacked"
+
+# Content type of the Prometheus text exposition format
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _queue_names():
+    """Names of the broker queues workers consume, default and size tiers"""
+    return [queue.name for queue in celery_app.conf.task_queues]
+
+
+async def _broker_stats():
+    """
+    Reads the depth of every broker queue and the unacked message count
+    in one round trip.
+    Returns:
+        tuple: Waiting messages per queue name, and reserved messages.
+    """
+    queues = _queue_names()
+    broker_pipe = get_async_broker_client().pipeline(transaction=False)
+    for queue in queues:
+        broker_pipe.llen(queue)
+    broker_pipe.hlen(BROKER_UNACKED_KEY)
+    *depths, reserved_tasks = await broker_pipe.execute()
+    return dict(zip(queues, depths)), reserved_tasks
+
 
 @router.get("/")
-async def get_metrics(redis=Depends(get_redis_client)):
+async def get_metrics(redis=Depends(get_async_redis_client)):
     """Get basic system metrics"""
     logger.debug("Retrieving system metrics")
 
     try:
-        # Basic Redis stats
-        info = redis.info()
+        # Every figure is a counter maintained at enqueue, start, finish and
+        # fail time, or a broker list length: constant time for any number
+        # of stored results
+        pipe = redis.pipeline(transaction=False)
+        pipe.info()
+        pipe.mget(
+            'stats:enqueued_tasks',
+            'stats:active_tasks',
+            'stats:completed_tasks',
+            'stats:failed_tasks',
+            CACHE_STATS_PREFIX + 'local_hits',
+            CACHE_STATS_PREFIX + 'redis_hits',
+            CACHE_STATS_PREFIX + 'misses')
+        info, counters = await pipe.execute()
+        (enqueued_tasks, active_tasks, completed_tasks, failed_tasks,
+         local_hits, redis_hits, misses) = (int(value or 0) for value in counters)
+        # A worker killed mid-task never decrements its running counter
+        active_tasks = max(active_tasks, 0)
 
-        # Celery task metrics from Redis
-        pending_tasks = 0
-        active_tasks = 0
-        reserved_tasks = 0
+        # Broker queue depths and messages delivered to workers but not acked
+        queue_depths, reserved_tasks = await _broker_stats()
+        pending_tasks = sum(queue_depths.values())
 
-        # Try to get Celery task metrics using pattern search
-        task_keys = redis.keys('celery-task-meta-*')
-        completed_tasks = len(task_keys)
+        # Calculate success rate over finished tasks
+        finished_tasks = completed_tasks + failed_tasks
+        success_rate = completed_tasks / finished_tasks * 100 if finished_tasks > 0 else 0
 
-        # Get custom metrics if available
-        total_tasks = int(redis.get('stats:total_tasks') or 0)
-        failed_tasks = int(redis.get('stats:failed_tasks') or 0)
-
-        # If we don't have total tasks stats, use completed + pending as estimate
-        if total_tasks == 0:
-            total_tasks = max(completed_tasks, 1)  # Avoid division by zero
-
-        # Calculate success rate
-        success_rate = (completed_tasks - failed_tasks) / \
-            total_tasks * 100 if total_tasks > 0 else 0
+        # Result cache hit rate
+        lookups = local_hits + redis_hits + misses
+        hit_rate = (local_hits + redis_hits) / lookups * 100 if lookups > 0 else 0
 
         return {
             "queue_stats": {
                 "pending_tasks": pending_tasks,
+                "pending_by_queue": queue_depths,
                 "active_tasks": active_tasks,
                 "reserved_tasks": reserved_tasks,
                 "completed_tasks": completed_tasks,
             },
             "task_stats": {
-                "total": total_tasks,
+                "total": enqueued_tasks,
                 "completed": completed_tasks,
                 "failed": failed_tasks,
                 "success_rate": round(success_rate, 2)
             },
+            "cache_stats": {
+                "local_hits": local_hits,
+                "redis_hits": redis_hits,
+                "misses": misses,
+                "hit_rate": round(hit_rate, 2)
+            },
             "redis_stats": {
                 "connected_clients": info.get("connected_clients", 0),
                 "used_memory_human": info.get("used_memory_human", "N/A"),
@@ -64,17 +118,35 @@ async def get_metrics(redis=Depends(get_redis_client)):
 
 
 @router.get("/tasks")
-async def get_task_metrics(redis=Depends(get_redis_client)):
+async def get_task_metrics(redis=Depends(get_async_redis_client)):
     """Get detailed task processing metrics"""
     logger.debug("Retrieving task metrics")
 
     try:
         # Get stored task timing metrics if available
-        avg_execution_time = float(redis.get('stats:avg_execution_time') or 0)
+        execution_time_sum, execution_time_count = await redis.mget(
+            'stats:execution_time_sum', 'stats:execution_time_count')
+        execution_time_count = int(execution_time_count or 0)
+        avg_execution_time = float(execution_time_sum or 0) / execution_time_count \
+            if execution_time_count > 0 else 0
+
+        # Parsed circuit cache counters reported by the workers
+        hits, misses, parse_time_saved_ms = await redis.mget(
+            'stats:circuit_cache:hits',
+            'stats:circuit_cache:misses',
+            'stats:circuit_cache:parse_time_saved_ms')
+        hits, misses = int(hits or 0), int(misses or 0)
+        lookups = hits + misses
 
         return {
             "timing": {
                 "avg_execution_time_ms": round(avg_execution_time * 1000, 2)
+            },
+            "circuit_cache": {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / lookups * 100, 2) if lookups > 0 else 0,
+                "parse_time_saved_ms": round(float(parse_time_saved_ms or 0), 2)
             }
         }
     except Exception as e:
@@ -83,3 +155,97 @@ async def get_task_metrics(redis=Depends(get_redis_client)):
             "status": "error",
             "message": f"Error retrieving task metrics: {str(e)}"
         }
+
+
+@router.get("/prometheus", response_class=PlainTextResponse)
+async def get_prometheus_metrics(redis=Depends(get_async_redis_client)):
+    """Get stage latency histograms and task counters in Prometheus text format"""
+    logger.debug("Retrieving Prometheus metrics")
+
+    # A fixed number of keys is read, so scraping cost does not grow with traffic
+    pipe = redis.pipeline(transaction=False)
+    for stage in STAGES:
+        pipe.hgetall(HISTOGRAM_PREFIX + stage)
+    for phase in STARTUP_PHASES:
+        pipe.hgetall(STARTUP_PREFIX + phase)
+    pipe.hgetall(CIRCUITS_KEY)
+    pipe.hgetall(ROUTING_KEY)
+    pipe.mget(
+        'stats:enqueued_tasks',
+        'stats:active_tasks',
+        'stats:completed_tasks',
+        'stats:failed_tasks')
+    *histograms, circuits, routing, counters = await pipe.execute()
+    histograms, startup = histograms[:len(STAGES)], histograms[len(STAGES):]
+    enqueued_tasks, active_tasks, completed_tasks, failed_tasks = (
+        int(value or 0) for value in counters)
+
+    queue_depths, reserved_tasks = await _broker_stats()
+
+    circuit_samples = []
+    for field, value in sorted(circuits.items()):
+        outcome, qubits = field.decode().split(":", 1)
+        circuit_samples.append(({"outcome": outcome, "qubits": qubits}, int(value)))
+
+    # Routing fields are "{queue}:tasks", "{queue}:estimated_ms", "{queue}:actual_ms"
+    routed = {}
+    for field, value in routing.items():
+        queue, name = field.decode().rsplit(":", 1)
+        routed.setdefault(queue, {})[name] = float(value)
+    routed = sorted(routed.items())
+
+    lines = render_histograms(
+        "qc_stage_duration_seconds",
+        "Time spent in each stage of circuit processing.",
+        dict(zip(STAGES, histograms)))
+    lines += render_histograms(
+        "qc_worker_startup_seconds",
+        "Worker startup time by phase (see app/workers/startup.py).",
+        dict(zip(STARTUP_PHASES, startup)),
+        label="phase")
+    lines += render_metric(
+        "qc_tasks_enqueued_total", "counter",
+        "Tasks enqueued on the broker.", [({}, enqueued_tasks)])
+    lines += render_metric(
+        "qc_tasks_total", "counter", "Finished tasks by outcome.",
+        [({"outcome": "completed"}, completed_tasks), ({"outcome": "failed"}, failed_tasks)])
+    lines += render_metric(
+        "qc_circuits_total", "counter",
+        "Circuits by outcome and qubit-count bucket.", circuit_samples)
+    lines += render_metric(
+        "qc_tasks_active", "gauge", "Tasks currently executing.", [({}, max(active_tasks, 0))])
+    lines += render_metric(
+        "qc_queue_depth", "gauge", "Messages waiting in each broker queue.",
+        [({"queue": queue}, depth) for queue, depth in queue_depths.items()])
+    lines += render_metric(
+        "qc_tasks_reserved", "gauge",
+        "Messages delivered to workers but not yet acknowledged.", [({}, reserved_tasks)])
+    lines += render_metric(
+        "qc_routed_tasks_total", "counter", "Completed tasks per cost-routed queue.",
+        [({"queue": queue}, int(fields.get("tasks", 0))) for queue, fields in routed])
+    lines += render_metric(
+        "qc_routed_estimated_seconds_total", "counter",
+        "Runtime predicted by the cost estimator, per queue.",
+        [({"queue": queue}, fields.get("estimated_ms", 0.0) / 1000) for queue, fields in routed])
+    lines += render_metric(
+        "qc_routed_actual_seconds_total", "counter",
+        "Measured runtime of cost-routed tasks, per queue.",
+        [({"queue": queue}, fields.get("actual_ms", 0.0) / 1000) for queue, fields in routed])
+
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@router.get("/profiles/{task_id}")
+async def get_task_profile(task_id: str, redis=Depends(get_async_redis_client)):
+    """
+    Download the cProfile capture of a profiled task.
+    The file loads with `pstats.Stats(path)` or tools such as snakeviz.
+    """
+    logger.debug(f"Retrieving profile for task ID: {task_id}")
+    profile = await redis.get(f"profile:{task_id}")
+    if profile is None:
+        raise HTTPException(status_code=404, detail="Profile not found.")
+    return Response(
+        content=profile,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{task_id}.prof"'})
@@ -3,38 +3,126 @@ routes.py - FastAPI routes for quantum task submission and status retrieval.
 
 Exposes endpoints to:
 - Submit a quantum task with QASM3 input
-- Retrieve result by task ID
+- Submit a batch of quantum tasks in one request
+- Retrieve result by task ID or batch ID
+- Retrieve the status of many tasks in one request
+- Receive completion notifications via Server-Sent Events or WebSocket
 - Provide a healthcheck ping
 """
-from fastapi import APIRouter, HTTPException
-from app.core.models import TaskRequest, TaskResponse, TaskStatusResponse
+import asyncio
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Header, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from app.core.blob_store import blob_reference, blob_store, inline_status
+from app.core.config import SSE_KEEPALIVE_SECONDS
+from app.core.models import (
+    BatchStatusResponse,
+    BatchTaskRequest,
+    BatchTaskResponse,
+    TaskRequest,
+    TaskResponse,
+    TaskStatusRequest,
+    TaskStatusResponse,
+)
+from app.core.serialization import FastJSONResponse, dumps_json
 from app.interface.dispatcher import dispatcher
+from app.interface.task_events import RESYNC_EVENT, task_event_hub
 
 router = APIRouter()
 
 
 @router.post("/tasks", response_model=TaskResponse)
-async def create_task(payload: TaskRequest):
+async def create_task(payload: TaskRequest,
+                      idempotency_key: Optional[str] = Header(None, max_length=255)):
     """
     Submit a QASM3 quantum circuit for async execution.
+    Identical submissions made while one is pending, and retries carrying the
+    same Idempotency-Key header, return the existing task ID.
     Args:
-        request (TaskRequest): Contains the quantum circuit as a string in 'qc'.
+        request (TaskRequest): Contains the quantum circuit as a string in 'qc'
+            and optional execution options.
+        idempotency_key (Optional[str]): Idempotency-Key header chosen by the client.
     Returns:
         TaskResponse: Contains task ID and confirmation message.
     Raises:
-        HTTPException: If dispatcher validation fails.
+        HTTPException: If dispatcher validation fails, or the Idempotency-Key
+            was used for a different submission.
     """
     try:
-        task = await dispatcher.execute_circuit(payload.qc)
+        task = await dispatcher.execute_circuit(
+            payload.qc, idempotency_key=idempotency_key, **payload.execution_options())
     except ValueError as e:
         raise HTTPException(status_code=422, detail=str(e))
     return TaskResponse(task_id=task.id, message="Task submitted successfully.")
 
 
+@router.post("/tasks/batch", response_model=BatchTaskResponse)
+async def create_batch(payload: BatchTaskRequest):
+    """
+    Submit many QASM3 circuits for async execution as one batch.
+    Args:
+        request (BatchTaskRequest): Contains the quantum circuits in 'circuits'.
+    Returns:
+        BatchTaskResponse: Contains the batch ID and one task ID per circuit.
+    Raises:
+        HTTPException: If dispatcher validation fails for any circuit.
+    """
+    try:
+        batch_id, task_ids = await dispatcher.execute_batch(
+            payload.circuits, **payload.execution_options())
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return BatchTaskResponse(batch_id=batch_id, task_ids=task_ids,
+                             message="Batch submitted successfully.")
+
+
+@router.get("/tasks/batch/{batch_id}", response_model=BatchStatusResponse, response_model_exclude_none=True)
+async def get_batch(batch_id: str):
+    """
+    Retrieve the status of every task in a submitted batch.
+    Args:
+        batch_id (str): ID returned by the batch submission.
+    Returns:
+        BatchStatusResponse: Status and result/message per task ID.
+    """
+    tasks = await dispatcher.get_batch_result(batch_id)
+    if tasks is None:
+        raise HTTPException(status_code=404, detail="Batch not found.")
+
+    # Statuses already have the response shape: render them without re-validating every result
+    return FastJSONResponse({"batch_id": batch_id, "tasks": tasks})
+
+
+@router.post("/tasks/status", response_model=Dict[str, TaskStatusResponse])
+async def get_task_statuses(payload: TaskStatusRequest):
+    """
+    Retrieve the status of many tasks at once.
+    IDs are resolved in chunks with one pipelined backend read each, and the
+    JSON object is streamed back chunk by chunk rather than built in memory.
+    Args:
+        request (TaskStatusRequest): Contains the task IDs in 'task_ids'.
+    Returns:
+        StreamingResponse: JSON object mapping each task ID to a TaskStatusResponse.
+    """
+    task_ids = list(dict.fromkeys(payload.task_ids))
+
+    async def body():
+        separator = b""
+        yield b"{"
+        async for chunk in dispatcher.iter_task_results(task_ids):
+            yield separator + b",".join(
+                dumps_json(task_id) + b":" + dumps_json(status) for task_id, status in chunk)
+            separator = b","
+        yield b"}"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
 @router.get("/tasks/{task_id}", response_model=TaskStatusResponse, response_model_exclude_none=True)
 async def get_task(task_id: str):
     """
     Retrieve result or status of a submitted quantum task.
+    Large results are streamed from the blob store.
     Args:
         task_id (str): ID of the Celery task.
     Returns:
@@ -44,7 +132,143 @@ async def get_task(task_id: str):
     if result_data["status"] == "error":
         raise HTTPException(status_code=404, detail=result_data["message"])
 
-    return TaskStatusResponse(**result_data)
+    blob_key = blob_reference(result_data.get("result"))
+    if blob_key is not None:
+        try:
+            chunks = blob_store.iter_chunks(blob_key)
+        except KeyError:
+            raise HTTPException(status_code=404, detail="Task result has expired.")
+
+        def body():
+            # The blob is the result's JSON: wrap it without decoding it
+            yield b'{"status":"completed","result":'
+            yield from chunks
+            yield b"}"
+
+        return StreamingResponse(body(), media_type="application/json")
+
+    # A result can hold 2^n outcomes: render it without re-validating every key
+    return FastJSONResponse(result_data)
+
+
+@router.get("/tasks/{task_id}/events")
+async def stream_task_events(task_id: str):
+    """
+    Stream the status of a task as Server-Sent Events until it finishes.
+    Sends the current status first, then a single final event pushed by the
+    worker on completion; comment lines keep idle connections alive.
+    Args:
+        task_id (str): ID of the Celery task.
+    Returns:
+        StreamingResponse: A text/event-stream of TaskStatusResponse payloads.
+    """
+    queue = await task_event_hub.subscribe([task_id])
+
+    async def event_stream():
+        try:
+            status = await dispatcher.get_task_result(task_id)
+            if status["status"] == "pending":
+                yield _sse_message(status)
+            while status["status"] == "pending":
+                try:
+                    event = await asyncio.wait_for(queue.get(), SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event.get("type") == RESYNC_EVENT:
+                    status = await dispatcher.get_task_result(task_id)
+                else:
+                    status = _status_from_event(event)
+            yield _sse_message(inline_status(task_id, status))
+        finally:
+            task_event_hub.unsubscribe([task_id], queue)
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+
+@router.websocket("/tasks/ws")
+async def task_events_websocket(websocket: WebSocket):
+    """
+    Push completion notifications for many tasks over one WebSocket.
+    Clients send {"subscribe": [task_id, ...]} or {"unsubscribe": [...]}; the
+    server sends one {"task_id": ..., "status": ...} message per finished task.
+    Malformed commands are answered with {"error": ...} and the connection stays open.
+    """
+    await websocket.accept()
+    queue: asyncio.Queue = asyncio.Queue()
+    watched = set()
+
+    async def send_finished(task_ids):
+        statuses = await dispatcher.get_task_results(list(task_ids))
+        for task_id, status in statuses.items():
+            if status["status"] != "pending":
+                watched.discard(task_id)
+                task_event_hub.unsubscribe([task_id], queue)
+                await websocket.send_json({"task_id": task_id, **status})
+
+    async def receive_commands():
+        while True:
+            try:
+                command = await websocket.receive_json()
+                subscribe = _command_task_ids(command, "subscribe")
+                unsubscribe = _command_task_ids(command, "unsubscribe")
+            except (ValueError, AttributeError, TypeError) as e:
+                await websocket.send_json({"error": f"Invalid command: {str(e)}"})
+                continue
+            if unsubscribe:
+                watched.difference_update(unsubscribe)
+                task_event_hub.unsubscribe(unsubscribe, queue)
+            if subscribe:
+                # Subscribe before checking state, so no completion can slip in between
+                watched.update(subscribe)
+                await task_event_hub.subscribe(subscribe, queue)
+                await send_finished(subscribe)
+
+    receiver = asyncio.create_task(receive_commands())
+    try:
+        while True:
+            getter = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if receiver in done:
+                getter.cancel()
+                receiver.result()  # Re-raises the disconnect
+            event = getter.result()
+            if event.get("type") == RESYNC_EVENT:
+                await send_finished(watched)
+            elif event["task_id"] in watched:
+                watched.discard(event["task_id"])
+                task_event_hub.unsubscribe([event["task_id"]], queue)
+                await websocket.send_json(event)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        receiver.cancel()
+        task_event_hub.unsubscribe(watched, queue)
+
+
+def _command_task_ids(command, field: str) -> List[str]:
+    """
+    Reads the task IDs of a WebSocket command field.
+    Raises:
+        TypeError: If the command is not a JSON object or the field not a list.
+    """
+    if not isinstance(command, dict):
+        raise TypeError('expected a JSON object such as {"subscribe": [task_id, ...]}')
+    task_ids = command.get(field, [])
+    if not isinstance(task_ids, list):
+        raise TypeError(f"'{field}' must be a list of task IDs")
+    return [str(task_id) for task_id in task_ids]
+
+
+def _status_from_event(event: dict) -> dict:
+    """Strips the routing fields from a task event, leaving the status payload"""
+    return {key: value for key, value in event.items() if key not in ("task_id", "type")}
+
+
+def _sse_message(status: dict) -> str:
+    """Formats a task status as a Server-Sent Event named after the status"""
+    return f"event: {status['status']}\ndata: {dumps_json(status).decode()}\n\n"
 
 
 @router.get("/health/ping")
@@ -0,0 +1,191 @@
+"""
+blob_store.py - Storage for results too large to keep in Redis.
+
+A result whose JSON encoding exceeds RESULT_INLINE_MAX_BYTES is written to
+the blob store by the worker, and the task result in Redis becomes a small
+reference: {"$blob": key, "bytes": size}. The API streams the blob back to
+the client in chunks, so neither Redis nor the API holds the whole result.
+Blobs are purged once they are older than RESULT_TTL, when the Redis
+reference has expired as well.
+
+`BlobStore` is the extension point for other backends (e.g. object storage);
+`LocalFilesystemBlobStore` keeps blobs in a directory shared by the API and
+the workers (a Docker volume).
+"""
+import logging
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Iterator, Optional
+from app.core.config import (
+    BLOB_PURGE_INTERVAL_SECONDS,
+    BLOB_STORE_DIR,
+    RESULT_INLINE_MAX_BYTES,
+    RESULT_TTL,
+)
+from app.core.serialization import dumps_json
+
+logger = logging.getLogger("worker")
+
+BLOB_REFERENCE_KEY = "$blob"
+EXTERNAL_RESULT_MESSAGE = "Result is too large to include here; fetch it from GET /tasks/{task_id}."
+
+
+class BlobStore(ABC):
+    """
+    Interface of a store of immutable binary blobs addressed by key.
+    """
+
+    @abstractmethod
+    def put(self, key: str, data: bytes):
+        """Stores `data` under `key`, replacing any previous blob"""
+
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Yields the blob's bytes in chunks.
+        Raises:
+            KeyError: If no blob is stored under `key`.
+        """
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Removes a blob, if present"""
+
+
+class LocalFilesystemBlobStore(BlobStore):
+    """
+    Blob store backed by files in one directory.
+    """
+
+    def __init__(self, root: str, ttl: int = RESULT_TTL,
+                 purge_interval: int = BLOB_PURGE_INTERVAL_SECONDS):
+        self.root = root
+        self.ttl = ttl
+        self.purge_interval = purge_interval
+        self._last_purge = 0.0
+        self._lock = threading.Lock()
+
+    def put(self, key: str, data: bytes):
+        os.makedirs(self.root, exist_ok=True)
+        # Write to a temp file first so readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        # Readable by the API, which may run as another user
+        os.fchmod(fd, 0o644)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._maybe_purge()
+
+    def iter_chunks(self, key: str, chunk_size: int = 65536) -> Iterator[bytes]:
+        try:
+            f = open(self._path(key), "rb")
+        except FileNotFoundError:
+            raise KeyError(key)
+        return self._read(f, chunk_size)
+
+    def delete(self, key: str):
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def purge_expired(self) -> int:
+        """
+        Deletes blobs older than the result TTL.
+        Returns:
+            int: Number of blobs deleted.
+        """
+        cutoff = time.time() - self.ttl
+        purged = 0
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+                    purged += 1
+            except FileNotFoundError:
+                continue
+        return purged
+
+    @staticmethod
+    def _read(f, chunk_size: int) -> Iterator[bytes]:
+        with f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return
+                yield chunk
+
+    def _maybe_purge(self):
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_purge < self.purge_interval:
+                return
+            self._last_purge = now
+        try:
+            purged = self.purge_expired()
+            if purged:
+                logger.info(f"Purged {purged} expired result blob(s)")
+        except OSError as e:
+            logger.warning(f"Could not purge result blobs: {str(e)}")
+
+    def _path(self, key: str) -> str:
+        # Keys are task IDs; never let one escape the store directory
+        if not key or os.path.basename(key) != key or key.startswith("."):
+            raise ValueError(f"Invalid blob key: {key!r}")
+        return os.path.join(self.root, key)
+
+
+def offload_result(task_id: str, result: Any, max_inline_bytes: int = RESULT_INLINE_MAX_BYTES) -> Any:
+    """
+    Moves a large result to the blob store.
+    Args:
+        task_id (str): Task the result belongs to.
+        result (Any): The task result.
+        max_inline_bytes (int): Largest JSON size kept inline in Redis.
+    Returns:
+        Any: The result itself if small enough, otherwise a blob reference.
+    """
+    if not isinstance(result, dict):
+        return result
+    data = dumps_json(result)
+    if len(data) <= max_inline_bytes:
+        return result
+    key = f"{task_id}.json"
+    blob_store.put(key, data)
+    logger.info(f"Stored {len(data)}-byte result of task {task_id} in the blob store")
+    return {BLOB_REFERENCE_KEY: key, "bytes": len(data)}
+
+
+def blob_reference(result: Any) -> Optional[str]:
+    """
+    Returns the blob key if a result is a blob reference, else None.
+    """
+    if isinstance(result, dict) and BLOB_REFERENCE_KEY in result:
+        return result[BLOB_REFERENCE_KEY]
+    return None
+
+
+def inline_status(task_id: str, status: dict) -> dict:
+    """
+    Replaces a blob reference in a task status with a pointer to the
+    result endpoint, for responses and events that must stay small.
+    """
+    if blob_reference(status.get("result")) is None:
+        return status
+    return {"status": status["status"],
+            "message": EXTERNAL_RESULT_MESSAGE.format(task_id=task_id)}
+
+
+# Create the blob store shared by the API and the workers
+blob_store: BlobStore = LocalFilesystemBlobStore(BLOB_STORE_DIR)
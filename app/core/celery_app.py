@@ -1,6 +1,20 @@
 from celery import Celery
+from kombu import Queue
 import logging
-from app.core.config import BROKER_URL, RESULT_BACKEND
+from app.core.config import (
+    BROKER_URL,
+    CELERY_SERIALIZER,
+    QUEUE_LARGE,
+    QUEUE_MEDIUM,
+    QUEUE_SMALL,
+    RESULT_BACKEND,
+    RESULT_TTL,
+    WORKER_CONCURRENCY,
+    WORKER_MAX_TASKS_PER_CHILD,
+    WORKER_PREFETCH_MULTIPLIER,
+)
+from app.core.resources import available_cpus
+from app.core.serialization import SERIALIZER_NAME
 
 logger = logging.getLogger("api")
 
@@ -28,7 +42,21 @@ celery_app.conf.imports = [
 
 # Optional: Configure Celery
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # Compact msgpack (see serialization.py) by default; JSON stays accepted so
+    # messages queued by older producers are still consumed
+    task_serializer=CELERY_SERIALIZER,
+    accept_content=['json', SERIALIZER_NAME],
+    result_serializer=CELERY_SERIALIZER,
+    result_accept_content=['json', SERIALIZER_NAME],
+    # Results are dropped from Redis after RESULT_TTL; large ones live in the blob store
+    result_expires=RESULT_TTL,
+    # Prefork workers: one process per CPU the container may use, each taking
+    # one message at a time so long simulations don't hold queued work hostage
+    worker_concurrency=WORKER_CONCURRENCY or available_cpus(),
+    worker_prefetch_multiplier=WORKER_PREFETCH_MULTIPLIER,
+    # Recycled processes are forked from the preloaded main process (see startup.py)
+    worker_max_tasks_per_child=WORKER_MAX_TASKS_PER_CHILD or None,
+    # Size-tiered queues chosen by the dispatcher's cost estimate. A worker
+    # started without -Q consumes all of them; dedicated pools use -Q <tier>
+    task_queues=[Queue(name) for name in ('celery', QUEUE_SMALL, QUEUE_MEDIUM, QUEUE_LARGE)],
 )
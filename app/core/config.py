@@ -22,6 +22,10 @@ RESULT_BACKEND = os.getenv("RESULT_BACKEND", REDIS_URL)
 
 # Logging configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+# Fraction of successful (< 400) requests logged; errors are always logged
+LOG_SUCCESS_SAMPLE_RATE = float(os.getenv("LOG_SUCCESS_SAMPLE_RATE", "1.0"))
+# Longest rendering of a result payload written to the logs
+LOG_PAYLOAD_MAX_CHARS = int(os.getenv("LOG_PAYLOAD_MAX_CHARS", "1000"))
 
 # Environment
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
@@ -36,3 +40,117 @@ if REDIS_HOST == "localhost" and ENVIRONMENT == "production":
 # Application settings
 APP_NAME = "Quantum Circuits System"
 APP_VERSION = "1.0.0"
+
+# Circuit execution defaults
+DEFAULT_SHOTS = int(os.getenv("DEFAULT_SHOTS", "1024"))
+MAX_SHOTS = int(os.getenv("MAX_SHOTS", "1000000"))
+# Circuit executor: "aer" simulates circuits; "null" skips parsing and simulation
+# and returns a fixed result, to measure orchestration overhead (benchmarks only)
+CIRCUIT_EXECUTOR = os.getenv("CIRCUIT_EXECUTOR", "aer")
+# Parameter sets a parameterized circuit may be submitted with, run in one simulator call
+PARAMETER_BINDS_MAX = int(os.getenv("PARAMETER_BINDS_MAX", "10000"))
+# Memory a single circuit's simulation state may take on a worker; circuits
+# no exact simulation method can fit are rejected before running
+SIMULATION_MEMORY_BUDGET_MB = float(os.getenv("SIMULATION_MEMORY_BUDGET_MB", "1024"))
+
+# Broker and result backend encoding: "qc-msgpack" (msgpack, zlib-compressed
+# above SERIALIZER_COMPRESS_MIN_BYTES) or "json". JSON is always accepted
+CELERY_SERIALIZER = os.getenv("CELERY_SERIALIZER", "qc-msgpack")
+SERIALIZER_COMPRESS_MIN_BYTES = int(os.getenv("SERIALIZER_COMPRESS_MIN_BYTES", "4096"))
+SERIALIZER_COMPRESS_LEVEL = int(os.getenv("SERIALIZER_COMPRESS_LEVEL", "1"))
+
+# Result cache: per-process LRU tier backed by a shared Redis tier
+RESULT_CACHE_ENABLED = os.getenv(
+    "RESULT_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+RESULT_CACHE_LOCAL_SIZE = int(os.getenv("RESULT_CACHE_LOCAL_SIZE", "1024"))
+RESULT_CACHE_TTL = int(os.getenv("RESULT_CACHE_TTL", "86400"))  # 1 day
+RESULT_CACHE_MAX_ENTRIES = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "100000"))
+
+# Submission deduplication: identical circuits submitted while one is pending
+# share its task, and Idempotency-Key headers map retries to the first task.
+# In-flight claims are released by the worker; for lost workers they expire
+# after a grace period plus a multiple of the estimated runtime, at most INFLIGHT_TTL
+DEDUPLICATE_INFLIGHT = os.getenv(
+    "DEDUPLICATE_INFLIGHT", "true").lower() in ("1", "true", "yes")
+INFLIGHT_TTL = int(os.getenv("INFLIGHT_TTL", "3600"))  # 1 hour
+INFLIGHT_GRACE_SECONDS = float(os.getenv("INFLIGHT_GRACE_SECONDS", "120"))
+INFLIGHT_RUNTIME_FACTOR = float(os.getenv("INFLIGHT_RUNTIME_FACTOR", "10"))
+IDEMPOTENCY_TTL = int(os.getenv("IDEMPOTENCY_TTL", "86400"))  # 1 day
+
+# Batch submission
+BATCH_MAX_CIRCUITS = int(os.getenv("BATCH_MAX_CIRCUITS", "10000"))
+BATCH_CHUNK_SIZE = int(os.getenv("BATCH_CHUNK_SIZE", "100"))
+BATCH_TTL = int(os.getenv("BATCH_TTL", "86400"))  # 1 day
+
+# Result storage: results stay in the Redis backend for RESULT_TTL seconds.
+# Results larger than RESULT_INLINE_MAX_BYTES (as JSON) are written to the blob
+# store, which API and workers must share, and Redis keeps only a reference
+RESULT_TTL = int(os.getenv("RESULT_TTL", "86400"))  # 1 day
+RESULT_INLINE_MAX_BYTES = int(os.getenv("RESULT_INLINE_MAX_BYTES", "262144"))
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR", "data/results")
+BLOB_PURGE_INTERVAL_SECONDS = int(os.getenv("BLOB_PURGE_INTERVAL_SECONDS", "3600"))
+
+# Parsed circuit cache (worker): per-process LRU plus optional on-disk pickles,
+# the least recently used of which are deleted once they exceed the disk budget
+CIRCUIT_CACHE_SIZE = int(os.getenv("CIRCUIT_CACHE_SIZE", "256"))
+CIRCUIT_CACHE_DIR = os.getenv("CIRCUIT_CACHE_DIR", "")  # empty disables disk tier
+CIRCUIT_CACHE_DISK_MAX_MB = int(os.getenv("CIRCUIT_CACHE_DISK_MAX_MB", "512"))
+
+# Dispatcher: threads used for blocking broker calls from the API event loop
+DISPATCHER_MAX_WORKERS = int(os.getenv("DISPATCHER_MAX_WORKERS", "8"))
+
+# Task completion notifications (Redis pub/sub)
+TASK_EVENTS_CHANNEL = os.getenv("TASK_EVENTS_CHANNEL", "task-events")
+SSE_KEEPALIVE_SECONDS = float(os.getenv("SSE_KEEPALIVE_SECONDS", "15"))
+
+# Bulk status lookups: IDs resolved per MGET round trip, and per request
+STATUS_CHUNK_SIZE = int(os.getenv("STATUS_CHUNK_SIZE", "500"))
+STATUS_MAX_IDS = int(os.getenv("STATUS_MAX_IDS", "100000"))
+
+# Worker metrics: counters are buffered in-process and flushed every N task
+# events or M milliseconds, whichever comes first (1 flushes on every event)
+METRICS_FLUSH_EVERY = int(os.getenv("METRICS_FLUSH_EVERY", "1"))
+METRICS_FLUSH_INTERVAL_MS = int(os.getenv("METRICS_FLUSH_INTERVAL_MS", "1000"))
+
+# Worker profiling: cProfile a fraction of tasks (0 disables), and/or keep the
+# profile of every task slower than the threshold (0 disables; profiles all tasks)
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_LATENCY_THRESHOLD_MS = float(os.getenv("PROFILE_LATENCY_THRESHOLD_MS", "0"))
+PROFILE_TTL = int(os.getenv("PROFILE_TTL", "86400"))  # 1 day
+
+# Health: workers heartbeat into Redis, and each API process probes Redis and
+# reads the heartbeats in the background (interval randomized by +/- jitter)
+WORKER_HEARTBEAT_SECONDS = float(os.getenv("WORKER_HEARTBEAT_SECONDS", "5"))
+WORKER_HEARTBEAT_TIMEOUT_SECONDS = float(os.getenv("WORKER_HEARTBEAT_TIMEOUT_SECONDS", "15"))
+HEALTH_PROBE_INTERVAL_SECONDS = float(os.getenv("HEALTH_PROBE_INTERVAL_SECONDS", "10"))
+HEALTH_PROBE_JITTER = float(os.getenv("HEALTH_PROBE_JITTER", "0.2"))
+
+# Redis connection pools (per process) and connection retry policy; a command
+# finding every pooled connection in use waits up to REDIS_POOL_TIMEOUT for one
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "10"))
+REDIS_ASYNC_MAX_CONNECTIONS = int(os.getenv("REDIS_ASYNC_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT = float(os.getenv("REDIS_POOL_TIMEOUT", "5.0"))
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "5.0"))
+REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "5.0"))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+REDIS_RETRY_ATTEMPTS = int(os.getenv("REDIS_RETRY_ATTEMPTS", "5"))
+REDIS_RETRY_MAX_WAIT = float(os.getenv("REDIS_RETRY_MAX_WAIT", "2.0"))
+
+# Worker execution: processes per worker (0 = one per available CPU), and the
+# circuit width from which Aer threads go to the statevector, not experiments/shots
+WORKER_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "0"))
+WORKER_PREFETCH_MULTIPLIER = int(os.getenv("WORKER_PREFETCH_MULTIPLIER", "1"))
+# Worker startup: preload Qiskit in the main process so pool processes fork warm,
+# and recycle each pool process after N tasks (0 = never)
+WORKER_PRELOAD = os.getenv("WORKER_PRELOAD", "true").lower() in ("1", "true", "yes")
+WORKER_MAX_TASKS_PER_CHILD = int(os.getenv("WORKER_MAX_TASKS_PER_CHILD", "0"))
+AER_WIDE_CIRCUIT_QUBITS = int(os.getenv("AER_WIDE_CIRCUIT_QUBITS", "14"))
+
+# Cost-based routing: circuits go to the small, medium or large queue by
+# estimated runtime (ms) and statevector memory (MB); each queue has its own workers
+QUEUE_SMALL = os.getenv("QUEUE_SMALL", "small")
+QUEUE_MEDIUM = os.getenv("QUEUE_MEDIUM", "medium")
+QUEUE_LARGE = os.getenv("QUEUE_LARGE", "large")
+ROUTING_SMALL_MAX_MS = float(os.getenv("ROUTING_SMALL_MAX_MS", "50"))
+ROUTING_MEDIUM_MAX_MS = float(os.getenv("ROUTING_MEDIUM_MAX_MS", "2000"))
+ROUTING_MEDIUM_MAX_MEMORY_MB = float(os.getenv("ROUTING_MEDIUM_MAX_MEMORY_MB", "256"))
@@ -0,0 +1,112 @@
+"""
+fingerprint.py - Canonical fingerprints for QASM3 circuits.
+
+Two submissions that differ only in whitespace, comments or register names
+map to the same canonical form, so they can share cached results.
+"""
+import hashlib
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINE_COMMENT = re.compile(r"//[^\n]*")
+_TOKEN = re.compile(
+    r'"[^"]*"'                                   # string literals (includes)
+    r"|[A-Za-z_][A-Za-z0-9_]*"                   # identifiers and keywords
+    r"|\d+\.?\d*(?:[eE][+-]?\d+)?"               # numbers
+    r"|\.\d+(?:[eE][+-]?\d+)?"
+    r"|->|==|!=|<=|>=|\S"                        # operators and punctuation
+)
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+# Declaration keywords and the canonical prefix used for the registers they declare.
+# The prefixes contain a character that can never appear in a QASM identifier,
+# so renamed registers cannot collide with user-defined names.
+_REGISTER_KEYWORDS = {
+    "qubit": "%q",
+    "qreg": "%q",
+    "bit": "%c",
+    "creg": "%c",
+}
+# Marginalization keywords, as in app.workers.postprocessing. A string option
+# is a keyword even if the circuit has a register of that name.
+_MARGINALIZATION_KEYWORDS = ("last", "none")
+
+
+def _canonical_tokens(qasm_str: str) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Tokenizes a QASM string with comments stripped and registers renamed.
+    Returns:
+        tuple: Canonical token list and the register rename map.
+    """
+    text = _LINE_COMMENT.sub(" ", _BLOCK_COMMENT.sub(" ", qasm_str))
+    tokens = _TOKEN.findall(text)
+
+    renames: Dict[str, str] = {}
+    counters = {prefix: 0 for prefix in set(_REGISTER_KEYWORDS.values())}
+    for i, token in enumerate(tokens):
+        prefix = _REGISTER_KEYWORDS.get(token)
+        if prefix is None:
+            continue
+        # Skip an optional size designator: qubit[2] q; / bit[3] c;
+        j = i + 1
+        if j < len(tokens) and tokens[j] == "[":
+            while j < len(tokens) and tokens[j] != "]":
+                j += 1
+            j += 1
+        if j < len(tokens) and _IDENTIFIER.fullmatch(tokens[j]) and tokens[j] not in renames:
+            renames[tokens[j]] = f"{prefix}{counters[prefix]}"
+            counters[prefix] += 1
+
+    return [renames.get(token, token) for token in tokens], renames
+
+
+def canonicalize_qasm(qasm_str: str) -> str:
+    """
+    Returns a canonical form of a QASM string that ignores whitespace,
+    comments and register naming.
+    """
+    tokens, _ = _canonical_tokens(qasm_str)
+    return " ".join(tokens)
+
+
+def _tagged_marginalization(marginalize, renames: Dict[str, str]) -> dict:
+    """
+    Tags a marginalization option with its kind, so a keyword never hashes
+    like a register of the same name. Register names are renamed like the
+    registers themselves.
+    """
+    if isinstance(marginalize, str):
+        if marginalize in _MARGINALIZATION_KEYWORDS:
+            return {"keyword": marginalize}
+        return {"register": renames.get(marginalize, marginalize)}
+    return {"bits": marginalize}
+
+
+def circuit_fingerprint(qasm_str: str, shots: int, seed: Optional[int] = None, **options) -> str:
+    """
+    Computes a content-addressed fingerprint for a circuit execution.
+    Args:
+        qasm_str (str): Quantum circuit as a QASM3 string.
+        shots (int): Number of shots the circuit is executed with.
+        seed (Optional[int]): Simulator seed, if any.
+        **options: Any further execution options that affect the result.
+            A `marginalize` value is tagged as a keyword, register or bit list.
+    Returns:
+        str: Hex SHA-256 digest identifying the execution.
+    """
+    tokens, renames = _canonical_tokens(qasm_str)
+    if "marginalize" in options:
+        options = {**options, "marginalize": _tagged_marginalization(options["marginalize"], renames)}
+    payload = json.dumps(
+        {
+            "qc": " ".join(tokens),
+            "shots": shots,
+            "seed": seed,
+            "options": options,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -1,6 +1,11 @@
 import os
+import atexit
+import queue
 import logging.config
+import logging.handlers
 from pathlib import Path
+from typing import Iterator, List
+from app.core.config import LOG_PAYLOAD_MAX_CHARS
 
 # Create logs directory if it doesn't exist
 LOGS_DIR = Path("logs")
@@ -9,6 +14,11 @@ LOGS_DIR.mkdir(exist_ok=True)
 # Get log level from environment or use INFO as default
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 
+# Loggers whose handlers are moved behind a queue, "" being the root logger
+QUEUED_LOGGERS = ("", "api", "worker", "redis", "uvicorn", "celery")
+
+_listeners: List[logging.handlers.QueueListener] = []
+
 
 def setup_logging():
     """Configure logging for the application"""
@@ -92,6 +102,99 @@ def setup_logging():
 
     # Apply configuration
     logging.config.dictConfig(logging_config)
+    _enable_queue_logging()
 
     # Log startup message
     logging.getLogger("api").info("Logging configured successfully")
+
+
+def _enable_queue_logging():
+    """
+    Moves the configured handlers behind QueueHandlers, so formatting and
+    file writes happen on listener threads instead of the calling thread
+    (the API event loop, in particular).
+    """
+    stop_queue_logging()
+    for name in QUEUED_LOGGERS:
+        logger = logging.getLogger(name)
+        handlers = [handler for handler in logger.handlers
+                    if not isinstance(handler, logging.handlers.QueueHandler)]
+        if not handlers:
+            continue
+        log_queue = queue.SimpleQueue()
+        logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        _listeners.append(listener)
+
+
+def stop_queue_logging():
+    """Flushes queued log records and stops the listener threads"""
+    while _listeners:
+        _listeners.pop().stop()
+
+
+def _restart_listeners_after_fork():
+    # Listener threads do not survive fork: start new ones on the same queues
+    listeners = list(_listeners)
+    _listeners.clear()
+    for listener in listeners:
+        restarted = logging.handlers.QueueListener(
+            listener.queue, *listener.handlers, respect_handler_level=True)
+        restarted.start()
+        _listeners.append(restarted)
+
+
+atexit.register(stop_queue_logging)
+os.register_at_fork(after_in_child=_restart_listeners_after_fork)
+
+
+def _repr_pieces(value) -> Iterator[str]:
+    """
+    Yields the repr of a value piece by piece, descending into dicts, lists
+    and tuples, so a caller can stop rendering a large payload early.
+    """
+    if isinstance(value, dict):
+        yield "{"
+        for i, (key, item) in enumerate(value.items()):
+            yield f"{', ' if i else ''}{key!r}: "
+            yield from _repr_pieces(item)
+        yield "}"
+    elif isinstance(value, (list, tuple)):
+        yield "[" if isinstance(value, list) else "("
+        for i, item in enumerate(value):
+            if i:
+                yield ", "
+            yield from _repr_pieces(item)
+        yield "]" if isinstance(value, list) else ("," * (len(value) == 1) + ")")
+    else:
+        yield repr(value)
+
+
+class CappedRepr:
+    """
+    Log argument that renders a payload truncated to `max_chars`.
+    Rendering happens only if the record is emitted, e.g.
+    `logger.debug("Raw execution result: %s", CappedRepr(raw_counts))`,
+    and stops once `max_chars` are reached, so the cost does not grow
+    with the size of the payload.
+    """
+
+    def __init__(self, value, max_chars: int = LOG_PAYLOAD_MAX_CHARS):
+        self.value = value
+        self.max_chars = max_chars
+
+    def __str__(self) -> str:
+        if isinstance(self.value, str):
+            pieces = iter([self.value])
+        else:
+            pieces = _repr_pieces(self.value)
+        text, length = [], 0
+        for piece in pieces:
+            text.append(piece)
+            length += len(piece)
+            if length > self.max_chars:
+                size = f" ({len(self.value)} entries)" if hasattr(self.value, "__len__") else ""
+                return f"{''.join(text)[:self.max_chars]}... [truncated{size}]"
+        return "".join(text)
@@ -0,0 +1,123 @@
+"""
+metrics_buffer.py - Client-side aggregation of metric counters.
+
+Counter increments are summed in-process and written to Redis in a single
+pipeline, either inside a worker task event's own pipeline (so they cost
+no extra round trip) or from a background timer. The API only uses the
+timer path, so recording a metric never blocks the event loop.
+"""
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, Mapping, Optional, Tuple, Union
+from app.core.config import METRICS_FLUSH_EVERY, METRICS_FLUSH_INTERVAL_MS
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger("worker")
+
+Number = Union[int, float]
+# A plain key is a Redis counter, a (key, field) pair a counter in a hash
+CounterKey = Union[str, Tuple[str, str]]
+
+
+class MetricsBuffer:
+    """
+    Aggregates counter increments and flushes them every `flush_every`
+    events or `flush_interval_ms` milliseconds, whichever comes first.
+    """
+
+    def __init__(self, flush_every: int = METRICS_FLUSH_EVERY,
+                 flush_interval_ms: int = METRICS_FLUSH_INTERVAL_MS):
+        self.flush_every = max(flush_every, 1)
+        self.flush_interval = flush_interval_ms / 1000
+        self._pending: Dict[CounterKey, Number] = defaultdict(int)
+        self._events = 0
+        self._last_flush = time.monotonic()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def add(self, pipe, counters: Optional[Mapping[CounterKey, Number]] = None, **named: Number):
+        """
+        Records one event's counter increments.
+        When a flush is due, every pending increment is queued on `pipe`,
+        so it reaches Redis with the caller's own commands.
+        Args:
+            pipe: Redis pipeline the caller is about to execute.
+            counters (Optional[Mapping]): Increment per counter key.
+            **named: Increment per plain Redis key; floats use INCRBYFLOAT.
+        """
+        with self._lock:
+            self._merge(counters, named)
+            self._events += 1
+            if self._events >= self.flush_every or \
+                    time.monotonic() - self._last_flush >= self.flush_interval:
+                self._drain(pipe)
+            else:
+                self._schedule()
+
+    def record(self, counters: Optional[Mapping[CounterKey, Number]] = None, **named: Number):
+        """
+        Records increments without a Redis call; they are written with the
+        next event flush or by the background timer.
+        Args:
+            counters (Optional[Mapping]): Increment per counter key.
+            **named: Increment per plain Redis key.
+        """
+        with self._lock:
+            self._merge(counters, named)
+            self._schedule()
+
+    def flush(self):
+        """Writes every pending increment to Redis in one pipeline"""
+        try:
+            pipe = get_redis_client().pipeline(transaction=True)
+            with self._lock:
+                self._drain(pipe)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Could not flush task metrics: {str(e)}")
+
+    def _merge(self, counters, named):
+        for source in (counters or {}, named):
+            for key, amount in source.items():
+                self._pending[key] += amount
+
+    def _schedule(self):
+        # Make sure an idle process still publishes what it holds
+        if self._timer is None and self._pending:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _drain(self, pipe):
+        for key, amount in self._pending.items():
+            if isinstance(key, tuple):
+                if isinstance(amount, float):
+                    pipe.hincrbyfloat(*key, amount)
+                elif amount:
+                    pipe.hincrby(*key, amount)
+            elif isinstance(amount, float):
+                pipe.incrbyfloat(key, amount)
+            elif amount:
+                pipe.incrby(key, amount)
+        self._pending.clear()
+        self._events = 0
+        self._last_flush = time.monotonic()
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _reset_after_fork(self):
+        # The parent flushes its own increments, and its timer thread is gone
+        self._pending.clear()
+        self._events = 0
+        self._last_flush = time.monotonic()
+        self._timer = None
+        self._lock = threading.Lock()
+
+
+# Create a singleton buffer for the current process
+metrics_buffer = MetricsBuffer()
+os.register_at_fork(after_in_child=metrics_buffer._reset_after_fork)
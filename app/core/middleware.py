@@ -1,58 +1,83 @@
 import time
-import logging
 import json
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+import logging
+import random
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import LOG_SUCCESS_SAMPLE_RATE
+from app.core.telemetry import observe
 
 logger = logging.getLogger("api")
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        """
-        Middleware that logs incoming requests and outgoing responses
-        with timing information and request details
-        """
-        start_time = time.time()
-        request_id = str(request.headers.get("X-Request-Id", ""))
+class LoggingMiddleware:
+    """
+    Pure ASGI middleware that logs HTTP requests with timing information
+    and request details.
+    Unlike BaseHTTPMiddleware it wraps the app directly, without an extra
+    task and response stream per request. Errors are always logged, while
+    successful requests are logged for a LOG_SUCCESS_SAMPLE_RATE fraction.
+    """
 
-        # Create log context with basic request info
-        log_context = {
-            "request_id": request_id,
-            "method": request.method,
-            "path": request.url.path,
-            "client_ip": request.client.host if request.client else None,
-        }
+    def __init__(self, app: ASGIApp, success_sample_rate: float = LOG_SUCCESS_SAMPLE_RATE):
+        self.app = app
+        self.success_sample_rate = success_sample_rate
 
-        # Log the start of request processing
-        logger.info(f"Request started: {json.dumps(log_context)}")
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        # Handling time: until the response starts, so streamed bodies don't count
+        process_time = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, process_time
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+            await send(message)
 
-        # Process the request and catch any exceptions
         try:
-            response = await call_next(request)
-            status_code = response.status_code
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            # Log any unhandled exceptions
+            # Log any unhandled exceptions, then let the server produce the error response
             logger.exception(f"Unhandled exception: {str(e)}")
-            # Re-raise to let FastAPI handle the error response
             raise
         finally:
-            # Calculate processing time
-            process_time = time.time() - start_time
+            if process_time is None:
+                process_time = time.perf_counter() - start_time
+            observe("http", process_time)
+            self._log(scope, status_code, process_time)
 
-        # Add response info to context
-        log_context.update({
+    def _log(self, scope: Scope, status_code: int, process_time: float):
+        if status_code >= 500:
+            level = logging.ERROR
+        elif status_code >= 400:
+            level = logging.WARNING
+        elif random.random() < self.success_sample_rate:
+            level = logging.INFO
+        else:
+            return
+        if not logger.isEnabledFor(level):
+            return
+
+        headers = dict(scope.get("headers") or ())
+        client = scope.get("client")
+        log_context = {
+            "request_id": headers.get(b"x-request-id", b"").decode("latin-1"),
+            "method": scope["method"],
+            "path": scope["path"],
+            "client_ip": client[0] if client else None,
             "status_code": status_code,
             "processing_time_ms": round(process_time * 1000, 2)
-        })
+        }
 
         # Log completion with appropriate level based on status code
-        if status_code >= 500:
+        if level == logging.ERROR:
             logger.error(f"Request failed: {json.dumps(log_context)}")
-        elif status_code >= 400:
+        elif level == logging.WARNING:
             logger.warning(f"Request error: {json.dumps(log_context)}")
         else:
             logger.info(f"Request completed: {json.dumps(log_context)}")
-
-        return response
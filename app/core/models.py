@@ -1,12 +1,53 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, NonNegativeInt
+from typing import Optional, Dict, Any, List, Literal, Union
+from app.core.config import (
+    BATCH_MAX_CIRCUITS,
+    DEFAULT_SHOTS,
+    MAX_SHOTS,
+    PARAMETER_BINDS_MAX,
+    STATUS_MAX_IDS,
+)
 
 
-class TaskRequest(BaseModel):
+class ExecutionOptions(BaseModel):
+    """
+    Data model representing options that control how a circuit is executed
+    """
+    marginalize: Union[List[NonNegativeInt], str] = Field(
+        "last",
+        description="Classical bits to keep in the result: 'last' (default), "
+                    "'none', a classical register name, or a list of bit indices")
+    shots: int = Field(DEFAULT_SHOTS, ge=1, le=MAX_SHOTS,
+                       description="Number of times the circuit is sampled")
+    seed: Optional[NonNegativeInt] = Field(
+        None, description="Simulator seed, for reproducible counts")
+    method: Literal["auto", "statevector", "stabilizer", "matrix_product_state"] = Field(
+        "auto",
+        description="Simulation method; 'auto' picks the cheapest exact method "
+                    "that fits the worker's memory budget")
+
+    def execution_options(self) -> Dict[str, Any]:
+        """
+        Returns the options as keyword arguments for the dispatcher and worker
+        """
+        return self.model_dump(include=set(ExecutionOptions.model_fields))
+
+
+class TaskRequest(ExecutionOptions):
     """
     Data model representing a quantum circuit task request
     """
     qc: str = Field(..., description="Quantum circuit string in QASM format")
+    parameter_binds: Optional[List[Dict[str, float]]] = Field(
+        None, min_length=1, max_length=PARAMETER_BINDS_MAX,
+        description="Values of the circuit's 'input float' parameters, one mapping "
+                    "per run; the result then holds the counts of each run in order")
+
+    def execution_options(self) -> Dict[str, Any]:
+        options = super().execution_options()
+        if self.parameter_binds is not None:
+            options["parameter_binds"] = self.parameter_binds
+        return options
 
 
 class TaskResponse(BaseModel):
@@ -24,3 +65,36 @@ class TaskStatusResponse(BaseModel):
     status: str
     message: Optional[str] = None
     result: Optional[Dict[str, Any]] = None
+
+
+class BatchTaskRequest(ExecutionOptions):
+    """
+    Data model representing a batch of quantum circuit task requests
+    """
+    circuits: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_CIRCUITS,
+                                description="Quantum circuit strings in QASM format")
+
+
+class BatchTaskResponse(BaseModel):
+    """
+    Data model representing a batch submission response
+    """
+    batch_id: str
+    task_ids: List[str]
+    message: str
+
+
+class BatchStatusResponse(BaseModel):
+    """
+    Data model representing the status of every task in a batch
+    """
+    batch_id: str
+    tasks: Dict[str, TaskStatusResponse]
+
+
+class TaskStatusRequest(BaseModel):
+    """
+    Data model representing a bulk task status lookup
+    """
+    task_ids: List[str] = Field(..., min_length=1, max_length=STATUS_MAX_IDS,
+                                description="IDs of the tasks to look up")
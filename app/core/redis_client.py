@@ -1,40 +1,184 @@
+"""
+redis_client.py - Redis access layer.
+
+- Sync clients (workers, dispatcher threads): one pooled client per URL and
+  process. Pools are dropped in forked children (Celery prefork), so a child
+  never shares its parent's sockets.
+- Asyncio clients (API): opened and closed by the application lifespan and
+  handed to async handlers, so the event loop never blocks on Redis.
+Pool sizes and timeouts come from app/core/config.py. Pools block: once
+every connection is in use, a command waits for a free one rather than
+failing with "Too many connections". The first connection
+is retried with exponential backoff; on failure the pooled client is still
+returned and reconnects on its next command.
+"""
+import os
+import threading
 import redis
+import redis.asyncio
 import logging
-from functools import lru_cache
-from app.core.config import REDIS_URL
+from typing import Dict
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+from app.core.config import (
+    BROKER_URL,
+    REDIS_ASYNC_MAX_CONNECTIONS,
+    REDIS_CONNECT_TIMEOUT,
+    REDIS_HEALTH_CHECK_INTERVAL,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_POOL_TIMEOUT,
+    REDIS_RETRY_ATTEMPTS,
+    REDIS_RETRY_MAX_WAIT,
+    REDIS_SOCKET_TIMEOUT,
+    REDIS_URL,
+    RESULT_BACKEND,
+)
 
 logger = logging.getLogger("redis")
 
+_sync_clients: Dict[str, redis.Redis] = {}
+_sync_lock = threading.Lock()
+_async_clients: Dict[str, redis.asyncio.Redis] = {}
+
+
+def _retry_policy() -> dict:
+    """Tenacity settings shared by the sync and async connection retries"""
+    return dict(
+        retry=retry_if_exception_type(
+            (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)),
+        wait=wait_exponential(multiplier=0.1, max=REDIS_RETRY_MAX_WAIT),
+        stop=stop_after_attempt(REDIS_RETRY_ATTEMPTS),
+        reraise=True,
+    )
+
+
+def _client_options(max_connections: int) -> dict:
+    return dict(
+        max_connections=max_connections,
+        timeout=REDIS_POOL_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+    )
+
+
+def _sync_client(url: str) -> redis.Redis:
+    client = _sync_clients.get(url)
+    if client is not None:
+        return client
+    with _sync_lock:
+        client = _sync_clients.get(url)
+        if client is None:
+            logger.info(f"Initializing Redis client with URL: {url}")
+            pool = redis.BlockingConnectionPool.from_url(
+                url, **_client_options(REDIS_MAX_CONNECTIONS))
+            client = redis.Redis(connection_pool=pool)
+            try:
+                for attempt in Retrying(**_retry_policy()):
+                    with attempt:
+                        client.ping()
+                logger.info("Redis connection successful")
+            except redis.exceptions.RedisError as e:
+                # Keep the pooled client: it reconnects on its next command
+                logger.error(f"Redis connection error: {str(e)}")
+            _sync_clients[url] = client
+    return client
+
+
+def get_redis_client() -> redis.Redis:
+    """
+    Returns the pooled sync Redis client of the current process.
+    """
+    return _sync_client(REDIS_URL)
+
 
-@lru_cache()
-def get_redis_client():
+def get_broker_redis_client() -> redis.Redis:
     """
-    Returns a Redis client instance
-    Uses connection pooling and caches the client
+    Returns a sync Redis client for the Celery broker database.
+    Shares the general client when the broker lives on the same Redis.
     """
-    logger.info(f"Initializing Redis client with URL: {REDIS_URL}")
+    return _sync_client(BROKER_URL)
 
-    try:
-        # Create a connection pool
-        pool = redis.ConnectionPool.from_url(
-            url=REDIS_URL,
-            max_connections=10,
-            socket_timeout=5.0,
-            socket_connect_timeout=5.0
-        )
 
-        # Create client from pool
-        client = redis.Redis(connection_pool=pool)
+def _reset_after_fork():
+    # The parent's pools hold the parent's sockets: forget them without closing
+    global _sync_lock
+    _sync_clients.clear()
+    _async_clients.clear()
+    _sync_lock = threading.Lock()
 
-        # Test connection
-        client.ping()
-        logger.info("Redis connection successful")
 
-        return client
-    except redis.exceptions.ConnectionError as e:
-        logger.error(f"Redis connection error: {str(e)}")
-        # Return client anyway, let the application handle connection issues
-        return redis.Redis.from_url(REDIS_URL)
-    except Exception as e:
-        logger.exception(f"Unexpected Redis error: {str(e)}")
-        raise
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def create_async_redis_client(url: str = REDIS_URL,
+                              max_connections: int = REDIS_ASYNC_MAX_CONNECTIONS) -> redis.asyncio.Redis:
+    """
+    Returns a new asyncio Redis client for use on the API event loop.
+    The caller owns the client and must close it with `aclose()`.
+    """
+    logger.info(f"Initializing async Redis client with URL: {url}")
+    pool = redis.asyncio.BlockingConnectionPool.from_url(url, **_client_options(max_connections))
+    return redis.asyncio.Redis.from_pool(pool)
+
+
+def _async_client(url: str) -> redis.asyncio.Redis:
+    client = _async_clients.get(url)
+    if client is None:
+        client = _async_clients[url] = create_async_redis_client(url)
+    return client
+
+
+def get_async_redis_client() -> redis.asyncio.Redis:
+    """
+    Returns the shared asyncio Redis client of the API process.
+    Usable as a FastAPI dependency.
+    """
+    return _async_client(REDIS_URL)
+
+
+def get_async_broker_client() -> redis.asyncio.Redis:
+    """
+    Returns the shared asyncio client for the Celery broker database.
+    """
+    return _async_client(BROKER_URL)
+
+
+def get_async_backend_client() -> redis.asyncio.Redis:
+    """
+    Returns the shared asyncio client for the Celery result backend.
+    """
+    return _async_client(RESULT_BACKEND)
+
+
+async def open_async_redis(*urls: str):
+    """
+    Creates the shared asyncio clients and connects them, retrying with backoff.
+    Called from the application lifespan.
+    Args:
+        *urls (str): Redis URLs to connect, the general Redis URL by default.
+    """
+    for url in urls or (REDIS_URL,):
+        client = _async_client(url)
+        try:
+            async for attempt in AsyncRetrying(**_retry_policy()):
+                with attempt:
+                    await client.ping()
+            logger.info(f"Async Redis connection successful: {url}")
+        except redis.exceptions.RedisError as e:
+            logger.error(f"Async Redis connection error: {str(e)}")
+
+
+async def close_async_redis():
+    """
+    Closes every shared asyncio client. Called from the application lifespan.
+    """
+    clients = list(_async_clients.values())
+    _async_clients.clear()
+    for client in clients:
+        await client.aclose()
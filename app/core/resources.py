@@ -0,0 +1,50 @@
+"""
+resources.py - CPU budget of the current container or host.
+
+`os.cpu_count()` reports the host's cores even when a container is limited
+to a fraction of them. The budget here also honours the process's CPU
+affinity and the cgroup CPU quota (v2 `cpu.max`, or v1 CFS quota/period).
+"""
+import math
+import os
+from functools import lru_cache
+from typing import Optional
+
+
+def _cgroup_cpu_limit() -> Optional[float]:
+    """Returns the cgroup CPU quota in cores, or None if unlimited"""
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return int(quota) / int(period)
+        return None
+    except (OSError, ValueError):
+        pass
+    try:
+        # cgroup v1: quota of -1 means unlimited
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_quota_us") as f:
+            quota = int(f.read())
+        with open("/sys/fs/cgroup/cpu/cpu.cfs_period_us") as f:
+            period = int(f.read())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+@lru_cache()
+def available_cpus() -> int:
+    """
+    Returns the number of CPUs this process may actually use (at least 1).
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(cpus, 1)
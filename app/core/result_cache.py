@@ -0,0 +1,212 @@
+"""
+result_cache.py - Content-addressed cache of completed circuit results.
+
+Results are keyed by the circuit fingerprint (see fingerprint.py) and stored
+in two tiers:
+- An in-process LRU, so repeated lookups in the same API/worker process are free
+- A shared Redis tier with a TTL and a bounded number of entries
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from app.core.config import (
+    RESULT_CACHE_ENABLED,
+    RESULT_CACHE_LOCAL_SIZE,
+    RESULT_CACHE_MAX_ENTRIES,
+    RESULT_CACHE_TTL,
+    RESULT_INLINE_MAX_BYTES,
+)
+from app.core.metrics_buffer import metrics_buffer
+from app.core.redis_client import get_redis_client
+from app.core.serialization import dumps_json, loads_json
+
+logger = logging.getLogger("redis")
+
+CACHE_KEY_PREFIX = "cache:result:"
+CACHE_INDEX_KEY = "cache:result:index"
+CACHE_STATS_PREFIX = "stats:cache:"
+
+
+def cacheable(seed: Optional[int]) -> bool:
+    """
+    Tells whether results of a run may be shared with later submissions.
+    An unseeded run is a fresh sample, so only runs with an explicit seed
+    are cached; their results are reproducible anyway.
+    """
+    return seed is not None
+
+
+class ResultCache:
+    """
+    Two-tier (local LRU + Redis) cache of circuit results.
+    """
+
+    def __init__(self, local_size: int, ttl: int, max_entries: int, enabled: bool = True):
+        self.local_size = local_size
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._local: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: str) -> Optional[dict]:
+        """
+        Looks up a result, first locally and then in Redis.
+        Args:
+            fingerprint (str): Circuit fingerprint.
+        Returns:
+            Optional[dict]: The cached result, or None on a miss.
+        """
+        if not self.enabled:
+            return None
+
+        result = self._get_local(fingerprint)
+        if result is not None:
+            self._record(local_hits=1)
+            return result
+
+        try:
+            redis = get_redis_client()
+            payload = redis.get(CACHE_KEY_PREFIX + fingerprint)
+        except Exception as e:
+            logger.warning(f"Could not read result cache: {str(e)}")
+            payload = None
+
+        if payload is None:
+            self._record(misses=1)
+            return None
+
+        result = loads_json(payload)
+        self._set_local(fingerprint, result)
+        self._record(redis_hits=1)
+        return result
+
+    def get_many(self, fingerprints: List[str]) -> List[Optional[dict]]:
+        """
+        Looks up several results with a single Redis round trip.
+        Args:
+            fingerprints (List[str]): Circuit fingerprints.
+        Returns:
+            List[Optional[dict]]: Cached results, None for each miss.
+        """
+        if not self.enabled:
+            return [None] * len(fingerprints)
+
+        results = [self._get_local(fp) for fp in fingerprints]
+        remote = [i for i, result in enumerate(results) if result is None]
+        local_hits = len(fingerprints) - len(remote)
+
+        payloads = []
+        if remote:
+            try:
+                redis = get_redis_client()
+                payloads = redis.mget(
+                    [CACHE_KEY_PREFIX + fingerprints[i] for i in remote])
+            except Exception as e:
+                logger.warning(f"Could not read result cache: {str(e)}")
+                payloads = [None] * len(remote)
+
+        redis_hits = 0
+        for i, payload in zip(remote, payloads):
+            if payload is not None:
+                results[i] = loads_json(payload)
+                self._set_local(fingerprints[i], results[i])
+                redis_hits += 1
+
+        self._record(local_hits=local_hits, redis_hits=redis_hits,
+                     misses=len(remote) - redis_hits)
+        return results
+
+    def set(self, fingerprint: str, result: dict):
+        """
+        Stores a result in both tiers and evicts the oldest Redis entries
+        once the configured size bound is exceeded.
+        Args:
+            fingerprint (str): Circuit fingerprint.
+            result (dict): Completed (non-error) circuit result.
+        """
+        self.set_many({fingerprint: result})
+
+    def set_many(self, results: Dict[str, dict]):
+        """
+        Stores several results with a single Redis pipeline.
+        Results too large to keep in Redis (see blob_store.py) are not cached.
+        Args:
+            results (Dict[str, dict]): Completed results keyed by fingerprint.
+        """
+        if not self.enabled or not results:
+            return
+
+        payloads = {fingerprint: dumps_json(result) for fingerprint, result in results.items()}
+        results = {fingerprint: result for fingerprint, result in results.items()
+                   if len(payloads[fingerprint]) <= RESULT_INLINE_MAX_BYTES}
+        if not results:
+            return
+
+        for fingerprint, result in results.items():
+            self._set_local(fingerprint, result)
+        try:
+            redis = get_redis_client()
+            now = time.time()
+            pipe = redis.pipeline()
+            for fingerprint in results:
+                pipe.set(CACHE_KEY_PREFIX + fingerprint, payloads[fingerprint], ex=self.ttl)
+            pipe.zadd(CACHE_INDEX_KEY, {fp: now for fp in results})
+            # Drop index entries whose keys have already expired
+            pipe.zremrangebyscore(CACHE_INDEX_KEY, "-inf", now - self.ttl)
+            pipe.zcard(CACHE_INDEX_KEY)
+            size = pipe.execute()[-1]
+
+            if size > self.max_entries:
+                evicted = redis.zpopmin(
+                    CACHE_INDEX_KEY, size - self.max_entries)
+                if evicted:
+                    redis.delete(*(CACHE_KEY_PREFIX + _decode(member)
+                                 for member, _ in evicted))
+        except Exception as e:
+            logger.warning(f"Could not write result cache: {str(e)}")
+
+    def clear_local(self):
+        """Drops every entry from the in-process tier"""
+        with self._lock:
+            self._local.clear()
+
+    def _get_local(self, fingerprint: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._local.get(fingerprint)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at < time.monotonic():
+                del self._local[fingerprint]
+                return None
+            self._local.move_to_end(fingerprint)
+            return result
+
+    def _set_local(self, fingerprint: str, result: dict):
+        with self._lock:
+            self._local[fingerprint] = (time.monotonic() + self.ttl, result)
+            self._local.move_to_end(fingerprint)
+            while len(self._local) > self.local_size:
+                self._local.popitem(last=False)
+
+    def _record(self, **counters: int):
+        # Buffered: written with the next metrics flush, not a round trip per lookup
+        counters = {CACHE_STATS_PREFIX + name: n for name, n in counters.items() if n}
+        if counters:
+            metrics_buffer.record(counters)
+
+
+def _decode(value) -> str:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# Create a singleton cache instance shared by the dispatcher and the worker
+result_cache = ResultCache(
+    local_size=RESULT_CACHE_LOCAL_SIZE,
+    ttl=RESULT_CACHE_TTL,
+    max_entries=RESULT_CACHE_MAX_ENTRIES,
+    enabled=RESULT_CACHE_ENABLED,
+)
@@ -0,0 +1,94 @@
+"""
+serialization.py - Compact encodings for the broker, result backend and HTTP.
+
+- `qc-msgpack`: a kombu serializer used for task messages and results. The
+  payload is msgpack, and zlib-compressed when it is larger than
+  SERIALIZER_COMPRESS_MIN_BYTES. Counts dicts of wide circuits shrink well
+  because their keys are long, similar bitstrings. A leading byte
+  tells the encodings apart, and payloads starting with "{" are read as JSON,
+  so results stored before the switch stay readable.
+- `dumps_json` / `loads_json`: orjson for JSON on hot paths (result cache,
+  task events, streamed statuses).
+- `FastJSONResponse`: renders already-shaped data with orjson, skipping
+  response model validation, for endpoints returning large results.
+"""
+import datetime
+import uuid
+import zlib
+from typing import Any
+import msgpack
+import orjson
+from kombu.serialization import register
+from starlette.responses import JSONResponse
+from app.core.config import SERIALIZER_COMPRESS_LEVEL, SERIALIZER_COMPRESS_MIN_BYTES
+
+SERIALIZER_NAME = "qc-msgpack"
+CONTENT_TYPE = "application/x-qc-msgpack"
+
+_PLAIN = b"\x00"
+_ZLIB = b"\x01"
+_JSON = b"{"
+
+
+def _default(value: Any):
+    # Types found in Celery task and result metadata
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Cannot serialize object of type {type(value).__name__}")
+
+
+def pack(value: Any) -> bytes:
+    """
+    Encodes a value as msgpack, compressed if it is large.
+    Returns:
+        bytes: One header byte followed by the payload.
+    """
+    payload = msgpack.packb(value, default=_default, use_bin_type=True)
+    if len(payload) >= SERIALIZER_COMPRESS_MIN_BYTES:
+        compressed = zlib.compress(payload, SERIALIZER_COMPRESS_LEVEL)
+        if len(compressed) < len(payload):
+            return _ZLIB + compressed
+    return _PLAIN + payload
+
+
+def unpack(data: bytes) -> Any:
+    """
+    Decodes a value written by `pack`, or a JSON document.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    header, payload = data[:1], data[1:]
+    if header == _ZLIB:
+        return msgpack.unpackb(zlib.decompress(payload), raw=False, strict_map_key=False)
+    if header == _PLAIN:
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    if header == _JSON:
+        return orjson.loads(data)
+    raise ValueError(f"Unknown {SERIALIZER_NAME} payload header {header!r}")
+
+
+def dumps_json(value: Any) -> bytes:
+    """Encodes a value as compact JSON bytes"""
+    return orjson.dumps(value, default=_default)
+
+
+def loads_json(data) -> Any:
+    """Decodes JSON from bytes or str"""
+    return orjson.loads(data)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson. Returning it from an endpoint skips
+    response model validation, so content must already have the model's shape.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps_json(content)
+
+
+register(SERIALIZER_NAME, pack, unpack, content_type=CONTENT_TYPE, content_encoding="binary")
@@ -0,0 +1,208 @@
+"""
+submissions.py - Deduplication of task submissions across API replicas.
+
+Two kinds of Redis keys map a submission to the task that serves it:
+- `inflight:{fingerprint}`: the pending task of an identical circuit and
+  options. Created at enqueue time and deleted by the worker when the task
+  finishes, so later identical submissions join the pending task instead of
+  simulating it again. It expires after a multiple of the task's estimated
+  runtime, so the task of a lost worker is not joined for long.
+- `idempotency:{key}`: a hash of the task created for a client's
+  Idempotency-Key and the fingerprint it was submitted with, so retried
+  requests return the original task ID and a reused key is detected.
+Both are resolved and claimed by one Lua script, so concurrent submissions
+to any number of API processes agree on a single task. Claims are only ever
+dropped by their own task, with a compare-and-delete.
+"""
+import logging
+from typing import NamedTuple, Optional
+from app.core.config import (
+    DEDUPLICATE_INFLIGHT,
+    IDEMPOTENCY_TTL,
+    INFLIGHT_GRACE_SECONDS,
+    INFLIGHT_RUNTIME_FACTOR,
+    INFLIGHT_TTL,
+)
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger("redis")
+
+INFLIGHT_KEY_PREFIX = "inflight:"
+IDEMPOTENCY_KEY_PREFIX = "idempotency:"
+
+# KEYS: in-flight key ("" to skip coalescing), idempotency key ("" if none)
+# ARGV: new task ID, in-flight TTL, idempotency TTL, fingerprint
+# Returns {task ID, 1 if the new task ID was claimed, fingerprint of the task}
+_CLAIM_SCRIPT = """
+if KEYS[2] ~= '' then
+    local existing = redis.call('HMGET', KEYS[2], 'task_id', 'fingerprint')
+    if existing[1] then return {existing[1], 0, existing[2] or ''} end
+end
+local task_id, claimed = ARGV[1], 1
+if KEYS[1] ~= '' then
+    local pending = redis.call('GET', KEYS[1])
+    if pending then
+        task_id, claimed = pending, 0
+    else
+        redis.call('SET', KEYS[1], task_id, 'EX', ARGV[2])
+    end
+end
+if KEYS[2] ~= '' then
+    redis.call('HSET', KEYS[2], 'task_id', task_id, 'fingerprint', ARGV[4])
+    redis.call('EXPIRE', KEYS[2], ARGV[3])
+end
+return {task_id, claimed, ARGV[4]}
+"""
+
+# KEYS: in-flight key and idempotency key ("" to skip either)
+# ARGV: task ID whose claims are dropped
+# Deletes each key only while it still belongs to that task
+_RELEASE_SCRIPT = """
+if KEYS[1] ~= '' and redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('DEL', KEYS[1])
+end
+if KEYS[2] ~= '' and redis.call('HGET', KEYS[2], 'task_id') == ARGV[1] then
+    redis.call('DEL', KEYS[2])
+end
+return 0
+"""
+
+
+class IdempotencyKeyConflict(ValueError):
+    """Raised when an Idempotency-Key is reused for a different submission"""
+
+
+class Claim(NamedTuple):
+    task_id: str
+    claimed: bool  # False if the submission joined an existing task
+
+
+class SubmissionRegistry:
+    """
+    Atomically maps submissions to existing tasks, or claims a new task ID.
+    """
+
+    def __init__(self, inflight_ttl: int = INFLIGHT_TTL,
+                 idempotency_ttl: int = IDEMPOTENCY_TTL,
+                 deduplicate_inflight: bool = DEDUPLICATE_INFLIGHT,
+                 inflight_grace_seconds: float = INFLIGHT_GRACE_SECONDS,
+                 inflight_runtime_factor: float = INFLIGHT_RUNTIME_FACTOR):
+        self.inflight_ttl = inflight_ttl
+        self.idempotency_ttl = idempotency_ttl
+        self.deduplicate_inflight = deduplicate_inflight
+        self.inflight_grace_seconds = inflight_grace_seconds
+        self.inflight_runtime_factor = inflight_runtime_factor
+
+    def claim(self, fingerprint: Optional[str], task_id: str,
+              idempotency_key: Optional[str] = None,
+              estimated_runtime_ms: Optional[float] = None) -> Claim:
+        """
+        Resolves a submission to the task that should serve it.
+        A known idempotency key wins; otherwise a pending identical circuit
+        is joined; otherwise `task_id` is claimed for both.
+        Args:
+            fingerprint (Optional[str]): Circuit fingerprint, None to skip coalescing.
+            task_id (str): ID of the task to create if nothing matches.
+            idempotency_key (Optional[str]): Client-provided Idempotency-Key.
+            estimated_runtime_ms (Optional[float]): Estimated runtime of the
+                task, which sets how long it can be joined (see inflight_ttl_for).
+        Returns:
+            Claim: The serving task ID, and whether `task_id` was claimed.
+        Raises:
+            IdempotencyKeyConflict: If the idempotency key was used for a
+                submission with a different fingerprint.
+        """
+        inflight_key = self.inflight_key(fingerprint) if fingerprint else ""
+        if not inflight_key and not idempotency_key:
+            return Claim(task_id, True)
+        try:
+            redis = get_redis_client()
+            existing, claimed, submitted = redis.eval(
+                _CLAIM_SCRIPT, 2, inflight_key, self.idempotency_key(idempotency_key),
+                task_id, self.inflight_ttl_for(estimated_runtime_ms), self.idempotency_ttl,
+                fingerprint or "")
+        except Exception as e:
+            # Deduplication is an optimization: never fail a submission over it
+            logger.warning(f"Could not deduplicate submission: {str(e)}")
+            return Claim(task_id, True)
+        self._check_fingerprint(idempotency_key, fingerprint, submitted)
+        return Claim(_decode(existing), bool(claimed))
+
+    def remember(self, idempotency_key: str, task_id: str, fingerprint: Optional[str] = None) -> str:
+        """
+        Records the task of an Idempotency-Key unless one is already recorded.
+        Used for submissions answered without a pending task, e.g. cache hits.
+        Returns:
+            str: The task ID now recorded for the key.
+        Raises:
+            IdempotencyKeyConflict: If the key was used for a submission with
+                a different fingerprint.
+        """
+        try:
+            redis = get_redis_client()
+            existing, _, submitted = redis.eval(
+                _CLAIM_SCRIPT, 2, "", self.idempotency_key(idempotency_key),
+                task_id, 0, self.idempotency_ttl, fingerprint or "")
+        except Exception as e:
+            logger.warning(f"Could not record idempotency key: {str(e)}")
+            return task_id
+        self._check_fingerprint(idempotency_key, fingerprint, submitted)
+        return _decode(existing)
+
+    def release(self, fingerprint: Optional[str], task_id: str,
+                idempotency_key: Optional[str] = None):
+        """
+        Drops the claims of a task that could not be enqueued, so that
+        a retry submits it again. Claims that meanwhile belong to another
+        task are kept.
+        """
+        inflight_key = self.inflight_key(fingerprint) if fingerprint else ""
+        if not inflight_key and not idempotency_key:
+            return
+        try:
+            get_redis_client().eval(
+                _RELEASE_SCRIPT, 2, inflight_key, self.idempotency_key(idempotency_key), task_id)
+        except Exception as e:
+            logger.warning(f"Could not release submission claims: {str(e)}")
+
+    def release_inflight(self, pipe, inflight_key: str, task_id: str):
+        """
+        Queues the release of a finished task's in-flight claim on a pipeline.
+        """
+        pipe.eval(_RELEASE_SCRIPT, 2, inflight_key, "", task_id)
+
+    def inflight_ttl_for(self, estimated_runtime_ms: Optional[float]) -> int:
+        """
+        Returns how long a task can be joined: a grace period for its queue
+        wait plus a multiple of its estimated runtime, at most `inflight_ttl`.
+        """
+        if estimated_runtime_ms is None:
+            return self.inflight_ttl
+        ttl = self.inflight_grace_seconds + self.inflight_runtime_factor * estimated_runtime_ms / 1000
+        return max(1, min(self.inflight_ttl, int(ttl)))
+
+    def inflight_key(self, fingerprint: str) -> str:
+        """
+        Returns the in-flight key of a fingerprint, or "" when coalescing is off.
+        """
+        return INFLIGHT_KEY_PREFIX + fingerprint if self.deduplicate_inflight else ""
+
+    @staticmethod
+    def idempotency_key(key: Optional[str]) -> str:
+        return IDEMPOTENCY_KEY_PREFIX + key if key else ""
+
+    @staticmethod
+    def _check_fingerprint(idempotency_key: Optional[str], fingerprint: Optional[str], submitted):
+        # Keys recorded without a fingerprint match any submission
+        submitted = _decode(submitted)
+        if idempotency_key and fingerprint and submitted and submitted != fingerprint:
+            raise IdempotencyKeyConflict(
+                f"Idempotency-Key '{idempotency_key}' was already used for a different submission.")
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+# Create a singleton registry for the current process
+submission_registry = SubmissionRegistry()
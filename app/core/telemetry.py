@@ -0,0 +1,222 @@
+"""
+telemetry.py - Latency histograms and labelled counters in Prometheus format.
+
+Every process (API and workers) records observations into its metrics
+buffer, which aggregates them and flushes them to Redis hashes:
+- `stats:histogram:{stage}`: one field per latency bucket, plus sum and count
+- `stats:circuits`: circuit counts per "{outcome}:{qubit bucket}" field
+- `stats:routing`: per-queue task counts with estimated and actual runtime
+- `stats:startup:{phase}`: worker startup durations, bucketed like the stages
+
+Aggregating in Redis rather than in per-process registries means prefork
+workers in any number of containers report through the same keys, and a
+scrape reads a fixed number of hashes however many tasks ran.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+from app.core.metrics_buffer import metrics_buffer
+
+HISTOGRAM_PREFIX = "stats:histogram:"
+CIRCUITS_KEY = "stats:circuits"
+ROUTING_KEY = "stats:routing"
+STARTUP_PREFIX = "stats:startup:"
+
+# Pipeline stages with a latency histogram, in request order
+STAGES = ("http", "enqueue", "queue_wait", "parse", "simulate", "postprocess")
+
+# Worker startup phases with a duration histogram (see app/workers/startup.py)
+STARTUP_PHASES = ("preload", "worker_ready", "process_ready", "cold_start", "restart")
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# Upper bounds of the qubit-count buckets used as a counter label
+QUBIT_BUCKETS = (4, 8, 16, 24, 32)
+
+
+def observe(stage: str, seconds: float):
+    """
+    Records one latency observation for a pipeline stage.
+    Args:
+        stage (str): One of STAGES.
+        seconds (float): Observed duration.
+    """
+    metrics_buffer.record(_histogram_increments(HISTOGRAM_PREFIX + stage, seconds))
+
+
+def observe_startup(phase: str, seconds: float):
+    """
+    Records one duration of a worker startup phase.
+    Args:
+        phase (str): One of STARTUP_PHASES.
+        seconds (float): Observed duration.
+    """
+    metrics_buffer.record(_histogram_increments(STARTUP_PREFIX + phase, seconds))
+
+
+def _histogram_increments(key: str, seconds: float) -> dict:
+    return {
+        (key, _bucket_label(seconds)): 1,
+        (key, "sum"): float(seconds),
+        (key, "count"): 1,
+    }
+
+
+# Callables invoked with (stage, seconds) whenever a stage timer finishes
+StageHook = Callable[[str, float], None]
+_stage_hooks: List[StageHook] = [observe]
+
+# Stage durations of the task running in the current context, if collected
+_task_stages: ContextVar[Optional[Dict[str, float]]] = ContextVar("task_stages", default=None)
+
+
+def add_stage_hook(hook: StageHook):
+    """
+    Registers a callable to receive every stage timing, e.g. a tracer.
+    """
+    _stage_hooks.append(hook)
+
+
+def remove_stage_hook(hook: StageHook):
+    """Unregisters a stage hook added with `add_stage_hook`"""
+    _stage_hooks.remove(hook)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """
+    Times the enclosed block as one observation of `stage`, also when it raises.
+    The duration goes to every stage hook and, inside `collect_stages`,
+    is added to the current task's per-stage totals.
+    """
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start_time)
+
+
+def record_stage(stage: str, seconds: float):
+    """
+    Reports a stage duration measured by the caller.
+    """
+    stages = _task_stages.get()
+    if stages is not None:
+        stages[stage] = stages.get(stage, 0.0) + seconds
+    for hook in _stage_hooks:
+        hook(stage, seconds)
+
+
+@contextmanager
+def collect_stages(stages: Optional[Dict[str, float]] = None):
+    """
+    Collects the total time per stage of the enclosed block, e.g. one task.
+    Args:
+        stages (Optional[Dict[str, float]]): Totals to add to, e.g. from an earlier block.
+    Yields:
+        Dict[str, float]: Seconds per stage, filled as stages finish.
+    """
+    stages = stages if stages is not None else {}
+    token = _task_stages.set(stages)
+    try:
+        yield stages
+    finally:
+        _task_stages.reset(token)
+
+
+def count_circuit(outcome: str, num_qubits: Optional[int] = None):
+    """
+    Counts one executed circuit by outcome and qubit-count bucket.
+    Args:
+        outcome (str): "completed", "failed" or "cached".
+        num_qubits (Optional[int]): Circuit width, None if it never parsed.
+    """
+    metrics_buffer.record({(CIRCUITS_KEY, f"{outcome}:{qubit_bucket(num_qubits)}"): 1})
+
+
+def routing_fields(queue: str, estimated_ms: float, actual_ms: float) -> dict:
+    """
+    Returns the `stats:routing` increments of one task run from a tiered
+    queue, for comparing the cost estimate with the actual runtime.
+    Args:
+        queue (str): Queue the task was routed to.
+        estimated_ms (float): Runtime predicted by the dispatcher.
+        actual_ms (float): Measured execution time.
+    Returns:
+        dict: Metrics buffer counters keyed by (hash, field).
+    """
+    return {
+        (ROUTING_KEY, f"{queue}:tasks"): 1,
+        (ROUTING_KEY, f"{queue}:estimated_ms"): float(estimated_ms),
+        (ROUTING_KEY, f"{queue}:actual_ms"): float(actual_ms),
+    }
+
+
+def qubit_bucket(num_qubits: Optional[int]) -> str:
+    """
+    Returns the qubit-count bucket label of a circuit width, e.g. "5-8".
+    """
+    if num_qubits is None:
+        return "unknown"
+    lower = 1
+    for upper in QUBIT_BUCKETS:
+        if num_qubits <= upper:
+            return f"{lower}-{upper}"
+        lower = upper + 1
+    return f"{lower}+"
+
+
+def _bucket_label(seconds: float) -> str:
+    for bound in LATENCY_BUCKETS:
+        if seconds <= bound:
+            return repr(bound)
+    return "+Inf"
+
+
+def render_histograms(name: str, help_text: str,
+                      histograms: Mapping[str, Mapping[bytes, bytes]],
+                      label: str = "stage") -> List[str]:
+    """
+    Renders stored per-stage bucket counts as one Prometheus histogram.
+    Args:
+        name (str): Metric name.
+        help_text (str): HELP line text.
+        histograms (Mapping): Raw hash contents per stage.
+        label (str): Name of the label holding the stage.
+    Returns:
+        List[str]: Exposition lines.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for stage, raw in histograms.items():
+        fields = {key.decode(): value for key, value in raw.items()}
+        cumulative = 0
+        for bound in LATENCY_BUCKETS:
+            cumulative += int(fields.get(repr(bound), 0))
+            lines.append(f'{name}_bucket{{{label}="{stage}",le="{bound}"}} {cumulative}')
+        cumulative += int(fields.get("+Inf", 0))
+        lines.append(f'{name}_bucket{{{label}="{stage}",le="+Inf"}} {cumulative}')
+        lines.append(f'{name}_sum{{{label}="{stage}"}} {float(fields.get("sum", 0))}')
+        lines.append(f'{name}_count{{{label}="{stage}"}} {int(fields.get("count", 0))}')
+    return lines
+
+
+def render_metric(name: str, metric_type: str, help_text: str,
+                  samples: Iterable[Tuple[Dict[str, str], float]]) -> List[str]:
+    """
+    Renders a counter or gauge with labelled samples.
+    Args:
+        name (str): Metric name.
+        metric_type (str): "counter" or "gauge".
+        help_text (str): HELP line text.
+        samples (Iterable): (labels, value) pairs.
+    Returns:
+        List[str]: Exposition lines.
+    """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        label_text = ",".join(f'{key}="{val}"' for key, val in labels.items())
+        lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return lines
@@ -0,0 +1,176 @@
+"""
+cost_estimator.py - Fast pre-execution cost estimates for QASM3 circuits.
+
+The API must decide where to route a circuit without importing Qiskit or
+parsing the circuit properly, so the estimator scans the QASM text with
+regular expressions: it counts qubits, gate applications and circuit depth,
+and turns them into a statevector runtime and memory prediction. Estimates
+are heuristic. Workers report the actual runtime against them (see
+`stats:routing`), so the constants below can be recalibrated.
+"""
+import re
+from typing import Dict, List, NamedTuple
+from app.core.config import (
+    QUEUE_LARGE,
+    QUEUE_MEDIUM,
+    QUEUE_SMALL,
+    ROUTING_MEDIUM_MAX_MEMORY_MB,
+    ROUTING_MEDIUM_MAX_MS,
+    ROUTING_SMALL_MAX_MS,
+)
+
+_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_LINE_COMMENT = re.compile(r"//[^\n]*")
+# Gate definitions apply to formal parameters, not to circuit qubits
+_GATE_DEFINITION = re.compile(r"\bgate\s+[^{]*\{[^}]*\}", re.DOTALL)
+_QUBIT_DECLARATION = re.compile(r"^qubit\s*(?:\[\s*(\d+)\s*\])?\s+([A-Za-z_]\w*)$")
+_QREG_DECLARATION = re.compile(r"^qreg\s+([A-Za-z_]\w*)\s*\[\s*(\d+)\s*\]$")
+_GATE_CALL = re.compile(r"^([A-Za-z_]\w*)\s*(?:\([^)]*\))?\s+(.+)$")
+_OPERAND = re.compile(r"^([A-Za-z_]\w*)\s*(?:\[\s*(\d+)\s*\])?$")
+
+# Statements that are not gate applications
+_NON_GATE_KEYWORDS = {
+    "OPENQASM", "include", "qubit", "qreg", "bit", "creg", "measure", "barrier",
+    "reset", "input", "output", "const", "let", "def", "defcal", "gate",
+    "if", "for", "while", "return", "box", "delay", "int", "uint", "float", "angle",
+}
+
+# Model constants (single thread): seconds per amplitude update per gate,
+# per-shot sampling cost, and fixed per-task overhead
+SECONDS_PER_AMPLITUDE_GATE = 2e-9
+SECONDS_PER_SHOT = 1e-6
+TASK_OVERHEAD_SECONDS = 0.003
+BYTES_PER_AMPLITUDE = 16
+
+# Gates of Clifford circuits, which run on the stabilizer method in
+# polynomial time and memory (see app/workers/method_selection.py)
+CLIFFORD_GATES = {"id", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg",
+                  "cx", "CX", "cy", "cz", "swap", "ecr"}
+
+
+class CostEstimate(NamedTuple):
+    qubits: int
+    gates: int
+    depth: int
+    shots: int
+    runtime_ms: float
+    memory_bytes: int
+    queue: str
+
+    def as_fields(self) -> Dict[str, object]:
+        """Returns the estimate as task metadata fields"""
+        return {
+            "estimated_qubits": self.qubits,
+            "estimated_gates": self.gates,
+            "estimated_depth": self.depth,
+            "estimated_runtime_ms": round(self.runtime_ms, 3),
+            "estimated_memory_bytes": self.memory_bytes,
+            "queue": self.queue,
+        }
+
+
+class CircuitCostEstimator:
+    """
+    Predicts runtime and memory of a circuit and picks its queue tier.
+    """
+
+    def __init__(self, small_max_ms: float = ROUTING_SMALL_MAX_MS,
+                 medium_max_ms: float = ROUTING_MEDIUM_MAX_MS,
+                 medium_max_memory_mb: float = ROUTING_MEDIUM_MAX_MEMORY_MB):
+        self.small_max_ms = small_max_ms
+        self.medium_max_ms = medium_max_ms
+        self.medium_max_memory_bytes = int(medium_max_memory_mb * 1024 * 1024)
+
+    def estimate(self, qasm_str: str, shots: int, method: str = "auto",
+                 runs: int = 1) -> CostEstimate:
+        """
+        Estimates the cost of executing a circuit.
+        Args:
+            qasm_str (str): Quantum circuit as a QASM3 string.
+            shots (int): Number of shots.
+            method (str): Requested simulation method. Clifford circuits are
+                costed as stabilizer simulations unless another method is forced,
+                anything else as a statevector simulation.
+            runs (int): Number of parameter sets the circuit is run with.
+        Returns:
+            CostEstimate: Circuit size, predicted cost and queue tier.
+        """
+        qubits, gates, depth, gate_names = self._scan(qasm_str)
+        stabilizer = method == "stabilizer" or (method == "auto" and gate_names <= CLIFFORD_GATES)
+        # A stabilizer tableau holds 2n rows of 2n bits; a statevector 2^n amplitudes
+        state_size = qubits if stabilizer else 2 ** qubits
+        memory_bytes = (2 * qubits) ** 2 // 8 if stabilizer else BYTES_PER_AMPLITUDE * 2 ** qubits
+        runtime_ms = 1000 * (TASK_OVERHEAD_SECONDS
+                             + runs * gates * state_size * SECONDS_PER_AMPLITUDE_GATE
+                             + runs * shots * SECONDS_PER_SHOT)
+        return CostEstimate(qubits, gates, depth, shots, runtime_ms, memory_bytes,
+                            self.route(runtime_ms, memory_bytes))
+
+    def route(self, runtime_ms: float, memory_bytes: int) -> str:
+        """
+        Returns the queue tier for a predicted runtime and memory.
+        """
+        if runtime_ms > self.medium_max_ms or memory_bytes > self.medium_max_memory_bytes:
+            return QUEUE_LARGE
+        if runtime_ms > self.small_max_ms:
+            return QUEUE_MEDIUM
+        return QUEUE_SMALL
+
+    @staticmethod
+    def _scan(qasm_str: str):
+        text = _LINE_COMMENT.sub(" ", _BLOCK_COMMENT.sub(" ", qasm_str))
+        text = _GATE_DEFINITION.sub(" ", text)
+
+        registers: Dict[str, List[int]] = {}
+        gate_names = set()
+        num_qubits = 0
+        gates = 0
+        levels: List[int] = []
+        for statement in (part.strip() for part in text.split(";")):
+            if not statement:
+                continue
+            declaration = _QUBIT_DECLARATION.match(statement)
+            if declaration:
+                size, name = int(declaration.group(1) or 1), declaration.group(2)
+            else:
+                declaration = _QREG_DECLARATION.match(statement)
+                if declaration:
+                    name, size = declaration.group(1), int(declaration.group(2))
+            if declaration:
+                registers[name] = list(range(num_qubits, num_qubits + size))
+                num_qubits += size
+                levels.extend([0] * size)
+                continue
+
+            call = _GATE_CALL.match(statement)
+            if call is None or call.group(1) in _NON_GATE_KEYWORDS:
+                continue
+            operands = []
+            for operand in call.group(2).split(","):
+                match = _OPERAND.match(operand.strip())
+                if match is None or match.group(1) not in registers:
+                    operands = []
+                    break
+                register = registers[match.group(1)]
+                index = match.group(2)
+                if index is None:
+                    operands.append(register)
+                elif int(index) < len(register):
+                    operands.append([register[int(index)]])
+            if not operands:
+                continue
+            gate_names.add(call.group(1))
+
+            # Whole-register operands broadcast the gate over the register
+            for step in range(max(len(operand) for operand in operands)):
+                qubits = [operand[step % len(operand)] for operand in operands]
+                level = max(levels[qubit] for qubit in qubits) + 1
+                for qubit in qubits:
+                    levels[qubit] = level
+                gates += 1
+
+        return num_qubits, gates, max(levels, default=0), gate_names
+
+
+# Create a singleton estimator for the dispatcher
+cost_estimator = CircuitCostEstimator()
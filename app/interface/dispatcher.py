@@ -18,8 +18,34 @@
        - Makes the codebase more maintainable as it grows
        - Enables centralized logging and metrics collection
 """
+import asyncio
+import functools
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from celery import states
 from celery.result import AsyncResult
+from app.core.blob_store import inline_status
 from app.core.celery_app import celery_app
+from app.core.config import (
+    BATCH_CHUNK_SIZE,
+    BATCH_TTL,
+    DEFAULT_SHOTS,
+    DISPATCHER_MAX_WORKERS,
+    QUEUE_MEDIUM,
+    STATUS_CHUNK_SIZE,
+)
+from app.core.fingerprint import circuit_fingerprint
+from app.core.redis_client import (
+    get_async_backend_client,
+    get_async_redis_client,
+    get_redis_client,
+)
+from app.core.result_cache import cacheable, result_cache
+from app.core.submissions import submission_registry
+from app.core.telemetry import stage_timer
+from app.interface.cost_estimator import CostEstimate, cost_estimator
 import logging
 
 logger = logging.getLogger("api")
@@ -28,23 +54,106 @@ logger = logging.getLogger("api")
 class CircuitTaskDispatcher:
     """
     Dispatches quantum circuit tasks and retrieves their results.
+
+    Blocking broker calls (Celery `send_task`) run on a bounded thread pool,
+    and result lookups read the result backend with an asyncio Redis client,
+    so neither ever blocks the API event loop.
+
+    Each message is routed to a size-tiered queue (small, medium, large)
+    chosen from the estimated cost of its circuits, so long simulations
+    cannot hold up workers serving short ones.
     """
 
-    async def execute_circuit(self, qasm_str: str):
+    def __init__(self, max_workers: int = DISPATCHER_MAX_WORKERS, estimator=cost_estimator):
+        self.max_workers = max_workers
+        self.estimator = estimator
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    async def startup(self):
+        """
+        Pre-opens broker and result backend connections, so the first
+        request does not pay connection setup.
+        """
+        try:
+            await self._run_blocking(self._warm_connections)
+            logger.info("Dispatcher connections to broker and backend ready")
+        except Exception as e:
+            # Connections are retried lazily on first use
+            logger.warning(f"Could not pre-open dispatcher connections: {str(e)}")
+
+    async def shutdown(self):
+        """
+        Shuts down the dispatcher's thread pool.
+        The shared asyncio Redis clients are closed by the application lifespan.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def execute_circuit(self, qasm_str: str, idempotency_key: Optional[str] = None, **options):
         """
         Validates and submits a QASM3 circuit for execution.
+        If an identical circuit was already executed, the cached result is
+        stored under a new task ID and nothing is enqueued. If one is still
+        pending, its task is returned instead, as is the task of an already
+        used idempotency key.
         Args:
             qasm_str (str): Quantum circuit as a QASM3 string.
+            idempotency_key (Optional[str]): Client key identifying retries of one submission.
+            **options: Execution options forwarded to the worker (e.g. marginalize).
         Returns:
             AsyncResult: A Celery task handle.
         Raises:
             ValueError: If the QASM string is invalid (missing 'OPENQASM' or 'qubit').
+            IdempotencyKeyConflict: If the idempotency key was used for a
+                different submission.
         """
-        if not qasm_str or not qasm_str.strip():
-            raise ValueError("Quantum circuit string cannot be empty.")
-        if "OPENQASM" not in qasm_str.upper():
-            raise ValueError("Quantum circuit must contain 'OPENQASM'.")
-        return celery_app.send_task("app.workers.tasks.execute_circuit_task", args=[qasm_str])
+        self._validate(qasm_str)
+        return await self._run_blocking(self._submit_circuit, qasm_str, idempotency_key, options)
+
+    async def execute_batch(self, qasm_list: List[str], **options) -> Tuple[str, List[str]]:
+        """
+        Validates and submits many QASM3 circuits as a batch.
+        Circuits are grouped into chunks of BATCH_CHUNK_SIZE, and each chunk is
+        enqueued as a single broker message executed by one simulator call.
+        Args:
+            qasm_list (List[str]): Quantum circuits as QASM3 strings.
+            **options: Execution options applied to every circuit.
+        Returns:
+            tuple: Batch ID and the individual task IDs, in submission order.
+        Raises:
+            ValueError: If any QASM string is invalid.
+        """
+        for index, qasm_str in enumerate(qasm_list):
+            try:
+                self._validate(qasm_str)
+            except ValueError as e:
+                raise ValueError(f"Circuit {index}: {str(e)}")
+
+        batch_id = str(uuid.uuid4())
+        task_ids = [str(uuid.uuid4()) for _ in qasm_list]
+        await self._run_blocking(self._submit_batch, batch_id, task_ids, qasm_list, options)
+
+        logger.debug(
+            f"Submitted batch {batch_id} with {len(task_ids)} circuits")
+        return batch_id, task_ids
+
+    async def get_batch_result(self, batch_id: str) -> Optional[dict]:
+        """
+        Retrieves the status of every task in a batch.
+        Args:
+            batch_id (str): Batch identifier returned on submission.
+        Returns:
+            Optional[dict]: Status per task ID, or None if the batch is unknown.
+        """
+        logger.debug(f"Retrieving results for batch ID: {batch_id}")
+        redis, _ = self._clients()
+        task_ids = await redis.lrange(f"batch:{batch_id}", 0, -1)
+        if not task_ids:
+            return None
+
+        return await self.get_task_results(
+            [task_id.decode() if isinstance(task_id, bytes) else task_id for task_id in task_ids])
 
     async def get_task_result(self, task_id: str):
         """
@@ -55,14 +164,63 @@ class CircuitTaskDispatcher:
             dict: Result status and value or error.
         """
         logger.debug(f"Retrieving result for task ID: {task_id}")
-        result = AsyncResult(task_id, app=celery_app)
+        _, backend = self._clients()
+        payload = await backend.get(celery_app.backend.get_key_for_task(task_id))
+        return self._status_response(payload)
+
+    async def get_task_results(self, task_ids: List[str]) -> Dict[str, dict]:
+        """
+        Retrieves the results of many tasks.
+        Args:
+            task_ids (List[str]): Task identifiers.
+        Returns:
+            Dict[str, dict]: Result status and value or error per task ID.
+        """
+        results = {}
+        async for chunk in self.iter_task_results(task_ids):
+            results.update(chunk)
+        return results
 
-        if result.successful():
+    async def iter_task_results(self, task_ids: List[str],
+                                chunk_size: int = STATUS_CHUNK_SIZE) -> AsyncIterator[List[Tuple[str, dict]]]:
+        """
+        Resolves task results in chunks, one MGET round trip per chunk,
+        so large ID lists never have to be held in memory at once.
+        Results kept in the blob store are replaced by a pointer to GET /tasks/{id}.
+        Args:
+            task_ids (List[str]): Task identifiers.
+            chunk_size (int): Number of IDs resolved per round trip.
+        Yields:
+            List[Tuple[str, dict]]: (task ID, status response) pairs, in order.
+        """
+        _, backend = self._clients()
+        for start in range(0, len(task_ids), chunk_size):
+            chunk = task_ids[start:start + chunk_size]
+            payloads = await backend.mget(
+                [celery_app.backend.get_key_for_task(task_id) for task_id in chunk])
+            yield [(task_id, inline_status(task_id, self._status_response(payload)))
+                   for task_id, payload in zip(chunk, payloads)]
+
+    def _status_response(self, payload: Optional[bytes]) -> dict:
+        """
+        Maps a raw result backend entry to the API status shape.
+        Args:
+            payload (Optional[bytes]): Encoded task meta, None if not stored yet.
+        Returns:
+            dict: Result status and value or error.
+        """
+        if payload is None:
+            state, result = states.PENDING, None
+        else:
+            meta = celery_app.backend.decode_result(payload)
+            state, result = meta["status"], meta["result"]
+
+        if state == states.SUCCESS:
             response = {
                 "status": "completed",
-                "result": result.result
+                "result": result
             }
-        elif result.state in ("PENDING", "RECEIVED", "STARTED"):
+        elif state in (states.PENDING, states.RECEIVED, states.STARTED):
             response = {
                 "status": "pending",
                 "message": "Task is still in progress."
@@ -74,6 +232,184 @@ class CircuitTaskDispatcher:
             }
         return response
 
+    def _submit_circuit(self, qasm_str: str, idempotency_key: Optional[str], options: dict) -> AsyncResult:
+        """
+        Looks up the result cache (seeded runs only), then joins a pending
+        identical task or enqueues the circuit under a newly claimed task ID.
+        Every enqueued message is counted in `stats:enqueued_tasks`.
+        Runs on the dispatcher thread pool.
+        """
+        fingerprint = circuit_fingerprint(qasm_str, **options)
+        cached = result_cache.get(fingerprint) if cacheable(options.get("seed")) else None
+        if cached is not None:
+            task_id = str(uuid.uuid4())
+            if idempotency_key:
+                existing = submission_registry.remember(idempotency_key, task_id, fingerprint)
+                if existing != task_id:
+                    return AsyncResult(existing, app=celery_app)
+            return self._completed_task(cached, task_id)
+
+        # Estimated first: the runtime bounds how long the claim can be joined
+        estimate = self._estimate(qasm_str, options)
+        claim = submission_registry.claim(fingerprint, str(uuid.uuid4()), idempotency_key,
+                                          estimated_runtime_ms=estimate.runtime_ms)
+        if not claim.claimed:
+            logger.debug(f"Submission joined existing task {claim.task_id}")
+            return AsyncResult(claim.task_id, app=celery_app)
+
+        headers = self._headers(estimate.runtime_ms)
+        inflight_key = submission_registry.inflight_key(fingerprint)
+        if inflight_key:
+            # The worker deletes the claim once the task has finished
+            headers["inflight_key"] = inflight_key
+        try:
+            with stage_timer("enqueue"):
+                task = celery_app.send_task("app.workers.tasks.execute_circuit_task",
+                                            args=[qasm_str], kwargs=options,
+                                            task_id=claim.task_id,
+                                            queue=estimate.queue,
+                                            headers=headers)
+        except Exception as e:
+            # Submissions that joined the claim meanwhile already hold its task ID
+            self._fail_unsent([claim.task_id], e)
+            submission_registry.release(fingerprint, claim.task_id, idempotency_key)
+            raise
+        pipe = get_redis_client().pipeline()
+        pipe.incr("stats:enqueued_tasks")
+        pipe.hset(f"task:{task.id}", mapping=estimate.as_fields())
+        pipe.expire(f"task:{task.id}", BATCH_TTL)
+        pipe.execute()
+        return task
+
+    def _submit_batch(self, batch_id: str, task_ids: List[str], qasm_list: List[str], options: dict):
+        """
+        Records batch membership and enqueues one message per chunk.
+        A chunk runs as one simulator call, so it is routed by the summed
+        runtime and the largest memory estimate of its circuits.
+        The batch is recorded before any chunk is enqueued. If a chunk cannot
+        be enqueued, its circuits and those of later chunks are marked failed
+        while earlier chunks run on.
+        Runs on the dispatcher thread pool.
+        """
+        estimates = [self._estimate(qasm_str, options) for qasm_str in qasm_list]
+        redis = get_redis_client()
+        record = redis.pipeline()
+        record.rpush(f"batch:{batch_id}", *task_ids)
+        record.expire(f"batch:{batch_id}", BATCH_TTL)
+        record.execute()
+
+        pipe = redis.pipeline()
+        sent = 0
+        try:
+            for start in range(0, len(qasm_list), BATCH_CHUNK_SIZE):
+                end = start + BATCH_CHUNK_SIZE
+                chunk_estimates = estimates[start:end]
+                runtime_ms = sum(estimate.runtime_ms for estimate in chunk_estimates)
+                queue = self.estimator.route(
+                    runtime_ms, max(estimate.memory_bytes for estimate in chunk_estimates))
+                try:
+                    with stage_timer("enqueue"):
+                        celery_app.send_task(
+                            "app.workers.tasks.execute_circuit_batch_task",
+                            args=[task_ids[start:end], qasm_list[start:end]],
+                            kwargs=options,
+                            queue=queue,
+                            headers=self._headers(runtime_ms))
+                except Exception as e:
+                    logger.warning(f"Batch {batch_id}: chunk {start // BATCH_CHUNK_SIZE} and later "
+                                   f"not enqueued, {len(task_ids) - start} circuit(s) failed")
+                    self._fail_unsent(task_ids[start:], e)
+                    raise
+                sent += 1
+                for task_id, estimate in zip(task_ids[start:end], chunk_estimates):
+                    pipe.hset(f"task:{task_id}", mapping={**estimate.as_fields(), "queue": queue})
+                    pipe.expire(f"task:{task_id}", BATCH_TTL)
+        finally:
+            if sent:
+                pipe.incrby("stats:enqueued_tasks", sent)
+                pipe.execute()
+
+    def _estimate(self, qasm_str: str, options: dict) -> CostEstimate:
+        """
+        Estimates a circuit's cost under its execution options; circuits
+        the estimator cannot read are routed to the medium queue.
+        """
+        shots = options.get("shots", DEFAULT_SHOTS)
+        try:
+            return self.estimator.estimate(qasm_str, shots, options.get("method", "auto"),
+                                           len(options.get("parameter_binds") or ()) or 1)
+        except Exception as e:
+            logger.warning(f"Cost estimation failed, routing to {QUEUE_MEDIUM}: {str(e)}")
+            return CostEstimate(0, 0, 0, shots, 0.0, 0, QUEUE_MEDIUM)
+
+    @staticmethod
+    def _headers(estimated_runtime_ms: float) -> dict:
+        """
+        Message headers read by the worker: enqueue time for the queue-wait
+        stage, and the runtime estimate to compare with the actual runtime.
+        """
+        return {"enqueued_at": time.time(), "estimated_runtime_ms": estimated_runtime_ms}
+
+    def _validate(self, qasm_str: str):
+        """
+        Performs cheap sanity checks on a QASM3 string.
+        Raises:
+            ValueError: If the QASM string is empty or missing 'OPENQASM'.
+        """
+        if not qasm_str or not qasm_str.strip():
+            raise ValueError("Quantum circuit string cannot be empty.")
+        if "OPENQASM" not in qasm_str.upper():
+            raise ValueError("Quantum circuit must contain 'OPENQASM'.")
+
+    def _completed_task(self, result: dict, task_id: str) -> AsyncResult:
+        """
+        Records an already-known result as a finished task.
+        Args:
+            result (dict): Cached circuit result.
+            task_id (str): ID to store the result under.
+        Returns:
+            AsyncResult: Handle of a task that is already in SUCCESS state.
+        """
+        celery_app.backend.store_result(task_id, result, states.SUCCESS)
+        logger.debug(f"Served task {task_id} from result cache")
+        return AsyncResult(task_id, app=celery_app)
+
+    def _fail_unsent(self, task_ids: List[str], error: Exception):
+        """
+        Stores a failure for tasks whose message could not be enqueued, so
+        anyone holding their IDs sees them fail instead of pending forever.
+        """
+        try:
+            for task_id in task_ids:
+                celery_app.backend.store_result(task_id, error, states.FAILURE)
+        except Exception as e:
+            logger.warning(f"Could not mark {len(task_ids)} unsent task(s) as failed: {str(e)}")
+
+    def _warm_connections(self):
+        """
+        Opens a broker connection for the producer pool and the sync Redis
+        client used by the result cache.
+        """
+        with celery_app.pool.acquire(block=True) as connection:
+            connection.ensure_connection(max_retries=3)
+        get_redis_client().ping()
+
+    def _clients(self):
+        """
+        Returns the shared asyncio Redis clients (general, result backend).
+        """
+        return get_async_redis_client(), get_async_backend_client()
+
+    async def _run_blocking(self, func, *args):
+        """
+        Runs a blocking call on the bounded dispatcher thread pool.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="dispatcher")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
 
 # Create a singleton dispatcher instance for use throughout the application
 dispatcher = CircuitTaskDispatcher()
@@ -0,0 +1,166 @@
+"""
+health_prober.py - Background health checks for the API's dependencies.
+
+Each API process probes Redis and reads the worker heartbeats on a jittered
+interval and keeps the latest snapshot in memory. Health endpoints answer
+from that snapshot, so an orchestrator probe never waits on Redis or on a
+broadcast to the workers, and many API replicas do not probe in lockstep.
+"""
+import asyncio
+import logging
+import random
+import time
+from typing import Optional
+from app.core.config import (
+    HEALTH_PROBE_INTERVAL_SECONDS,
+    HEALTH_PROBE_JITTER,
+    WORKER_HEARTBEAT_TIMEOUT_SECONDS,
+)
+from app.core.redis_client import get_async_redis_client
+from app.workers.heartbeat import HEARTBEAT_KEY
+
+logger = logging.getLogger("api")
+
+# Workers missing for this long are dropped from the heartbeat hash
+WORKER_FORGET_SECONDS = 3600
+
+
+class HealthProber:
+    """
+    Periodically refreshes and caches the health of Redis and the workers.
+    """
+
+    def __init__(self, interval: float = HEALTH_PROBE_INTERVAL_SECONDS,
+                 jitter: float = HEALTH_PROBE_JITTER,
+                 worker_timeout: float = WORKER_HEARTBEAT_TIMEOUT_SECONDS):
+        self.interval = interval
+        self.jitter = jitter
+        self.worker_timeout = worker_timeout
+        self._redis = None
+        self._prober: Optional[asyncio.Task] = None
+        self._snapshot: Optional[dict] = None
+
+    async def start(self):
+        """
+        Runs a first probe, then keeps probing in the background.
+        """
+        if self._prober is not None:
+            return
+        self._redis = get_async_redis_client()
+        await self.probe()
+        self._prober = asyncio.create_task(self._probe_loop())
+
+    async def stop(self):
+        """
+        Stops probing.
+        """
+        if self._prober is not None:
+            self._prober.cancel()
+            try:
+                await self._prober
+            except asyncio.CancelledError:
+                pass
+            self._prober = None
+        # The shared client itself is closed by the application lifespan
+        self._redis = None
+
+    async def probe(self) -> dict:
+        """
+        Checks Redis and the worker heartbeats once and caches the result.
+        Heartbeat ages are measured on the Redis server's clock, which the
+        workers stamp their heartbeats with.
+        Returns:
+            dict: The new health snapshot.
+        """
+        now = time.time()
+        redis_now = now
+        redis_status = "healthy"
+        heartbeats = {}
+        try:
+            pipe = self._redis.pipeline(transaction=False)
+            pipe.time()
+            pipe.hgetall(HEARTBEAT_KEY)
+            (seconds, microseconds), heartbeats = await pipe.execute()
+            redis_now = seconds + microseconds / 1e6
+        except Exception as e:
+            logger.error(f"Redis health check failed: {str(e)}")
+            redis_status = f"unhealthy: {str(e)}"
+
+        workers = {}
+        forgotten = []
+        for hostname, last_seen in heartbeats.items():
+            hostname, last_seen = hostname.decode(), float(last_seen)
+            age = redis_now - last_seen
+            if age > WORKER_FORGET_SECONDS:
+                forgotten.append(hostname)
+                continue
+            workers[hostname] = {
+                "status": "alive" if age <= self.worker_timeout else "stale",
+                "last_seen": last_seen,
+                "last_seen_seconds_ago": round(max(age, 0.0), 3),
+            }
+        if forgotten:
+            try:
+                await self._redis.hdel(HEARTBEAT_KEY, *forgotten)
+            except Exception as e:
+                logger.warning(f"Could not forget stale workers: {str(e)}")
+
+        if redis_status != "healthy":
+            celery_status = "unknown: Redis unreachable"
+        elif not workers:
+            celery_status = "no workers available"
+        elif not any(worker["status"] == "alive" for worker in workers.values()):
+            celery_status = "no worker heartbeat received recently"
+        else:
+            celery_status = "healthy"
+
+        self._snapshot = {
+            "checked_at": now,
+            "redis": redis_status,
+            "celery": celery_status,
+            "workers": workers,
+        }
+        return self._snapshot
+
+    def snapshot(self) -> dict:
+        """
+        Returns the cached health, with its age and a staleness verdict.
+        Components are reported as unknown when the prober has fallen behind.
+        Returns:
+            dict: Component statuses, per-worker liveness and staleness.
+        """
+        if self._snapshot is None:
+            return {
+                "redis": "unknown: not probed yet",
+                "celery": "unknown: not probed yet",
+                "workers": {},
+                "checked_at": None,
+                "staleness_seconds": None,
+            }
+        snapshot = dict(self._snapshot)
+        staleness = time.time() - snapshot["checked_at"]
+        snapshot["staleness_seconds"] = round(staleness, 3)
+        if staleness > self.max_staleness:
+            stale = f"unknown: last probed {staleness:.0f}s ago"
+            snapshot["redis"] = snapshot["celery"] = stale
+        return snapshot
+
+    @property
+    def max_staleness(self) -> float:
+        # Allow a couple of missed probes before distrusting the cache
+        return 3 * self.interval * (1 + self.jitter)
+
+    async def _probe_loop(self):
+        while True:
+            delay = self.interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            await asyncio.sleep(delay)
+            try:
+                await self.probe()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Health probe failed: {str(e)}")
+
+
+# Create a singleton prober for the current API process
+health_prober = HealthProber()
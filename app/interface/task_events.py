@@ -0,0 +1,136 @@
+"""
+task_events.py - Push notifications for task completion.
+
+Workers publish one message per finished task on a single Redis pub/sub
+channel (see task_wrapper.py). Each API process holds exactly one pub/sub
+connection to that channel and fans messages out in memory to the SSE and
+WebSocket subscribers waiting on the task ID. An idle subscription therefore
+costs one dictionary entry and a queue, not a Redis connection or a poll.
+"""
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set
+from app.core.config import TASK_EVENTS_CHANNEL
+from app.core.redis_client import get_async_redis_client
+from app.core.serialization import loads_json
+
+logger = logging.getLogger("api")
+
+# Event type telling subscribers that events may have been missed
+RESYNC_EVENT = "resync"
+
+
+class TaskEventHub:
+    """
+    Fans out task completion events from Redis pub/sub to local subscribers.
+    """
+
+    def __init__(self, channel: str = TASK_EVENTS_CHANNEL):
+        self.channel = channel
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._redis = None
+        self._reader: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Event] = None
+
+    async def start(self):
+        """
+        Starts listening on the events channel, if not already listening.
+        """
+        if self._reader is None:
+            self._ready = asyncio.Event()
+            self._redis = get_async_redis_client()
+            self._reader = asyncio.create_task(self._read_loop())
+        await self._ready.wait()
+
+    async def stop(self):
+        """
+        Stops listening and releases the pub/sub connection.
+        """
+        if self._reader is not None:
+            self._reader.cancel()
+            try:
+                await self._reader
+            except asyncio.CancelledError:
+                pass
+            self._reader = None
+        # The shared client itself is closed by the application lifespan
+        self._redis = None
+
+    async def subscribe(self, task_ids: Iterable[str], queue: Optional[asyncio.Queue] = None) -> asyncio.Queue:
+        """
+        Registers a queue to receive the events of the given tasks.
+        Args:
+            task_ids (Iterable[str]): Task IDs to watch.
+            queue (Optional[asyncio.Queue]): Existing queue to reuse, e.g. one per WebSocket.
+        Returns:
+            asyncio.Queue: Queue that receives event dicts.
+        """
+        await self.start()
+        queue = queue if queue is not None else asyncio.Queue()
+        for task_id in task_ids:
+            self._subscribers[task_id].add(queue)
+        return queue
+
+    def unsubscribe(self, task_ids: Iterable[str], queue: asyncio.Queue):
+        """
+        Removes a queue from the given tasks' subscribers.
+        """
+        for task_id in task_ids:
+            queues = self._subscribers.get(task_id)
+            if queues is None:
+                continue
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[task_id]
+
+    @property
+    def subscription_count(self) -> int:
+        return len(self._subscribers)
+
+    async def _read_loop(self):
+        backoff = 0.5
+        reconnecting = False
+        while True:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(self.channel)
+                self._ready.set()
+                backoff = 0.5
+                if reconnecting:
+                    # Events published while disconnected are lost: ask every
+                    # subscriber to re-check the state of its tasks
+                    self._broadcast({"type": RESYNC_EVENT})
+                    reconnecting = False
+                async for message in pubsub.listen():
+                    self._dispatch(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Task events subscription lost, retrying in {backoff}s: {str(e)}")
+                # Let waiting subscribers proceed; they check task state themselves
+                self._ready.set()
+                reconnecting = True
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+            finally:
+                # Return the pub/sub connection to the shared pool
+                await pubsub.aclose()
+
+    def _dispatch(self, data):
+        try:
+            event = loads_json(data)
+        except (TypeError, ValueError):
+            logger.warning("Ignoring malformed task event")
+            return
+        for queue in self._subscribers.get(event.get("task_id"), ()):
+            queue.put_nowait(event)
+
+    def _broadcast(self, event: dict):
+        for queue in {queue for queues in self._subscribers.values() for queue in queues}:
+            queue.put_nowait(event)
+
+
+# Create a singleton hub for the current API process
+task_event_hub = TaskEventHub()
@@ -5,22 +5,50 @@ Sets up the API server with middleware, routing, and logging.
 """
 
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.api import routes
 from app.api import health
 from app.api import metrics
 from app.core.middleware import LoggingMiddleware
 from app.core.logging_config import setup_logging
+from app.core.config import BROKER_URL, REDIS_URL, RESULT_BACKEND
+from app.core.metrics_buffer import metrics_buffer
+from app.core.redis_client import close_async_redis, open_async_redis
+from app.interface.dispatcher import dispatcher
+from app.interface.health_prober import health_prober
+from app.interface.task_events import task_event_hub
 
 # Setup logging first
 setup_logging()
 logger = logging.getLogger("api")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Opens shared connections and background services for the app's lifetime"""
+    logger.info("Starting Quantum Circuits API server")
+    await open_async_redis(*{REDIS_URL, BROKER_URL, RESULT_BACKEND})
+    await dispatcher.startup()
+    await task_event_hub.start()
+    await health_prober.start()
+
+    yield
+
+    logger.info("Shutting down Quantum Circuits API server")
+    await health_prober.stop()
+    await task_event_hub.stop()
+    await dispatcher.shutdown()
+    metrics_buffer.flush()
+    await close_async_redis()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Quantum Circuits System",
     description="API for executing and monitoring quantum circuits",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add middleware for request/response logging
@@ -31,18 +59,6 @@ app.include_router(routes.router)
 app.include_router(health.router)
 app.include_router(metrics.router)
 
-
-@app.on_event("startup")
-async def startup_event():
-    """Runs when the application starts"""
-    logger.info("Starting Quantum Circuits API server")
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Runs when the application shuts down"""
-    logger.info("Shutting down Quantum Circuits API server")
-
 # Root endpoint for basic info
 
 
@@ -0,0 +1,247 @@
+"""
+circuit_cache.py - Cache of parsed, simulator-ready QuantumCircuit objects.
+
+Identical QASM text is parsed by `qasm3.loads` (and transpiled when it uses
+instructions the simulator does not support natively) only once per worker:
+- An in-process LRU keyed by the hash of the QASM text and simulator options
+- An optional on-disk pickle store, so restarted workers come back warm.
+  It is kept within a byte budget by deleting the least recently used
+  pickles (oldest modification time; disk hits refresh it). Pickles live
+  in a subdirectory named after the Qiskit and Aer versions, so an upgraded
+  worker never unpickles objects of another library version; directories
+  of other versions are deleted.
+"""
+import hashlib
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+import qiskit
+import qiskit_aer
+from qiskit import QuantumCircuit, qasm3, transpile
+from app.core.config import CIRCUIT_CACHE_DIR, CIRCUIT_CACHE_DISK_MAX_MB, CIRCUIT_CACHE_SIZE
+from app.core.metrics_buffer import metrics_buffer
+from app.workers.simulator_pool import simulator_pool
+
+logger = logging.getLogger("worker")
+
+CIRCUIT_CACHE_STATS_PREFIX = "stats:circuit_cache:"
+
+# Directives the simulator accepts without them being listed in its target
+_DIRECTIVES = {"barrier"}
+
+# Subdirectory of the disk tier holding pickles of the installed libraries
+_VERSION_PREFIX = "qiskit-"
+_VERSION_DIR = f"{_VERSION_PREFIX}{qiskit.__version__}-aer-{qiskit_aer.__version__}"
+
+# Pruning deletes pickles down to this fraction of the disk budget, so it
+# does not run again on the very next store
+_DISK_PRUNE_TARGET = 0.8
+
+
+class CircuitCache:
+    """
+    Two-tier (local LRU + optional disk) cache of prepared circuits.
+    """
+
+    def __init__(self, max_size: int, disk_dir: Optional[str] = None,
+                 disk_max_bytes: int = CIRCUIT_CACHE_DISK_MAX_MB * 1024 * 1024):
+        self.max_size = max_size
+        self.disk_dir = os.path.join(disk_dir, _VERSION_DIR) if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        # Entries are (circuit, seconds it took to prepare)
+        self._local: "OrderedDict[str, Tuple[QuantumCircuit, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # Bytes this process believes the disk tier holds; other processes
+        # write to the same directory, so pruning re-reads the real sizes
+        self._disk_bytes = 0
+        if disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            self._remove_other_versions(disk_dir)
+            self._prune_disk()
+
+    def get(self, qasm_str: str, **sim_options) -> QuantumCircuit:
+        """
+        Returns a simulator-ready circuit for the QASM text, parsing and
+        transpiling it only on a miss.
+        Args:
+            qasm_str (str): Quantum circuit as a QASM3 string.
+            **sim_options: Options of the simulator the circuit will run on.
+        Returns:
+            QuantumCircuit: Parsed (and, if needed, transpiled) circuit.
+        Raises:
+            Exception: Whatever `qasm3.loads` raises for invalid QASM.
+        """
+        key = self._key(qasm_str, sim_options)
+
+        entry = self._get_local(key)
+        if entry is None:
+            entry = self._load_disk(key)
+            if entry is not None:
+                self._set_local(key, entry)
+        if entry is not None:
+            self._record(hits=1, parse_time_saved_ms=entry[1] * 1000)
+            return entry[0]
+
+        start_time = time.perf_counter()
+        qc = self.prepare(qasm_str, **sim_options)
+        entry = (qc, time.perf_counter() - start_time)
+        self._set_local(key, entry)
+        self._store_disk(key, entry)
+        self._record(misses=1)
+        return qc
+
+    def clear_local(self):
+        """Drops every entry from the in-process tier"""
+        with self._lock:
+            self._local.clear()
+
+    @staticmethod
+    def prepare(qasm_str: str, **sim_options) -> QuantumCircuit:
+        """
+        Parses and, if needed, transpiles a circuit, bypassing the cache.
+        """
+        qc = qasm3.loads(qasm_str)
+        simulator = simulator_pool.get(**sim_options)
+        unsupported = {instruction.operation.name for instruction in qc.data} \
+            - set(simulator.target.operation_names) - _DIRECTIVES
+        if unsupported:
+            logger.debug(
+                f"Transpiling circuit for unsupported instructions: {sorted(unsupported)}")
+            qc = transpile(qc, simulator, optimization_level=0)
+        return qc
+
+    @staticmethod
+    def _key(qasm_str: str, sim_options: dict) -> str:
+        digest = hashlib.sha256(qasm_str.encode("utf-8"))
+        digest.update(repr(sorted(sim_options.items())).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _get_local(self, key: str):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                self._local.move_to_end(key)
+            return entry
+
+    def _set_local(self, key: str, entry):
+        with self._lock:
+            self._local[key] = entry
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_size:
+                self._local.popitem(last=False)
+
+    def _load_disk(self, key: str):
+        if not self.disk_dir:
+            return None
+        path = os.path.join(self.disk_dir, f"{key}.pkl")
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            # Mark the pickle as recently used, so pruning deletes it last
+            os.utime(path)
+            return entry
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cached circuit {path}: {str(e)}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _store_disk(self, key: str, entry):
+        if not self.disk_dir:
+            return
+        try:
+            # A worker of another version may have removed the directory
+            os.makedirs(self.disk_dir, exist_ok=True)
+            # Write to a temp file first so concurrent readers never see partial pickles
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                size = f.tell()
+            os.replace(tmp_path, os.path.join(self.disk_dir, f"{key}.pkl"))
+        except Exception as e:
+            logger.warning(f"Could not write circuit cache to disk: {str(e)}")
+            return
+        with self._lock:
+            self._disk_bytes += size
+            over_budget = self._disk_bytes > self.disk_max_bytes
+        if over_budget:
+            self._prune_disk()
+
+    @staticmethod
+    def _remove_other_versions(root: str):
+        """Deletes pickles written by other Qiskit or Aer versions"""
+        try:
+            with os.scandir(root) as it:
+                stale = [entry.path for entry in it if entry.is_dir()
+                         and entry.name.startswith(_VERSION_PREFIX) and entry.name != _VERSION_DIR]
+        except OSError as e:
+            logger.warning(f"Could not scan circuit cache directory: {str(e)}")
+            return
+        for path in stale:
+            logger.info(f"Removing circuit cache of another library version: {path}")
+            shutil.rmtree(path, ignore_errors=True)
+
+    def _prune_disk(self):
+        """
+        Deletes the least recently used pickles until the disk tier is
+        within the prune target of its budget.
+        """
+        entries = []
+        try:
+            with os.scandir(self.disk_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".pkl"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        except OSError as e:
+            logger.warning(f"Could not scan circuit cache directory: {str(e)}")
+            return
+
+        total = sum(size for _, size, _ in entries)
+        if total > self.disk_max_bytes:
+            target = self.disk_max_bytes * _DISK_PRUNE_TARGET
+            removed = 0
+            for _, size, path in sorted(entries):
+                if total <= target:
+                    break
+                try:
+                    os.remove(path)
+                    removed += 1
+                except FileNotFoundError:
+                    pass  # Pruned by another process
+                except OSError as e:
+                    logger.warning(f"Could not delete cached circuit {path}: {str(e)}")
+                    continue
+                total -= size
+            logger.info(f"Pruned {removed} cached circuit(s) from disk, {total} bytes left")
+        with self._lock:
+            self._disk_bytes = total
+
+    def _record(self, hits: int = 0, misses: int = 0, parse_time_saved_ms: float = 0.0):
+        # Buffered: written with the task's own metrics pipeline, not a round trip per lookup
+        counters = {}
+        if hits:
+            counters[CIRCUIT_CACHE_STATS_PREFIX + "hits"] = hits
+        if misses:
+            counters[CIRCUIT_CACHE_STATS_PREFIX + "misses"] = misses
+        if parse_time_saved_ms:
+            counters[CIRCUIT_CACHE_STATS_PREFIX + "parse_time_saved_ms"] = float(parse_time_saved_ms)
+        if counters:
+            metrics_buffer.record(counters)
+
+
+# Create a singleton cache for the current worker process
+circuit_cache = CircuitCache(
+    max_size=CIRCUIT_CACHE_SIZE,
+    disk_dir=CIRCUIT_CACHE_DIR or None,
+)
@@ -0,0 +1,79 @@
+"""
+heartbeat.py - Worker liveness reporting.
+
+The main worker process records a timestamp under its hostname in the
+`workers:heartbeat` Redis hash on a fixed interval. The API health prober
+reads the whole hash in one command, instead of broadcasting a control
+ping to every worker and waiting for the replies. Timestamps come from the
+Redis server's clock (TIME), which the prober compares them against, so
+clock skew between worker and API hosts does not affect liveness.
+"""
+import logging
+import threading
+from typing import Optional
+from app.core.config import WORKER_HEARTBEAT_SECONDS
+from app.core.redis_client import get_redis_client
+
+logger = logging.getLogger("worker")
+
+HEARTBEAT_KEY = "workers:heartbeat"
+
+# KEYS: heartbeat hash; ARGV: worker hostname
+# Stamps the worker with the Redis server time, as "<seconds>.<microseconds>"
+_HEARTBEAT_SCRIPT = """
+local now = redis.call('TIME')
+local stamp = now[1] .. '.' .. string.format('%06d', tonumber(now[2]))
+redis.call('HSET', KEYS[1], ARGV[1], stamp)
+return stamp
+"""
+
+
+class WorkerHeartbeat:
+    """
+    Background thread that refreshes this worker's heartbeat timestamp.
+    """
+
+    def __init__(self, interval: float = WORKER_HEARTBEAT_SECONDS):
+        self.interval = interval
+        self.hostname: Optional[str] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, hostname: str):
+        """
+        Starts beating for the given worker hostname, if not already running.
+        """
+        if self._thread is not None:
+            return
+        self.hostname = hostname
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="worker-heartbeat", daemon=True)
+        self._thread.start()
+        logger.info(f"Worker heartbeat started for {hostname}")
+
+    def stop(self):
+        """
+        Stops beating and removes this worker from the heartbeat hash.
+        """
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join(timeout=self.interval)
+        self._thread = None
+        try:
+            get_redis_client().hdel(HEARTBEAT_KEY, self.hostname)
+        except Exception as e:
+            logger.warning(f"Could not clear worker heartbeat: {str(e)}")
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                get_redis_client().eval(_HEARTBEAT_SCRIPT, 1, HEARTBEAT_KEY, self.hostname)
+            except Exception as e:
+                logger.warning(f"Could not send worker heartbeat: {str(e)}")
+            self._stopped.wait(self.interval)
+
+
+# Create a singleton heartbeat for the current worker
+worker_heartbeat = WorkerHeartbeat()
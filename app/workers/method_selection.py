@@ -0,0 +1,172 @@
+"""
+method_selection.py - Choice of the Aer simulation method for a circuit.
+
+All candidate methods are exact, so they differ only in cost:
+- stabilizer: polynomial time and memory, Clifford-only circuits
+- statevector: 16·2^n bytes, any circuit
+- matrix_product_state: memory set by the entanglement the circuit can
+  build. It is bounded here from the two-qubit gates crossing each cut of
+  the qubit chain, so wide circuits with little entanglement qualify.
+With `auto` the cheapest method whose memory fits the budget is chosen.
+Circuits that fit no method, or not the one requested, are rejected instead
+of exhausting the worker.
+"""
+import math
+from typing import Iterable, List
+from qiskit import QuantumCircuit
+from app.core.config import AER_WIDE_CIRCUIT_QUBITS, SIMULATION_MEMORY_BUDGET_MB
+
+AUTO = "auto"
+STABILIZER = "stabilizer"
+STATEVECTOR = "statevector"
+MATRIX_PRODUCT_STATE = "matrix_product_state"
+SIMULATION_METHODS = (AUTO, STATEVECTOR, STABILIZER, MATRIX_PRODUCT_STATE)
+
+BYTES_PER_AMPLITUDE = 16
+
+# Operations the stabilizer method executes exactly (rz only at multiples of pi/2)
+CLIFFORD_OPERATIONS = {
+    "id", "x", "y", "z", "h", "s", "sdg", "sx", "sxdg", "cx", "cy", "cz", "swap",
+    "ecr", "pauli", "rz", "measure", "reset", "barrier", "delay",
+}
+# Two-qubit gates with operator Schmidt rank 2 (one bit of entanglement);
+# any other multi-qubit gate is assumed to add up to two bits per qubit
+_RANK_TWO_GATES = {"cx", "cy", "cz", "ch", "cp", "crx", "cry", "crz", "cs", "csdg",
+                   "csx", "cu", "cu1", "cu3", "rxx", "ryy", "rzz", "rzx", "ecr"}
+_NON_UNITARY = {"measure", "reset", "barrier", "delay"}
+_CONTROL_FLOW = "control_flow"
+
+
+class SimulationMethodError(ValueError):
+    """Raised when no simulation method can run a circuit within the budget"""
+
+
+def select_method(qc: QuantumCircuit, requested: str = AUTO,
+                  memory_budget_mb: float = SIMULATION_MEMORY_BUDGET_MB,
+                  wide_circuit_qubits: int = AER_WIDE_CIRCUIT_QUBITS) -> str:
+    """
+    Returns the Aer simulation method to run a circuit with.
+    Args:
+        qc (QuantumCircuit): The parsed circuit.
+        requested (str): One of SIMULATION_METHODS.
+        memory_budget_mb (float): Memory the simulation state may take.
+        wide_circuit_qubits (int): Width from which a cheaper matrix product
+            state is preferred over a statevector that would fit.
+    Returns:
+        str: An Aer method name.
+    Raises:
+        SimulationMethodError: If the requested method cannot run the
+            circuit within the budget, or with `auto`, if no method fits it.
+    """
+    budget = memory_budget_mb * 1024 * 1024
+    clifford = is_clifford(qc)
+    statevector_bytes = statevector_memory(qc.num_qubits)
+    mps_bytes = mps_memory_bound(qc)
+
+    if requested == STABILIZER:
+        if not clifford:
+            raise SimulationMethodError(
+                "The stabilizer method only runs Clifford circuits "
+                "(h, s, sdg, sx, x, y, z, cx, cy, cz, swap, measure).")
+        return STABILIZER
+    if requested == STATEVECTOR:
+        if statevector_bytes > budget:
+            raise SimulationMethodError(
+                f"A {qc.num_qubits}-qubit statevector needs {_mb(statevector_bytes)}, "
+                f"over the {_mb(budget)} simulation memory budget.")
+        return STATEVECTOR
+    if requested == MATRIX_PRODUCT_STATE:
+        if mps_bytes > budget:
+            raise SimulationMethodError(
+                f"A matrix product state of this {qc.num_qubits}-qubit circuit may need up to "
+                f"{_mb(mps_bytes)}, over the {_mb(budget)} simulation memory budget.")
+        return MATRIX_PRODUCT_STATE
+    if requested != AUTO:
+        raise SimulationMethodError(f"Unknown simulation method '{requested}'.")
+
+    if clifford:
+        return STABILIZER
+    statevector_fits = statevector_bytes <= budget
+    mps_fits = mps_bytes <= budget
+    if statevector_fits and (qc.num_qubits < wide_circuit_qubits or mps_bytes >= statevector_bytes):
+        return STATEVECTOR
+    if mps_fits:
+        return MATRIX_PRODUCT_STATE
+    if statevector_fits:
+        return STATEVECTOR
+    raise SimulationMethodError(
+        f"Circuit does not fit the {_mb(budget)} simulation memory budget: a "
+        f"{qc.num_qubits}-qubit statevector needs {_mb(statevector_bytes)} and "
+        f"a matrix product state may need up to {_mb(mps_bytes)}.")
+
+
+def is_clifford(qc: QuantumCircuit) -> bool:
+    """
+    Returns True if every operation of the circuit is a Clifford operation.
+    """
+    for instruction in qc.data:
+        operation = instruction.operation
+        if operation.name not in CLIFFORD_OPERATIONS:
+            return False
+        if operation.name == "rz" and not _is_clifford_angle(operation.params[0]):
+            return False
+    return True
+
+
+def statevector_memory(num_qubits: int) -> int:
+    """Returns the bytes of a statevector of `num_qubits` qubits"""
+    return BYTES_PER_AMPLITUDE * 2 ** num_qubits
+
+
+def mps_memory_bound(qc: QuantumCircuit) -> int:
+    """
+    Returns an upper bound of the bytes of the circuit's matrix product state.
+    Each gate spanning a cut of the qubit chain can multiply the bond
+    dimension there by at most its operator Schmidt rank, and no bond can
+    exceed 2^min(qubits left, qubits right).
+    Returns:
+        int: Sum over the qubits of 16·2·(left bond)·(right bond) bytes.
+    """
+    n = qc.num_qubits
+    if n == 0:
+        return 0
+    # log2 of the bond dimension bound at each cut between qubit i and i+1
+    bond_bits = [0] * (n - 1)
+    for qubits, name in _gates(qc):
+        if len(qubits) < 2 or name in _NON_UNITARY:
+            continue
+        low, high = min(qubits), max(qubits)
+        if name == _CONTROL_FLOW:
+            # A loop may repeat its body any number of times: assume the worst
+            bits = n
+        elif name in _RANK_TWO_GATES:
+            bits = 1
+        else:
+            bits = 2 * (len(qubits) - 1)
+        for cut in range(low, high):
+            bond_bits[cut] += bits
+    bond_bits = [min(bits, cut + 1, n - cut - 1) for cut, bits in enumerate(bond_bits)]
+
+    bonds = [0] + bond_bits + [0]
+    return sum(BYTES_PER_AMPLITUDE * 2 * 2 ** (bonds[site] + bonds[site + 1])
+               for site in range(n))
+
+
+def _gates(qc: QuantumCircuit) -> Iterable[tuple]:
+    for instruction in qc.data:
+        operation = instruction.operation
+        qubits: List[int] = [qc.find_bit(qubit).index for qubit in instruction.qubits]
+        yield qubits, _CONTROL_FLOW if getattr(operation, "blocks", None) else operation.name
+
+
+def _is_clifford_angle(angle) -> bool:
+    try:
+        quarter_turns = float(angle) / (math.pi / 2)
+    except TypeError:
+        # Unbound parameter
+        return False
+    return math.isclose(quarter_turns, round(quarter_turns), abs_tol=1e-9)
+
+
+def _mb(num_bytes: float) -> str:
+    return f"{num_bytes / (1024 * 1024):,.1f} MiB"
@@ -0,0 +1,84 @@
+"""
+postprocessing.py - Reduction of raw simulator counts into task results.
+
+Counts are aggregated per distinct outcome rather than per shot: the
+outcome bitstrings are turned into a NumPy bit matrix once, the requested
+classical bits are selected as columns, and equal rows are summed. The cost
+therefore scales with the number of distinct outcomes, not with shots.
+"""
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+from qiskit import QuantumCircuit
+
+# Marginalization spec accepted from requests: "last", "none",
+# a classical register name, or a list of classical bit indices.
+Marginalization = Union[str, List[int]]
+
+LAST_BIT = "last"
+NO_MARGINALIZATION = "none"
+
+
+def resolve_clbits(marginalize: Marginalization, qc: QuantumCircuit) -> Optional[List[int]]:
+    """
+    Resolves a marginalization spec to classical bit indices of a circuit.
+    Args:
+        marginalize (Marginalization): Requested marginalization.
+        qc (QuantumCircuit): The executed circuit.
+    Returns:
+        Optional[List[int]]: Sorted bit indices to keep, or None to keep all bits.
+    Raises:
+        ValueError: If the spec refers to bits or registers the circuit lacks.
+    """
+    if marginalize == NO_MARGINALIZATION:
+        return None
+    if marginalize == LAST_BIT:
+        indices = [0]
+    elif isinstance(marginalize, str):
+        register = next(
+            (creg for creg in qc.cregs if creg.name == marginalize), None)
+        if register is None:
+            raise ValueError(
+                f"Circuit has no classical register named '{marginalize}'")
+        indices = [qc.find_bit(bit).index for bit in register]
+    else:
+        indices = list(marginalize)
+
+    if not indices:
+        raise ValueError("No classical bits selected for marginalization")
+    out_of_range = [i for i in indices if not 0 <= i < qc.num_clbits]
+    if out_of_range:
+        raise ValueError(
+            f"Classical bit indices {out_of_range} out of range for a circuit "
+            f"with {qc.num_clbits} classical bits")
+    return sorted(set(indices))
+
+
+def marginalize_counts(raw_counts: Dict[str, int], clbits: Optional[Sequence[int]]) -> Dict[str, int]:
+    """
+    Sums counts over every classical bit not in `clbits`.
+    Outcome keys keep Qiskit's ordering: the highest selected bit is leftmost.
+    Args:
+        raw_counts (Dict[str, int]): Counts as returned by Result.get_counts().
+        clbits (Optional[Sequence[int]]): Sorted bit indices to keep, None for all.
+    Returns:
+        Dict[str, int]: Marginal counts.
+    """
+    if clbits is None or not raw_counts:
+        return {key: int(count) for key, count in raw_counts.items()}
+
+    # Register separators carry no information once bits are indexed globally
+    keys = [key.replace(" ", "") for key in raw_counts]
+    width = len(keys[0])
+    bits = np.frombuffer("".join(keys).encode("ascii"),
+                         dtype=np.uint8).reshape(len(keys), width)
+    counts = np.fromiter(raw_counts.values(), dtype=np.int64, count=len(keys))
+
+    # Bit i is the i-th character from the right of each key
+    columns = width - 1 - np.asarray(clbits[::-1])
+    outcomes, inverse = np.unique(
+        bits[:, columns], axis=0, return_inverse=True)
+    totals = np.zeros(len(outcomes), dtype=np.int64)
+    np.add.at(totals, inverse.ravel(), counts)
+
+    return {row.tobytes().decode("ascii"): int(total)
+            for row, total in zip(outcomes, totals)}
@@ -0,0 +1,90 @@
+"""
+profiling.py - Opt-in cProfile capture of worker tasks.
+
+A task is profiled when it is sampled (PROFILE_SAMPLE_RATE) or, when a
+latency threshold is set, always, keeping the profile only if the task ran
+slower than PROFILE_LATENCY_THRESHOLD_MS. Kept profiles are stored in Redis
+under `profile:{task_id}` as marshalled pstats data, the format written by
+`pstats.Stats.dump_stats`, and served by `/metrics/profiles/{task_id}`.
+With both settings at 0 no profiler is ever created.
+"""
+import cProfile
+import logging
+import marshal
+import random
+from contextlib import contextmanager
+from typing import Optional
+from app.core.config import PROFILE_LATENCY_THRESHOLD_MS, PROFILE_SAMPLE_RATE, PROFILE_TTL
+
+logger = logging.getLogger("worker")
+
+
+class TaskProfiler:
+    """
+    Decides which tasks to profile and stores the captured profiles.
+    """
+
+    def __init__(self, sample_rate: float = PROFILE_SAMPLE_RATE,
+                 latency_threshold_ms: float = PROFILE_LATENCY_THRESHOLD_MS,
+                 ttl: int = PROFILE_TTL):
+        self.sample_rate = sample_rate
+        self.latency_threshold = latency_threshold_ms / 1000
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0 or self.latency_threshold > 0
+
+    @contextmanager
+    def profile(self):
+        """
+        Profiles the enclosed block if the current task is selected.
+        Yields:
+            Optional[cProfile.Profile]: The profiler, None if not profiled.
+        """
+        profiler = self._start()
+        try:
+            yield profiler
+        finally:
+            if profiler is not None:
+                profiler.disable()
+
+    def store(self, profiler: Optional[cProfile.Profile], pipe, task_id: str, execution_time: float) -> bool:
+        """
+        Queues a finished profile on `pipe` if it is kept.
+        Args:
+            profiler (Optional[cProfile.Profile]): Value yielded by `profile`.
+            pipe: Redis pipeline the task's metadata is written with.
+            task_id (str): Task identifier.
+            execution_time (float): Task duration in seconds.
+        Returns:
+            bool: Whether a profile was stored.
+        """
+        if profiler is None:
+            return False
+        if not profiler.sampled and execution_time < self.latency_threshold:
+            return False
+        profiler.create_stats()
+        pipe.set(f"profile:{task_id}", marshal.dumps(profiler.stats), ex=self.ttl)
+        return True
+
+    def _start(self) -> Optional[cProfile.Profile]:
+        if not self.enabled:
+            return None
+        sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        if not sampled and self.latency_threshold <= 0:
+            return None
+        profiler = cProfile.Profile()
+        # Remember why the task is profiled, to decide whether to keep it
+        profiler.sampled = sampled
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Another profiler is already active in this thread
+            logger.debug(f"Task profiling skipped: {str(e)}")
+            return None
+        return profiler
+
+
+# Create a singleton profiler for the current worker process
+task_profiler = TaskProfiler()
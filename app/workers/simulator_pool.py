@@ -0,0 +1,138 @@
+"""
+simulator_pool.py - Long-lived AerSimulator instances for a worker process.
+
+Building an AerSimulator and running its first circuit pays lazy backend
+initialization. The pool keeps one simulator per set of simulation options
+for the lifetime of the process and warms it with a trivial circuit, so
+tasks only pay for their own circuit.
+"""
+import logging
+import os
+import threading
+import time
+from typing import Dict, Tuple
+from qiskit import QuantumCircuit
+from qiskit_aer import AerSimulator
+from app.core.config import AER_WIDE_CIRCUIT_QUBITS
+from app.core.resources import available_cpus
+
+logger = logging.getLogger("worker")
+
+_OptionsKey = Tuple[Tuple[str, object], ...]
+
+
+def _warm_up_circuit() -> QuantumCircuit:
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    return qc
+
+
+class SimulatorPool:
+    """
+    Per-process cache of warmed AerSimulator instances keyed by options.
+    Also owns the process's share of the CPUs, which Aer's parallelism is
+    kept within so that concurrent worker processes never oversubscribe.
+    """
+
+    def __init__(self, wide_circuit_qubits: int = AER_WIDE_CIRCUIT_QUBITS):
+        self.wide_circuit_qubits = wide_circuit_qubits
+        self.thread_budget = available_cpus()
+        self._simulators: Dict[_OptionsKey, AerSimulator] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def set_process_count(self, processes: int):
+        """
+        Splits the available CPUs evenly among the worker's processes.
+        Args:
+            processes (int): Number of processes executing circuits concurrently.
+        """
+        self.thread_budget = max(available_cpus() // max(processes, 1), 1)
+
+    def parallel_options(self, num_qubits: int) -> Dict[str, int]:
+        """
+        Returns Aer run options spending this process's threads where they
+        help for a circuit of the given width.
+        Args:
+            num_qubits (int): Width of the widest circuit in the run.
+        Returns:
+            Dict[str, int]: max_parallel_threads/experiments/shots options.
+        """
+        threads = self.thread_budget
+        if num_qubits >= self.wide_circuit_qubits:
+            # One large statevector: every thread works on its updates
+            return {
+                "max_parallel_threads": threads,
+                "max_parallel_experiments": 1,
+                "max_parallel_shots": 1,
+            }
+        # Small statevectors gain nothing from threads; run experiments and shots side by side
+        return {
+            "max_parallel_threads": threads,
+            "max_parallel_experiments": threads,
+            "max_parallel_shots": threads,
+        }
+
+    def get(self, **options) -> AerSimulator:
+        """
+        Returns the simulator for the given options, creating and warming
+        it on first use.
+        Args:
+            **options: AerSimulator construction options (e.g. method).
+        Returns:
+            AerSimulator: A ready-to-run simulator.
+        """
+        self._check_pid()
+        key = self._key(options)
+        simulator = self._simulators.get(key)
+        if simulator is None:
+            with self._lock:
+                simulator = self._simulators.get(key)
+                if simulator is None:
+                    simulator = self._create(options)
+                    self._simulators[key] = simulator
+        return simulator
+
+    def warm_up(self, **options):
+        """
+        Eagerly creates the simulator for the given options.
+        """
+        self.get(**options)
+
+    def invalidate(self, **options):
+        """
+        Drops the simulator for the given options, or every simulator if no
+        options are given, so the next task rebuilds it from scratch.
+        """
+        with self._lock:
+            if options:
+                self._simulators.pop(self._key(options), None)
+            else:
+                self._simulators.clear()
+        logger.warning(
+            f"Invalidated simulator pool entries: {options or 'all'}")
+
+    def _create(self, options: dict) -> AerSimulator:
+        start_time = time.perf_counter()
+        simulator = AerSimulator(**options)
+        simulator.run(_warm_up_circuit(), shots=1).result()
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        logger.info(
+            f"Created and warmed AerSimulator {options or '(defaults)'} in {elapsed_ms:.1f}ms")
+        return simulator
+
+    def _check_pid(self):
+        # Simulators must never be shared across a fork
+        if self._pid != os.getpid():
+            with self._lock:
+                self._simulators.clear()
+                self._pid = os.getpid()
+
+    @staticmethod
+    def _key(options: dict) -> _OptionsKey:
+        return tuple(sorted(options.items()))
+
+
+# Create a singleton pool for the current worker process
+simulator_pool = SimulatorPool()
@@ -0,0 +1,133 @@
+"""
+startup.py - Fast worker startup and startup-time metrics.
+
+Preloading (WORKER_PRELOAD): before the prefork pool forks, the worker's main
+process runs the imports Qiskit defers to first use. The main one is the
+QASM3 importer and its ANTLR parser, loaded by the first parse rather than by
+`import qiskit.qasm3`. Pool processes then share those pages copy-on-write
+instead of loading them before their first task. That includes processes
+replacing recycled ones (WORKER_MAX_TASKS_PER_CHILD). `gc.freeze()` then
+moves every object the main process holds out of the collector's reach, so
+collections in the pool processes do not write to the shared pages, which
+would copy them. Nothing is simulated in the main process: Aer's OpenMP
+threads must not be forked.
+
+Startup durations are recorded per phase (`qc_worker_startup_seconds`):
+- preload: the main process preloading
+- worker_ready: worker start to consuming tasks
+- process_ready: fork to a pool process having warmed its simulators
+- cold_start: worker start to the first finished task of a process started
+  with the worker (or of a solo worker); includes waiting for that task
+- restart: fork to the first finished task of a process that replaced another
+"""
+import gc
+import logging
+import os
+import time
+from typing import Optional
+from celery.signals import task_postrun, worker_ready
+from app.core.telemetry import observe_startup
+
+logger = logging.getLogger("worker")
+
+# Uses the standard gates, a parameter and measurement, so parsing it
+# loads everything a real circuit's first parse would
+_PRELOAD_QASM = """
+OPENQASM 3.0;
+include "stdgates.inc";
+input float theta;
+qubit[2] q;
+bit[2] c;
+h q[0];
+cx q[0], q[1];
+rz(theta) q[1];
+c = measure q;
+"""
+
+
+def _process_start_time() -> Optional[float]:
+    """Unix time the current process started, read from /proc (Linux only)"""
+    try:
+        with open("/proc/self/stat") as f:
+            # starttime is field 22, in clock ticks since boot; fields restart after the command name
+            start_ticks = int(f.read().rsplit(")", 1)[1].split()[19])
+        age = time.clock_gettime(time.CLOCK_BOOTTIME) - start_ticks / os.sysconf("SC_CLK_TCK")
+        return time.time() - age
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+# Start of the worker's main process, inherited by pool processes through fork;
+# without /proc, this module's import stands in for it
+_worker_started_at = _process_start_time() or time.time()
+# Set in pool processes: when they were forked, and whether the worker was
+# already consuming then, i.e. the process replaces one that exited
+_forked_at: Optional[float] = None
+_replacement = False
+_worker_consuming = False
+_first_task_done = False
+
+
+def _after_fork():
+    global _forked_at, _replacement, _first_task_done
+    _forked_at = time.time()
+    _replacement = _worker_consuming
+    _first_task_done = False
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def preload_simulation_stack():
+    """
+    Loads Qiskit, Aer and the QASM3 importer in the worker's main process,
+    then freezes the garbage collector's view of them. Call before forking.
+    """
+    start_time = time.perf_counter()
+    import qiskit_aer  # noqa: F401
+    from qiskit import qasm3
+    from qiskit.transpiler import preset_passmanagers  # noqa: F401
+    qasm3.loads(_PRELOAD_QASM)
+    gc.collect()
+    gc.freeze()
+    elapsed = time.perf_counter() - start_time
+    observe_startup("preload", elapsed)
+    logger.info(f"Preloaded the simulation stack in {elapsed:.2f}s "
+                f"({gc.get_freeze_count()} objects frozen for copy-on-write sharing)")
+
+
+def process_ready():
+    """
+    Records how long a pool process took from fork to ready for tasks.
+    """
+    if _forked_at is not None:
+        observe_startup("process_ready", time.time() - _forked_at)
+
+
+@worker_ready.connect
+def record_worker_ready(**kwargs):
+    """
+    Records the worker's startup time and marks later forks as replacements.
+    """
+    global _worker_consuming
+    _worker_consuming = True
+    elapsed = time.time() - _worker_started_at
+    observe_startup("worker_ready", elapsed)
+    logger.info(f"Worker consuming tasks {elapsed:.2f}s after start")
+
+
+@task_postrun.connect
+def record_first_task(**kwargs):
+    """
+    Records the time to this process's first finished task.
+    """
+    global _first_task_done
+    if _first_task_done:
+        return
+    _first_task_done = True
+    if _replacement:
+        phase, elapsed = "restart", time.time() - _forked_at
+    else:
+        phase, elapsed = "cold_start", time.time() - _worker_started_at
+    observe_startup(phase, elapsed)
+    logger.info(f"First task finished {elapsed:.2f}s after {'fork' if _replacement else 'worker start'}")
@@ -1,14 +1,68 @@
 import time
 import logging
 import functools
+from celery.signals import task_failure, task_success
+from app.core.blob_store import EXTERNAL_RESULT_MESSAGE, blob_reference
+from app.core.config import TASK_EVENTS_CHANNEL
 from app.core.redis_client import get_redis_client
+from app.core.metrics_buffer import metrics_buffer
+from app.core.serialization import dumps_json
+from app.core.submissions import submission_registry
+from app.core.telemetry import collect_stages, record_stage, routing_fields
+from app.workers.profiling import task_profiler
 
 logger = logging.getLogger("worker")
 
 
+def publish_task_event(redis, task_id: str, status: str, result=None, message: str = None):
+    """
+    Publishes a task completion event for SSE/WebSocket subscribers.
+    The event carries the same fields as the task status response, so
+    subscribers never have to poll the result backend. Results kept in the
+    blob store are not pushed; the event points to the result endpoint instead.
+    """
+    if blob_reference(result) is not None:
+        result, message = None, EXTERNAL_RESULT_MESSAGE.format(task_id=task_id)
+    event = {"task_id": task_id, "status": status}
+    if result is not None:
+        event["result"] = result
+    if message is not None:
+        event["message"] = message
+    redis.publish(TASK_EVENTS_CHANNEL, dumps_json(event))
+
+
+# Task events go out once Celery has stored the result, so a subscriber that
+# misses the event always finds the final state in the result backend
+@task_success.connect
+def notify_task_completed(sender=None, result=None, **kwargs):
+    try:
+        publish_task_event(get_redis_client(), sender.request.id, "completed", result=result)
+    except Exception as e:
+        logger.warning(f"Could not publish task completion: {str(e)}")
+
+
+@task_failure.connect
+def notify_task_failed(task_id=None, **kwargs):
+    try:
+        publish_task_event(get_redis_client(), task_id, "error",
+                           message="Task not found or failed.")
+    except Exception as e:
+        logger.warning(f"Could not publish task failure: {str(e)}")
+
+
+def stage_fields(stages: dict) -> dict:
+    """
+    Formats per-stage durations as task metadata fields, e.g. simulate_ms.
+    """
+    return {f'{stage}_ms': round(seconds * 1000, 3) for stage, seconds in stages.items()}
+
+
 def task_with_metrics(task_func):
     """
-    Decorator for Celery tasks to add timing metrics and error tracking
+    Decorator for Celery tasks to add timing metrics and error tracking.
+    Each lifecycle event (start, completion, failure) is written as one
+    MULTI/EXEC transaction, i.e. a single Redis round trip, and execution
+    time is kept as an exact sum and count rather than a running average.
     """
     @functools.wraps(task_func)
     def wrapper(self, *args, **kwargs):
@@ -18,17 +72,38 @@ def task_with_metrics(task_func):
         # Log task start
         logger.info(f"Task {task_name}[{task_id}] started")
 
-        # Update metrics - increment total tasks
+        # Per-stage durations, stored with the task metadata
+        stages = {}
+
+        # Time spent in the broker queue, from the dispatcher's enqueue timestamp
+        enqueued_at = self.request.get('enqueued_at')
+        if enqueued_at is not None:
+            stages['queue_wait'] = max(time.time() - float(enqueued_at), 0.0)
+            record_stage('queue_wait', stages['queue_wait'])
+
+        # Queue tier and runtime estimate chosen by the dispatcher's cost estimator
+        queue = (self.request.delivery_info or {}).get('routing_key')
+        estimated_runtime_ms = self.request.get('estimated_runtime_ms')
+
+        # Claim that lets identical submissions join this task while it runs
+        inflight_key = self.request.get('inflight_key')
+
+        # Update metrics - count the task as started and running
         try:
-            redis = get_redis_client()
-            redis.incr('stats:total_tasks')
+            pipe = get_redis_client().pipeline(transaction=True)
+            metrics_buffer.add(pipe, **{
+                'stats:total_tasks': 1,
+                'stats:active_tasks': 1,
+            })
+            pipe.execute()
         except Exception as e:
             logger.warning(f"Could not update task metrics: {str(e)}")
 
-        # Execute task with timing
+        # Execute task with timing (and profiling, if selected)
         start_time = time.time()
         try:
-            result = task_func(self, *args, **kwargs)
+            with collect_stages(stages), task_profiler.profile() as profiler:
+                result = task_func(self, *args, **kwargs)
             execution_time = time.time() - start_time
 
             # Log task completion
@@ -37,30 +112,36 @@ def task_with_metrics(task_func):
 
             # Update metrics
             try:
-                redis = get_redis_client()
-
-                # Increment completed tasks counter
-                redis.incr('stats:completed_tasks')
-
-                # Update average execution time (simple moving average)
-                current_avg = float(redis.get('stats:avg_execution_time') or 0)
-                count = int(redis.get('stats:completed_tasks') or 1)
-                # Simple moving average calculation
-                new_avg = current_avg + (execution_time - current_avg) / count
-                redis.set('stats:avg_execution_time', new_avg)
-
-                # Store task metadata
-                redis.hset(
+                pipe = get_redis_client().pipeline(transaction=True)
+
+                # Move the task from running to completed, and add its time;
+                # tasks routed by cost also feed the per-queue estimate accuracy
+                routing = routing_fields(queue, float(estimated_runtime_ms), execution_time * 1000) \
+                    if queue and estimated_runtime_ms is not None else None
+                metrics_buffer.add(pipe, routing, **{
+                    'stats:active_tasks': -1,
+                    'stats:completed_tasks': 1,
+                    'stats:execution_time_sum': float(execution_time),
+                    'stats:execution_time_count': 1,
+                })
+
+                # Store task metadata, expired after 1 hour
+                pipe.hset(
                     f'task:{task_id}',
                     mapping={
                         'name': task_name,
                         'status': 'completed',
                         'execution_time': execution_time,
-                        'completed_at': time.time()
+                        'completed_at': time.time(),
+                        **stage_fields(stages),
                     }
                 )
-                # Expire task metadata after 1 hour
-                redis.expire(f'task:{task_id}', 3600)
+                if task_profiler.store(profiler, pipe, task_id, execution_time):
+                    pipe.hset(f'task:{task_id}', 'profiled', 1)
+                pipe.expire(f'task:{task_id}', 3600)
+                if inflight_key:
+                    submission_registry.release_inflight(pipe, inflight_key, task_id)
+                pipe.execute()
 
             except Exception as e:
                 logger.warning(
@@ -79,22 +160,30 @@ def task_with_metrics(task_func):
 
             # Update metrics
             try:
-                redis = get_redis_client()
-                redis.incr('stats:failed_tasks')
-
-                # Store task metadata
-                redis.hset(
+                pipe = get_redis_client().pipeline(transaction=True)
+                metrics_buffer.add(pipe, **{
+                    'stats:active_tasks': -1,
+                    'stats:failed_tasks': 1,
+                })
+
+                # Store task metadata, expired after 1 day (keep failures longer for debugging)
+                pipe.hset(
                     f'task:{task_id}',
                     mapping={
                         'name': task_name,
                         'status': 'failed',
                         'error': str(e),
                         'execution_time': execution_time,
-                        'failed_at': time.time()
+                        'failed_at': time.time(),
+                        **stage_fields(stages),
                     }
                 )
-                # Expire task metadata after 1 day (keep failures longer for debugging)
-                redis.expire(f'task:{task_id}', 86400)
+                if task_profiler.store(profiler, pipe, task_id, execution_time):
+                    pipe.hset(f'task:{task_id}', 'profiled', 1)
+                pipe.expire(f'task:{task_id}', 86400)
+                if inflight_key:
+                    submission_registry.release_inflight(pipe, inflight_key, task_id)
+                pipe.execute()
 
             except Exception as err:
                 logger.warning(
@@ -2,50 +2,406 @@
 tasks.py - Celery worker logic for executing QASM3 quantum circuits.
 
 Responsible for:
-- Parsing QASM3 input
+- Parsing QASM3 input (through the parsed circuit cache)
+- Choosing the simulation method (see method_selection.py)
 - Executing with Qiskit AerSimulator
-- Formatting result counts
+- Executing batches of circuits in a single simulator call
+- Executing a parameterized circuit for many parameter sets in one call
+- Reducing result counts (marginalization)
+- Caching results by circuit fingerprint
+- A null executor (CIRCUIT_EXECUTOR=null) that skips all of the above, for
+  measuring orchestration overhead in benchmarks
 """
 import logging
-from collections import Counter
+from collections import defaultdict
+from typing import Dict, List, Mapping, Optional
+from celery import states
+from celery.signals import (
+    celeryd_after_setup,
+    task_failure,
+    worker_process_init,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
+from app.core.blob_store import offload_result
 from app.core.celery_app import celery_app
-from qiskit import qasm3, QuantumCircuit
-from qiskit_aer import AerSimulator
+from app.core.config import CIRCUIT_EXECUTOR, DEFAULT_SHOTS, WORKER_PRELOAD
+from app.core.fingerprint import circuit_fingerprint
+from app.core.logging_config import CappedRepr
+from app.core.metrics_buffer import metrics_buffer
+from app.core.redis_client import get_redis_client
+from app.core.result_cache import cacheable, result_cache
+from app.core.telemetry import count_circuit, stage_timer
+from app.workers.circuit_cache import circuit_cache
+from app.workers.heartbeat import worker_heartbeat
+from app.workers.method_selection import (
+    AUTO,
+    SIMULATION_METHODS,
+    STATEVECTOR,
+    SimulationMethodError,
+    select_method,
+)
+from app.workers.postprocessing import (
+    LAST_BIT,
+    Marginalization,
+    marginalize_counts,
+    resolve_clbits,
+)
+from app.workers.simulator_pool import simulator_pool
+from app.workers.startup import preload_simulation_stack, process_ready
+from app.workers.task_wrapper import publish_task_event, task_with_metrics
+from qiskit import QuantumCircuit
 
 logger = logging.getLogger("worker")
 
+NULL_EXECUTOR = "null"
 
-def execute_quantum_circuit(qasm_str: str) -> dict:
+
+@celeryd_after_setup.connect
+def init_worker(sender=None, instance=None, **kwargs):
+    """
+    Splits the CPUs among the worker's pool processes before they fork.
+    A solo pool runs one circuit at a time and gets every CPU.
+    With WORKER_PRELOAD, the simulation stack is loaded once here, for the
+    pool processes to share (see startup.py).
+    """
+    processes = 1 if instance.pool_cls.__module__.endswith(".solo") else instance.concurrency
+    simulator_pool.set_process_count(processes)
+    logger.info(
+        f"Worker executes {processes} circuit(s) at a time with up to "
+        f"{simulator_pool.thread_budget} simulator thread(s) each")
+    if WORKER_PRELOAD and CIRCUIT_EXECUTOR != NULL_EXECUTOR:
+        preload_simulation_stack()
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs):
+    """
+    Creates and warms the default simulator and one per simulation method
+    as soon as the worker process starts, so the first task does not pay
+    backend cold-start cost.
+    """
+    simulator_pool.warm_up()
+    for method in SIMULATION_METHODS:
+        if method != AUTO:
+            simulator_pool.warm_up(method=method)
+    process_ready()
+
+
+@worker_process_shutdown.connect
+def shutdown_worker_process(**kwargs):
+    """
+    Flushes buffered metrics before the worker process exits.
+    """
+    metrics_buffer.flush()
+
+
+@worker_ready.connect
+def start_worker_heartbeat(sender=None, **kwargs):
+    """
+    Starts reporting liveness once the worker consumes tasks.
+    """
+    worker_heartbeat.start(sender.hostname)
+
+
+@worker_shutdown.connect
+def stop_worker_heartbeat(**kwargs):
+    """
+    Stops reporting liveness and deregisters the worker.
+    """
+    worker_heartbeat.stop()
+
+
+def execute_quantum_circuit(qasm_str: str, marginalize: Marginalization = LAST_BIT,
+                            shots: int = DEFAULT_SHOTS, seed: Optional[int] = None,
+                            method: str = AUTO,
+                            parameter_binds: Optional[List[Mapping[str, float]]] = None) -> dict:
     """
     Parses and executes a QASM3 circuit using Qiskit AerSimulator.
     Args:
         qasm_str (str): A valid quantum circuit in QASM3 format.
+        marginalize (Marginalization): Classical bits to keep in the result.
+        shots (int): Number of shots.
+        seed (Optional[int]): Simulator seed, if any.
+        method (str): Simulation method, or "auto" to choose one for the circuit.
+        parameter_binds (Optional[List[Mapping[str, float]]]): Values of the
+            circuit's input parameters per run; all runs share one simulator call.
     Returns:
-        dict: Reduced counts result (final bit outcomes) or error payload.
+        dict: Reduced counts result (final bit outcomes by default), or
+            {"counts": [...]} with one reduced result per parameter set,
+            or error payload.
     """
+    if CIRCUIT_EXECUTOR == NULL_EXECUTOR:
+        return null_result(shots, parameter_binds)
+    options = {"parameter_binds": parameter_binds} if parameter_binds is not None else {}
+    fingerprint = circuit_fingerprint(
+        qasm_str, shots=shots, seed=seed, marginalize=marginalize, method=method, **options)
+    cached = result_cache.get(fingerprint) if cacheable(seed) else None
+    if cached is not None:
+        logger.info(f"Result cache hit for circuit {fingerprint[:12]}")
+        count_circuit("cached")
+        return cached
+
+    qc: Optional[QuantumCircuit] = None
     try:
-        # Deserialize QASM3 to QuantumCircuit
-        qc: QuantumCircuit = qasm3.loads(qasm_str)
-        # Run the circuit on AerSimulator
-        simulator = AerSimulator()
-        result = simulator.run(qc, shots=1024).result()
-        raw_counts = result.get_counts()
-        logger.info(f"Raw execution result: {raw_counts}")
-       # Reduce to single-bit outcomes (last bit only)
-        reduced = Counter(bit[-1]
-                          for bit in raw_counts for _ in range(raw_counts[bit]))
-        logger.info(f"Reduced result: {dict(reduced)}")
-        return dict(reduced)
+        # Deserialize QASM3 to QuantumCircuit (cached per QASM text)
+        with stage_timer("parse"):
+            qc, simulation_method = prepare_circuit(qasm_str, method)
+            clbits = resolve_clbits(marginalize, qc)
+            if parameter_binds is not None:
+                binds = bind_parameters(qc, parameter_binds)
+            elif qc.parameters:
+                raise ValueError(
+                    f"Circuit has input parameters {sorted(p.name for p in qc.parameters)}; "
+                    f"submit their values in parameter_binds.")
+            else:
+                binds = None
+        # Run the circuit on the process-wide AerSimulator
+        result = run_circuits(qc, simulation_method, shots=shots, seed=seed, parameter_binds=binds)
+        with stage_timer("postprocess"):
+            if binds is None:
+                raw_counts = result.get_counts()
+                logger.debug("Raw execution result: %s", CappedRepr(raw_counts))
+                reduced = marginalize_counts(raw_counts, clbits)
+            else:
+                # One experiment per parameter set, in submission order
+                reduced = {"counts": [marginalize_counts(result.get_counts(run), clbits)
+                                      for run in range(len(parameter_binds))]}
+        logger.debug("Reduced result: %s", CappedRepr(reduced))
+        if cacheable(seed):
+            result_cache.set(fingerprint, reduced)
+        count_circuit("completed", qc.num_qubits)
+        return reduced
 
+    except SimulationMethodError as e:
+        logger.warning(f"Rejected circuit: {str(e)}")
+        count_circuit("failed", qc.num_qubits if qc is not None else None)
+        return error_payload(e)
     except Exception as e:
         logger.exception("Failed to parse or execute QASM3 circuit")
-        error_msg = str(e) or e.__class__.__name__
-        return {"error": f"QASM3 execution failed: {error_msg}"}
+        count_circuit("failed", qc.num_qubits if qc is not None else None)
+        return error_payload(e)
 
 
-@celery_app.task(name="app.workers.tasks.execute_circuit_task")
-def execute_circuit_task(qasm_str: str) -> dict:
+def execute_quantum_circuits(qasm_list: List[str], marginalize: Marginalization = LAST_BIT,
+                             shots: int = DEFAULT_SHOTS, seed: Optional[int] = None,
+                             method: str = AUTO) -> List[dict]:
     """
-    Celery task to run a QASM3 quantum circuit.
+    Parses and executes many QASM3 circuits with one AerSimulator run per
+    simulation method in use.
+    Circuits that fail to parse get an error payload without affecting the rest.
+    Args:
+        qasm_list (List[str]): Valid quantum circuits in QASM3 format.
+        marginalize (Marginalization): Classical bits to keep in each result.
+        shots (int): Number of shots per circuit.
+        seed (Optional[int]): Simulator seed, if any.
+        method (str): Simulation method, or "auto" to choose one per circuit.
+    Returns:
+        List[dict]: Reduced counts result or error payload per circuit, in order.
     """
-    return execute_quantum_circuit(qasm_str)
+    if CIRCUIT_EXECUTOR == NULL_EXECUTOR:
+        return [null_result(shots) for _ in qasm_list]
+    fingerprints = [circuit_fingerprint(qasm_str, shots=shots, seed=seed,
+                                        marginalize=marginalize, method=method)
+                    for qasm_str in qasm_list]
+    results = result_cache.get_many(fingerprints) if cacheable(seed) else [None] * len(fingerprints)
+
+    # Circuits to run, with their kept bits and batch position, per method
+    groups: Dict[str, List[tuple]] = defaultdict(list)
+    for index, (qasm_str, cached) in enumerate(zip(qasm_list, results)):
+        if cached is not None:
+            count_circuit("cached")
+            continue
+        try:
+            with stage_timer("parse"):
+                qc, simulation_method = prepare_circuit(qasm_str, method)
+                groups[simulation_method].append((qc, resolve_clbits(marginalize, qc), index))
+        except Exception as e:
+            logger.warning(f"Failed to parse circuit {index} of batch: {str(e)}")
+            count_circuit("failed")
+            results[index] = error_payload(e)
+
+    computed = {}
+    for simulation_method, group in groups.items():
+        circuits = [qc for qc, _, _ in group]
+        try:
+            result = run_circuits(circuits, simulation_method, shots=shots, seed=seed)
+            for experiment, (qc, clbits, index) in enumerate(group):
+                with stage_timer("postprocess"):
+                    results[index] = marginalize_counts(result.get_counts(experiment), clbits)
+                computed[fingerprints[index]] = results[index]
+                count_circuit("completed", qc.num_qubits)
+        except Exception as e:
+            logger.exception(f"Failed to execute QASM3 circuit batch ({simulation_method})")
+            for qc, _, index in group:
+                results[index] = error_payload(e)
+                count_circuit("failed", qc.num_qubits)
+
+    if groups:
+        executed = sum(len(group) for group in groups.values())
+        logger.info(
+            f"Executed {executed} circuits in {len(groups)} simulator run(s) "
+            f"({len(qasm_list) - executed} cached or invalid)")
+        if cacheable(seed):
+            result_cache.set_many(computed)
+    return results
+
+
+def prepare_circuit(qasm_str: str, method: str = AUTO):
+    """
+    Parses a circuit and chooses its simulation method.
+    Args:
+        qasm_str (str): Quantum circuit as a QASM3 string.
+        method (str): Requested simulation method, or "auto".
+    Returns:
+        tuple: The circuit, ready for the chosen method, and the method.
+    Raises:
+        SimulationMethodError: If the circuit cannot run with the requested
+            method, or fits no method within the memory budget.
+    """
+    qc = circuit_cache.get(qasm_str)
+    simulation_method = select_method(qc, method)
+    if simulation_method != STATEVECTOR:
+        # Transpiled for the method's own instruction set if needed
+        qc = circuit_cache.get(qasm_str, method=simulation_method)
+    return qc, simulation_method
+
+
+def bind_parameters(qc: QuantumCircuit, parameter_binds: List[Mapping[str, float]]) -> list:
+    """
+    Converts per-run parameter values to Aer's `parameter_binds` format.
+    Args:
+        qc (QuantumCircuit): The parameterized circuit.
+        parameter_binds (List[Mapping[str, float]]): Values by parameter name, per run.
+    Returns:
+        list: One {Parameter: [value per run]} table for the circuit.
+    Raises:
+        ValueError: If a parameter set does not name exactly the circuit's parameters.
+    """
+    parameters = {parameter.name: parameter for parameter in qc.parameters}
+    if not parameters:
+        raise ValueError("parameter_binds given, but the circuit has no input parameters.")
+    table = {parameter: [] for parameter in parameters.values()}
+    for run, values in enumerate(parameter_binds):
+        if values.keys() != parameters.keys():
+            raise ValueError(
+                f"Parameter set {run} must bind exactly {sorted(parameters)}, "
+                f"got {sorted(values)}.")
+        for name, value in values.items():
+            table[parameters[name]].append(value)
+    return [table]
+
+
+def run_circuits(circuits, method: str = STATEVECTOR, shots: int = DEFAULT_SHOTS,
+                 seed: Optional[int] = None, parameter_binds: Optional[list] = None):
+    """
+    Runs one or more circuits on the pooled simulator for a method, within
+    this process's share of the CPUs.
+    With `parameter_binds`, Aer runs one experiment per parameter set.
+    A failing simulator is dropped from the pool, so the next task gets a
+    freshly built one instead of a possibly broken backend.
+    """
+    simulator = simulator_pool.get(method=method)
+    width = max(qc.num_qubits for qc in circuits) if isinstance(circuits, list) else circuits.num_qubits
+    options = simulator_pool.parallel_options(width)
+    if seed is not None:
+        options["seed_simulator"] = seed
+    if parameter_binds is not None:
+        options["parameter_binds"] = parameter_binds
+    try:
+        with stage_timer("simulate"):
+            return simulator.run(circuits, shots=shots, **options).result()
+    except Exception:
+        simulator_pool.invalidate(method=method)
+        raise
+
+
+def null_result(shots: int = DEFAULT_SHOTS,
+                parameter_binds: Optional[List[Mapping[str, float]]] = None) -> dict:
+    """
+    Builds the result of the null executor: every shot measured "0",
+    shaped like a real result, without parsing or simulating anything.
+    """
+    if parameter_binds is not None:
+        return {"counts": [{"0": shots} for _ in parameter_binds]}
+    return {"0": shots}
+
+
+def error_payload(e: Exception) -> dict:
+    """
+    Builds the error result returned for a circuit that failed to run.
+    """
+    error_msg = str(e) or e.__class__.__name__
+    return {"error": f"QASM3 execution failed: {error_msg}"}
+
+
+@celery_app.task(bind=True, name="app.workers.tasks.execute_circuit_task")
+@task_with_metrics
+def execute_circuit_task(self, qasm_str: str, marginalize: Marginalization = LAST_BIT,
+                         shots: int = DEFAULT_SHOTS, seed: Optional[int] = None,
+                         method: str = AUTO,
+                         parameter_binds: Optional[List[Mapping[str, float]]] = None) -> dict:
+    """
+    Celery task to run a QASM3 quantum circuit, once or per parameter set.
+    Large results are moved to the blob store; the task returns a reference.
+    """
+    result = execute_quantum_circuit(qasm_str, marginalize=marginalize, shots=shots,
+                                     seed=seed, method=method, parameter_binds=parameter_binds)
+    return offload_result(self.request.id, result)
+
+
+@celery_app.task(bind=True, name="app.workers.tasks.execute_circuit_batch_task")
+@task_with_metrics
+def execute_circuit_batch_task(self, task_ids: List[str], qasm_list: List[str],
+                               marginalize: Marginalization = LAST_BIT,
+                               shots: int = DEFAULT_SHOTS, seed: Optional[int] = None,
+                               method: str = AUTO) -> dict:
+    """
+    Celery task to run a chunk of a batch submission.
+    Each circuit's result is stored under its own task ID, so it can be
+    retrieved individually as well as through the batch. Large results are
+    moved to the blob store.
+    """
+    results = execute_quantum_circuits(qasm_list, marginalize=marginalize,
+                                       shots=shots, seed=seed, method=method)
+    results = [offload_result(task_id, result) for task_id, result in zip(task_ids, results)]
+    for task_id, result in zip(task_ids, results):
+        celery_app.backend.store_result(task_id, result, states.SUCCESS)
+
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for task_id, result in zip(task_ids, results):
+            publish_task_event(pipe, task_id, "completed", result=result)
+        pipe.execute()
+    except Exception as e:
+        logger.warning(f"Could not publish batch task events: {str(e)}")
+    return {"task_ids": task_ids}
+
+
+@task_failure.connect
+def fail_batch_circuits(sender=None, args=None, kwargs=None, exception=None, **extra):
+    """
+    Marks the circuits of a failed batch chunk as failed, so none of their
+    task IDs stays pending. Also runs in the worker's main process when the
+    pool process running the chunk was lost.
+    Circuits whose result was already stored keep it.
+    """
+    if sender is None or sender.name != execute_circuit_batch_task.name:
+        return
+    task_ids = list(args[0] if args else (kwargs or {}).get("task_ids", []))
+    if not task_ids:
+        return
+    try:
+        backend = celery_app.backend
+        stored = backend.client.mget([backend.get_key_for_task(task_id) for task_id in task_ids])
+        failed = [task_id for task_id, payload in zip(task_ids, stored) if payload is None]
+        for task_id in failed:
+            backend.store_result(task_id, exception, states.FAILURE)
+        pipe = get_redis_client().pipeline(transaction=False)
+        for task_id in failed:
+            publish_task_event(pipe, task_id, "error", message="Task not found or failed.")
+        pipe.execute()
+        logger.warning(f"Marked {len(failed)} circuit(s) of a failed batch chunk as failed")
+    except Exception as e:
+        logger.warning(f"Could not mark failed batch circuits: {str(e)}")
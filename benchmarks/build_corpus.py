@@ -0,0 +1,99 @@
+"""
+build_corpus.py - Generates the QASM3 circuit corpus of the hot-path benchmark.
+
+Writes one file per circuit family and width to benchmarks/corpus/, named
+`{family}_{qubits:02d}.qasm`. The corpus is checked in, so every commit is
+benchmarked on identical circuits; rerun this only to change the corpus.
+Random circuits use a fixed seed per family and width.
+
+Families:
+- ghz: Hadamard and a CX chain (Clifford)
+- qft: quantum Fourier transform of a basis state (controlled phases)
+- clifford: random Clifford gates, 10 per qubit
+- variational: hardware-efficient ansatz, RY/RZ layers and CX entanglers
+
+Usage:
+    python -m benchmarks.build_corpus
+"""
+import argparse
+import math
+import os
+import random
+from typing import Callable, Dict, List
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "corpus")
+QUBIT_COUNTS = (1, 2, 4, 8, 12, 16, 20, 24)
+
+_CLIFFORD_1Q = ("h", "s", "sdg", "x", "y", "z")
+_CLIFFORD_2Q = ("cx", "cz", "swap")
+
+
+def ghz(num_qubits: int) -> List[str]:
+    return ["h q[0];"] + [f"cx q[{i}], q[{i + 1}];" for i in range(num_qubits - 1)]
+
+
+def qft(num_qubits: int) -> List[str]:
+    # Input state |0101...>, so the transform is not of the all-zeros state
+    gates = [f"x q[{i}];" for i in range(1, num_qubits, 2)]
+    for target in reversed(range(num_qubits)):
+        gates.append(f"h q[{target}];")
+        for control in reversed(range(target)):
+            angle = math.pi / 2 ** (target - control)
+            gates.append(f"cp({angle:.12f}) q[{control}], q[{target}];")
+    gates += [f"swap q[{i}], q[{num_qubits - 1 - i}];" for i in range(num_qubits // 2)]
+    return gates
+
+
+def clifford(num_qubits: int) -> List[str]:
+    rng = random.Random(f"clifford-{num_qubits}")
+    gates = []
+    for _ in range(10 * num_qubits):
+        if num_qubits > 1 and rng.random() < 0.4:
+            a, b = rng.sample(range(num_qubits), 2)
+            gates.append(f"{rng.choice(_CLIFFORD_2Q)} q[{a}], q[{b}];")
+        else:
+            gates.append(f"{rng.choice(_CLIFFORD_1Q)} q[{rng.randrange(num_qubits)}];")
+    return gates
+
+
+def variational(num_qubits: int, layers: int = 4) -> List[str]:
+    rng = random.Random(f"variational-{num_qubits}")
+    gates = []
+    for _ in range(layers):
+        for qubit in range(num_qubits):
+            gates.append(f"ry({rng.uniform(-math.pi, math.pi):.6f}) q[{qubit}];")
+            gates.append(f"rz({rng.uniform(-math.pi, math.pi):.6f}) q[{qubit}];")
+        gates += [f"cx q[{i}], q[{i + 1}];" for i in range(num_qubits - 1)]
+    return gates
+
+
+FAMILIES: Dict[str, Callable[[int], List[str]]] = {
+    "ghz": ghz,
+    "qft": qft,
+    "clifford": clifford,
+    "variational": variational,
+}
+
+
+def to_qasm(gates: List[str], num_qubits: int) -> str:
+    lines = ["OPENQASM 3.0;", 'include "stdgates.inc";',
+             f"qubit[{num_qubits}] q;", f"bit[{num_qubits}] c;"]
+    return "\n".join(lines + gates + ["c = measure q;", ""])
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", default=CORPUS_DIR)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output, exist_ok=True)
+    for family, build in FAMILIES.items():
+        for num_qubits in QUBIT_COUNTS:
+            path = os.path.join(args.output, f"{family}_{num_qubits:02d}.qasm")
+            with open(path, "w") as f:
+                f.write(to_qasm(build(num_qubits), num_qubits))
+    print(f"Wrote {len(FAMILIES) * len(QUBIT_COUNTS)} circuits to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
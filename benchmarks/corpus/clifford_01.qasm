@@ -0,0 +1,15 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[1] q;
+bit[1] c;
+sdg q[0];
+y q[0];
+y q[0];
+s q[0];
+y q[0];
+sdg q[0];
+y q[0];
+z q[0];
+h q[0];
+h q[0];
+c = measure q;
@@ -0,0 +1,25 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+bit[2] c;
+s q[0];
+sdg q[1];
+s q[0];
+x q[1];
+h q[0];
+s q[0];
+swap q[1], q[0];
+x q[0];
+cx q[1], q[0];
+cz q[0], q[1];
+cz q[1], q[0];
+cx q[0], q[1];
+cz q[0], q[1];
+x q[1];
+swap q[1], q[0];
+h q[0];
+swap q[0], q[1];
+sdg q[0];
+cz q[0], q[1];
+z q[1];
+c = measure q;
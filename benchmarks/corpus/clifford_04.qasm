@@ -0,0 +1,45 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[4] q;
+bit[4] c;
+s q[3];
+cz q[0], q[2];
+z q[2];
+z q[1];
+cz q[3], q[1];
+z q[3];
+cz q[2], q[1];
+z q[1];
+y q[2];
+z q[0];
+swap q[1], q[2];
+cx q[3], q[2];
+cx q[1], q[0];
+z q[3];
+z q[2];
+cx q[1], q[3];
+sdg q[2];
+s q[2];
+h q[1];
+y q[1];
+z q[0];
+y q[3];
+y q[1];
+cx q[2], q[0];
+y q[3];
+z q[1];
+z q[0];
+cz q[0], q[2];
+cx q[3], q[2];
+sdg q[3];
+z q[0];
+y q[3];
+cz q[1], q[3];
+swap q[0], q[3];
+cx q[1], q[3];
+h q[3];
+y q[3];
+cz q[3], q[1];
+cz q[3], q[2];
+cx q[2], q[1];
+c = measure q;
@@ -0,0 +1,85 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[8] q;
+bit[8] c;
+cx q[3], q[1];
+cz q[0], q[1];
+s q[4];
+s q[5];
+s q[5];
+z q[2];
+z q[0];
+cz q[1], q[2];
+cx q[4], q[6];
+x q[0];
+y q[4];
+y q[2];
+sdg q[3];
+h q[6];
+cz q[4], q[6];
+x q[1];
+z q[0];
+cz q[6], q[0];
+z q[3];
+swap q[5], q[2];
+s q[4];
+z q[5];
+z q[0];
+y q[1];
+cx q[5], q[6];
+cx q[1], q[0];
+swap q[2], q[3];
+y q[2];
+h q[1];
+cx q[0], q[2];
+x q[6];
+swap q[0], q[3];
+z q[3];
+s q[1];
+swap q[6], q[3];
+sdg q[7];
+sdg q[5];
+cz q[6], q[0];
+cx q[3], q[6];
+h q[3];
+cx q[7], q[5];
+z q[2];
+s q[3];
+cx q[2], q[4];
+cx q[6], q[7];
+cz q[4], q[5];
+sdg q[3];
+cx q[6], q[2];
+cx q[6], q[0];
+cx q[7], q[6];
+y q[7];
+s q[5];
+z q[7];
+sdg q[6];
+sdg q[3];
+sdg q[1];
+y q[1];
+x q[2];
+x q[7];
+z q[2];
+sdg q[7];
+cx q[2], q[7];
+sdg q[1];
+z q[5];
+sdg q[1];
+x q[0];
+z q[0];
+h q[0];
+cz q[4], q[3];
+cx q[5], q[1];
+swap q[2], q[5];
+sdg q[4];
+h q[5];
+cz q[1], q[6];
+h q[1];
+cz q[4], q[2];
+x q[5];
+y q[5];
+cx q[3], q[7];
+swap q[2], q[5];
+c = measure q;
@@ -0,0 +1,125 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[12] q;
+bit[12] c;
+s q[10];
+s q[11];
+cz q[9], q[4];
+s q[4];
+z q[3];
+cz q[4], q[8];
+y q[5];
+h q[0];
+sdg q[3];
+h q[8];
+z q[9];
+swap q[9], q[11];
+h q[6];
+swap q[8], q[11];
+h q[1];
+z q[5];
+sdg q[0];
+z q[3];
+sdg q[1];
+y q[7];
+h q[0];
+z q[0];
+sdg q[0];
+cz q[9], q[5];
+swap q[4], q[3];
+h q[4];
+h q[8];
+cx q[7], q[1];
+sdg q[10];
+z q[1];
+swap q[1], q[7];
+y q[9];
+s q[8];
+h q[11];
+y q[4];
+x q[2];
+s q[9];
+s q[4];
+cx q[10], q[9];
+s q[3];
+cz q[2], q[1];
+cx q[3], q[0];
+sdg q[9];
+s q[7];
+cz q[4], q[3];
+cx q[2], q[5];
+swap q[3], q[9];
+y q[1];
+x q[9];
+cx q[6], q[11];
+h q[3];
+swap q[2], q[0];
+cx q[8], q[4];
+cz q[7], q[1];
+s q[2];
+h q[7];
+swap q[5], q[8];
+swap q[7], q[2];
+cz q[8], q[4];
+cz q[3], q[9];
+cx q[9], q[8];
+cz q[4], q[3];
+swap q[8], q[5];
+y q[0];
+y q[0];
+s q[11];
+z q[11];
+s q[1];
+y q[2];
+h q[4];
+sdg q[5];
+cx q[9], q[5];
+swap q[9], q[5];
+x q[8];
+cz q[11], q[7];
+x q[11];
+s q[2];
+z q[3];
+sdg q[7];
+s q[3];
+cx q[7], q[2];
+z q[11];
+s q[0];
+s q[7];
+sdg q[11];
+s q[0];
+cz q[3], q[0];
+s q[3];
+cx q[8], q[9];
+z q[11];
+cx q[1], q[8];
+swap q[11], q[6];
+y q[1];
+x q[9];
+cx q[8], q[3];
+s q[9];
+swap q[10], q[3];
+sdg q[1];
+cx q[10], q[0];
+z q[6];
+z q[5];
+s q[9];
+y q[0];
+swap q[11], q[2];
+s q[11];
+sdg q[7];
+swap q[11], q[2];
+cz q[3], q[1];
+swap q[0], q[9];
+swap q[8], q[1];
+cx q[5], q[10];
+x q[2];
+cx q[9], q[10];
+cx q[4], q[6];
+cx q[1], q[6];
+sdg q[5];
+cx q[11], q[7];
+cx q[10], q[3];
+z q[10];
+swap q[1], q[3];
+c = measure q;
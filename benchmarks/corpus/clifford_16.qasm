@@ -0,0 +1,165 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[16] q;
+bit[16] c;
+x q[9];
+x q[2];
+cx q[1], q[9];
+x q[13];
+sdg q[15];
+s q[8];
+sdg q[11];
+y q[14];
+swap q[8], q[13];
+sdg q[0];
+cx q[2], q[9];
+z q[13];
+swap q[14], q[15];
+swap q[12], q[10];
+cx q[1], q[8];
+sdg q[13];
+z q[14];
+h q[14];
+h q[9];
+s q[14];
+h q[10];
+cz q[3], q[0];
+cz q[1], q[13];
+swap q[9], q[5];
+h q[1];
+z q[5];
+cz q[10], q[6];
+cx q[11], q[12];
+z q[6];
+swap q[12], q[6];
+h q[11];
+cx q[13], q[10];
+x q[13];
+cx q[13], q[6];
+h q[8];
+s q[15];
+swap q[4], q[15];
+s q[6];
+cx q[13], q[12];
+cx q[9], q[0];
+s q[14];
+cx q[12], q[1];
+cx q[7], q[15];
+x q[5];
+swap q[4], q[3];
+z q[15];
+cx q[11], q[9];
+y q[0];
+s q[13];
+z q[4];
+x q[14];
+h q[3];
+x q[14];
+s q[3];
+y q[7];
+cz q[1], q[3];
+z q[0];
+cz q[5], q[9];
+cx q[1], q[14];
+cx q[13], q[4];
+cx q[11], q[6];
+sdg q[6];
+z q[7];
+sdg q[14];
+cz q[11], q[7];
+z q[6];
+s q[6];
+sdg q[8];
+cx q[14], q[5];
+cz q[13], q[3];
+h q[7];
+cz q[13], q[11];
+swap q[6], q[14];
+cx q[3], q[5];
+y q[5];
+cz q[7], q[10];
+sdg q[7];
+cx q[12], q[0];
+swap q[3], q[14];
+sdg q[0];
+cz q[6], q[9];
+x q[14];
+y q[2];
+x q[11];
+s q[14];
+cx q[10], q[14];
+sdg q[5];
+x q[13];
+h q[3];
+y q[13];
+s q[12];
+h q[10];
+cz q[9], q[4];
+sdg q[7];
+z q[4];
+sdg q[0];
+y q[9];
+cx q[9], q[10];
+swap q[10], q[7];
+z q[5];
+swap q[15], q[8];
+z q[9];
+h q[4];
+x q[10];
+s q[3];
+cz q[11], q[15];
+cx q[10], q[4];
+x q[3];
+swap q[2], q[1];
+swap q[12], q[13];
+s q[0];
+cz q[7], q[11];
+swap q[15], q[4];
+cx q[1], q[12];
+s q[13];
+cx q[8], q[13];
+swap q[13], q[15];
+x q[3];
+x q[0];
+cz q[8], q[6];
+h q[9];
+s q[8];
+y q[12];
+sdg q[1];
+z q[12];
+x q[1];
+h q[11];
+h q[6];
+cx q[8], q[1];
+y q[11];
+cx q[0], q[10];
+x q[11];
+s q[11];
+swap q[15], q[0];
+z q[3];
+y q[4];
+swap q[9], q[14];
+cx q[5], q[4];
+z q[5];
+swap q[15], q[3];
+cz q[8], q[2];
+cz q[9], q[2];
+cx q[1], q[6];
+y q[11];
+sdg q[0];
+y q[7];
+s q[11];
+cz q[12], q[5];
+swap q[12], q[2];
+s q[2];
+s q[15];
+cz q[6], q[12];
+x q[11];
+y q[13];
+h q[1];
+s q[7];
+cz q[10], q[1];
+swap q[4], q[12];
+cz q[6], q[15];
+cx q[10], q[9];
+c = measure q;
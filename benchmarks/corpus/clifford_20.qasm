@@ -0,0 +1,205 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[20] q;
+bit[20] c;
+z q[7];
+cz q[2], q[7];
+h q[11];
+s q[16];
+swap q[1], q[18];
+sdg q[3];
+y q[16];
+h q[6];
+h q[13];
+s q[7];
+cx q[17], q[4];
+swap q[5], q[2];
+cz q[17], q[0];
+cz q[0], q[19];
+swap q[4], q[6];
+swap q[16], q[15];
+s q[0];
+s q[3];
+x q[12];
+z q[13];
+swap q[9], q[8];
+swap q[15], q[19];
+z q[2];
+swap q[13], q[15];
+h q[19];
+s q[16];
+sdg q[10];
+s q[8];
+cx q[18], q[0];
+swap q[3], q[7];
+s q[17];
+sdg q[3];
+h q[0];
+y q[14];
+y q[5];
+s q[18];
+h q[8];
+s q[5];
+x q[12];
+y q[11];
+cx q[9], q[11];
+swap q[17], q[7];
+s q[19];
+y q[2];
+y q[4];
+s q[15];
+cx q[19], q[10];
+cx q[5], q[18];
+y q[14];
+cx q[16], q[2];
+x q[1];
+cz q[17], q[19];
+z q[8];
+z q[5];
+y q[10];
+sdg q[2];
+h q[17];
+cx q[13], q[19];
+h q[15];
+cx q[9], q[15];
+z q[5];
+x q[1];
+cz q[1], q[17];
+swap q[3], q[11];
+swap q[9], q[17];
+h q[1];
+cz q[14], q[15];
+cx q[17], q[1];
+y q[3];
+swap q[8], q[18];
+z q[12];
+cx q[1], q[5];
+cz q[3], q[0];
+swap q[13], q[18];
+cz q[6], q[2];
+y q[5];
+cx q[15], q[13];
+cz q[11], q[6];
+y q[12];
+cx q[1], q[17];
+y q[14];
+swap q[2], q[18];
+h q[7];
+s q[5];
+cz q[4], q[17];
+cz q[14], q[1];
+h q[19];
+z q[8];
+sdg q[9];
+cz q[11], q[9];
+z q[18];
+x q[2];
+z q[19];
+h q[11];
+s q[18];
+s q[16];
+x q[2];
+x q[8];
+y q[7];
+cx q[16], q[13];
+cx q[13], q[5];
+s q[12];
+x q[14];
+z q[6];
+cx q[12], q[14];
+cz q[3], q[6];
+cz q[18], q[10];
+z q[16];
+z q[13];
+s q[19];
+y q[3];
+s q[4];
+swap q[13], q[5];
+s q[16];
+cz q[15], q[9];
+h q[0];
+cx q[9], q[12];
+sdg q[18];
+z q[14];
+swap q[16], q[2];
+cz q[3], q[15];
+swap q[10], q[9];
+y q[9];
+cz q[17], q[8];
+cx q[6], q[3];
+z q[16];
+z q[6];
+sdg q[19];
+x q[8];
+s q[9];
+swap q[18], q[8];
+x q[0];
+cz q[13], q[5];
+cx q[19], q[13];
+s q[7];
+cz q[15], q[10];
+z q[13];
+y q[18];
+sdg q[6];
+cx q[18], q[13];
+cx q[9], q[18];
+z q[15];
+x q[8];
+y q[12];
+cz q[4], q[7];
+swap q[0], q[13];
+cx q[15], q[17];
+cz q[2], q[18];
+cz q[12], q[7];
+cx q[18], q[6];
+s q[1];
+cz q[6], q[2];
+sdg q[3];
+y q[5];
+h q[5];
+cz q[14], q[12];
+z q[14];
+sdg q[1];
+z q[7];
+cx q[3], q[12];
+s q[16];
+cx q[15], q[6];
+cx q[4], q[9];
+sdg q[9];
+cx q[4], q[2];
+s q[18];
+y q[3];
+cx q[13], q[18];
+swap q[10], q[11];
+swap q[0], q[2];
+z q[11];
+swap q[13], q[2];
+s q[13];
+x q[11];
+y q[8];
+cx q[11], q[2];
+swap q[11], q[17];
+z q[4];
+cx q[0], q[9];
+cx q[10], q[13];
+y q[8];
+h q[4];
+swap q[10], q[5];
+cx q[17], q[8];
+cx q[17], q[13];
+sdg q[17];
+cx q[1], q[12];
+cz q[15], q[5];
+y q[3];
+sdg q[7];
+cx q[3], q[10];
+cx q[14], q[9];
+cx q[5], q[7];
+cz q[2], q[14];
+z q[5];
+cx q[2], q[8];
+cz q[18], q[8];
+y q[15];
+z q[10];
+sdg q[0];
+c = measure q;
@@ -0,0 +1,245 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[24] q;
+bit[24] c;
+swap q[9], q[11];
+cx q[16], q[6];
+h q[21];
+cx q[7], q[11];
+y q[13];
+cz q[21], q[4];
+swap q[14], q[20];
+z q[19];
+h q[23];
+s q[23];
+sdg q[1];
+cz q[0], q[19];
+h q[1];
+y q[12];
+cx q[21], q[15];
+s q[14];
+y q[0];
+y q[14];
+cz q[16], q[9];
+swap q[3], q[8];
+cz q[18], q[3];
+sdg q[6];
+y q[10];
+s q[17];
+cz q[3], q[13];
+sdg q[9];
+cz q[21], q[19];
+s q[22];
+swap q[9], q[14];
+h q[4];
+h q[4];
+cx q[22], q[11];
+y q[23];
+cz q[13], q[10];
+x q[10];
+swap q[1], q[11];
+swap q[3], q[23];
+cx q[7], q[18];
+s q[22];
+swap q[8], q[18];
+x q[18];
+y q[12];
+swap q[3], q[20];
+s q[7];
+cx q[9], q[23];
+y q[10];
+h q[23];
+y q[5];
+cx q[18], q[17];
+s q[23];
+swap q[8], q[19];
+s q[13];
+s q[19];
+swap q[19], q[20];
+swap q[12], q[8];
+cx q[16], q[9];
+s q[4];
+z q[10];
+sdg q[17];
+s q[4];
+cz q[2], q[10];
+x q[13];
+cx q[11], q[3];
+y q[0];
+s q[20];
+z q[12];
+cx q[14], q[6];
+s q[0];
+sdg q[14];
+y q[3];
+cz q[19], q[3];
+z q[19];
+cz q[14], q[3];
+h q[14];
+swap q[0], q[6];
+cx q[11], q[3];
+z q[11];
+x q[15];
+sdg q[16];
+cz q[10], q[12];
+sdg q[6];
+h q[15];
+sdg q[18];
+swap q[0], q[10];
+cz q[22], q[19];
+x q[9];
+cz q[1], q[2];
+sdg q[12];
+sdg q[17];
+sdg q[11];
+swap q[5], q[21];
+swap q[2], q[9];
+x q[1];
+z q[13];
+swap q[4], q[12];
+swap q[22], q[3];
+swap q[15], q[4];
+cz q[17], q[11];
+h q[20];
+y q[15];
+s q[13];
+swap q[15], q[7];
+cx q[15], q[7];
+s q[9];
+x q[21];
+cx q[18], q[1];
+swap q[0], q[22];
+swap q[12], q[14];
+cx q[13], q[5];
+x q[12];
+cz q[10], q[23];
+s q[8];
+z q[13];
+cx q[14], q[16];
+z q[6];
+cx q[5], q[9];
+cz q[4], q[16];
+sdg q[9];
+y q[22];
+s q[23];
+x q[4];
+s q[19];
+cz q[13], q[1];
+y q[11];
+cx q[0], q[3];
+y q[6];
+swap q[20], q[21];
+x q[4];
+h q[22];
+z q[1];
+h q[22];
+s q[9];
+x q[18];
+x q[22];
+swap q[16], q[11];
+y q[0];
+z q[2];
+cz q[14], q[18];
+cx q[21], q[14];
+y q[11];
+s q[15];
+swap q[16], q[1];
+h q[15];
+z q[12];
+swap q[6], q[8];
+cz q[19], q[5];
+y q[15];
+z q[13];
+h q[15];
+sdg q[4];
+h q[13];
+cx q[23], q[1];
+sdg q[18];
+sdg q[4];
+y q[14];
+sdg q[17];
+y q[10];
+sdg q[7];
+sdg q[6];
+cx q[9], q[8];
+z q[11];
+cx q[9], q[22];
+y q[7];
+cz q[4], q[8];
+y q[19];
+sdg q[9];
+s q[17];
+sdg q[14];
+cx q[14], q[2];
+swap q[21], q[16];
+x q[20];
+z q[22];
+sdg q[9];
+x q[20];
+h q[6];
+cx q[19], q[20];
+swap q[18], q[23];
+cz q[18], q[19];
+z q[11];
+z q[22];
+s q[19];
+s q[1];
+s q[12];
+cz q[3], q[9];
+y q[23];
+cz q[7], q[1];
+cz q[0], q[4];
+cx q[6], q[20];
+cz q[23], q[10];
+cx q[15], q[9];
+h q[16];
+x q[11];
+cx q[12], q[20];
+cx q[14], q[18];
+z q[21];
+s q[3];
+s q[1];
+s q[7];
+sdg q[11];
+swap q[2], q[23];
+z q[5];
+swap q[21], q[3];
+h q[23];
+s q[6];
+swap q[21], q[7];
+swap q[19], q[0];
+swap q[16], q[15];
+cx q[19], q[10];
+s q[5];
+cz q[3], q[22];
+s q[10];
+z q[22];
+cx q[7], q[13];
+y q[15];
+s q[21];
+h q[8];
+swap q[9], q[17];
+sdg q[12];
+s q[17];
+y q[20];
+swap q[20], q[8];
+x q[12];
+cx q[11], q[3];
+x q[14];
+cz q[14], q[0];
+swap q[9], q[18];
+s q[8];
+cx q[5], q[15];
+x q[20];
+x q[23];
+swap q[0], q[5];
+s q[19];
+y q[9];
+cx q[2], q[17];
+sdg q[13];
+z q[19];
+swap q[12], q[16];
+swap q[2], q[13];
+z q[16];
+cz q[7], q[22];
+c = measure q;
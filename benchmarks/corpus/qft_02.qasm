@@ -0,0 +1,10 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+bit[2] c;
+x q[1];
+h q[1];
+cp(1.570796326795) q[0], q[1];
+h q[0];
+swap q[0], q[1];
+c = measure q;
@@ -0,0 +1,19 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[4] q;
+bit[4] c;
+x q[1];
+x q[3];
+h q[3];
+cp(1.570796326795) q[2], q[3];
+cp(0.785398163397) q[1], q[3];
+cp(0.392699081699) q[0], q[3];
+h q[2];
+cp(1.570796326795) q[1], q[2];
+cp(0.785398163397) q[0], q[2];
+h q[1];
+cp(1.570796326795) q[0], q[1];
+h q[0];
+swap q[0], q[3];
+swap q[1], q[2];
+c = measure q;
@@ -0,0 +1,49 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[8] q;
+bit[8] c;
+x q[1];
+x q[3];
+x q[5];
+x q[7];
+h q[7];
+cp(1.570796326795) q[6], q[7];
+cp(0.785398163397) q[5], q[7];
+cp(0.392699081699) q[4], q[7];
+cp(0.196349540849) q[3], q[7];
+cp(0.098174770425) q[2], q[7];
+cp(0.049087385212) q[1], q[7];
+cp(0.024543692606) q[0], q[7];
+h q[6];
+cp(1.570796326795) q[5], q[6];
+cp(0.785398163397) q[4], q[6];
+cp(0.392699081699) q[3], q[6];
+cp(0.196349540849) q[2], q[6];
+cp(0.098174770425) q[1], q[6];
+cp(0.049087385212) q[0], q[6];
+h q[5];
+cp(1.570796326795) q[4], q[5];
+cp(0.785398163397) q[3], q[5];
+cp(0.392699081699) q[2], q[5];
+cp(0.196349540849) q[1], q[5];
+cp(0.098174770425) q[0], q[5];
+h q[4];
+cp(1.570796326795) q[3], q[4];
+cp(0.785398163397) q[2], q[4];
+cp(0.392699081699) q[1], q[4];
+cp(0.196349540849) q[0], q[4];
+h q[3];
+cp(1.570796326795) q[2], q[3];
+cp(0.785398163397) q[1], q[3];
+cp(0.392699081699) q[0], q[3];
+h q[2];
+cp(1.570796326795) q[1], q[2];
+cp(0.785398163397) q[0], q[2];
+h q[1];
+cp(1.570796326795) q[0], q[1];
+h q[0];
+swap q[0], q[7];
+swap q[1], q[6];
+swap q[2], q[5];
+swap q[3], q[4];
+c = measure q;
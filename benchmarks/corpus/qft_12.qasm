@@ -0,0 +1,95 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[12] q;
+bit[12] c;
+x q[1];
+x q[3];
+x q[5];
+x q[7];
+x q[9];
+x q[11];
+h q[11];
+cp(1.570796326795) q[10], q[11];
+cp(0.785398163397) q[9], q[11];
+cp(0.392699081699) q[8], q[11];
+cp(0.196349540849) q[7], q[11];
+cp(0.098174770425) q[6], q[11];
+cp(0.049087385212) q[5], q[11];
+cp(0.024543692606) q[4], q[11];
+cp(0.012271846303) q[3], q[11];
+cp(0.006135923152) q[2], q[11];
+cp(0.003067961576) q[1], q[11];
+cp(0.001533980788) q[0], q[11];
+h q[10];
+cp(1.570796326795) q[9], q[10];
+cp(0.785398163397) q[8], q[10];
+cp(0.392699081699) q[7], q[10];
+cp(0.196349540849) q[6], q[10];
+cp(0.098174770425) q[5], q[10];
+cp(0.049087385212) q[4], q[10];
+cp(0.024543692606) q[3], q[10];
+cp(0.012271846303) q[2], q[10];
+cp(0.006135923152) q[1], q[10];
+cp(0.003067961576) q[0], q[10];
+h q[9];
+cp(1.570796326795) q[8], q[9];
+cp(0.785398163397) q[7], q[9];
+cp(0.392699081699) q[6], q[9];
+cp(0.196349540849) q[5], q[9];
+cp(0.098174770425) q[4], q[9];
+cp(0.049087385212) q[3], q[9];
+cp(0.024543692606) q[2], q[9];
+cp(0.012271846303) q[1], q[9];
+cp(0.006135923152) q[0], q[9];
+h q[8];
+cp(1.570796326795) q[7], q[8];
+cp(0.785398163397) q[6], q[8];
+cp(0.392699081699) q[5], q[8];
+cp(0.196349540849) q[4], q[8];
+cp(0.098174770425) q[3], q[8];
+cp(0.049087385212) q[2], q[8];
+cp(0.024543692606) q[1], q[8];
+cp(0.012271846303) q[0], q[8];
+h q[7];
+cp(1.570796326795) q[6], q[7];
+cp(0.785398163397) q[5], q[7];
+cp(0.392699081699) q[4], q[7];
+cp(0.196349540849) q[3], q[7];
+cp(0.098174770425) q[2], q[7];
+cp(0.049087385212) q[1], q[7];
+cp(0.024543692606) q[0], q[7];
+h q[6];
+cp(1.570796326795) q[5], q[6];
+cp(0.785398163397) q[4], q[6];
+cp(0.392699081699) q[3], q[6];
+cp(0.196349540849) q[2], q[6];
+cp(0.098174770425) q[1], q[6];
+cp(0.049087385212) q[0], q[6];
+h q[5];
+cp(1.570796326795) q[4], q[5];
+cp(0.785398163397) q[3], q[5];
+cp(0.392699081699) q[2], q[5];
+cp(0.196349540849) q[1], q[5];
+cp(0.098174770425) q[0], q[5];
+h q[4];
+cp(1.570796326795) q[3], q[4];
+cp(0.785398163397) q[2], q[4];
+cp(0.392699081699) q[1], q[4];
+cp(0.196349540849) q[0], q[4];
+h q[3];
+cp(1.570796326795) q[2], q[3];
+cp(0.785398163397) q[1], q[3];
+cp(0.392699081699) q[0], q[3];
+h q[2];
+cp(1.570796326795) q[1], q[2];
+cp(0.785398163397) q[0], q[2];
+h q[1];
+cp(1.570796326795) q[0], q[1];
+h q[0];
+swap q[0], q[11];
+swap q[1], q[10];
+swap q[2], q[9];
+swap q[3], q[8];
+swap q[4], q[7];
+swap q[5], q[6];
+c = measure q;
@@ -0,0 +1,235 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[20] q;
+bit[20] c;
+x q[1];
+x q[3];
+x q[5];
+x q[7];
+x q[9];
+x q[11];
+x q[13];
+x q[15];
+x q[17];
+x q[19];
+h q[19];
+cp(1.570796326795) q[18], q[19];
+cp(0.785398163397) q[17], q[19];
+cp(0.392699081699) q[16], q[19];
+cp(0.196349540849) q[15], q[19];
+cp(0.098174770425) q[14], q[19];
+cp(0.049087385212) q[13], q[19];
+cp(0.024543692606) q[12], q[19];
+cp(0.012271846303) q[11], q[19];
+cp(0.006135923152) q[10], q[19];
+cp(0.003067961576) q[9], q[19];
+cp(0.001533980788) q[8], q[19];
+cp(0.000766990394) q[7], q[19];
+cp(0.000383495197) q[6], q[19];
+cp(0.000191747598) q[5], q[19];
+cp(0.000095873799) q[4], q[19];
+cp(0.000047936900) q[3], q[19];
+cp(0.000023968450) q[2], q[19];
+cp(0.000011984225) q[1], q[19];
+cp(0.000005992112) q[0], q[19];
+h q[18];
+cp(1.570796326795) q[17], q[18];
+cp(0.785398163397) q[16], q[18];
+cp(0.392699081699) q[15], q[18];
+cp(0.196349540849) q[14], q[18];
+cp(0.098174770425) q[13], q[18];
+cp(0.049087385212) q[12], q[18];
+cp(0.024543692606) q[11], q[18];
+cp(0.012271846303) q[10], q[18];
+cp(0.006135923152) q[9], q[18];
+cp(0.003067961576) q[8], q[18];
+cp(0.001533980788) q[7], q[18];
+cp(0.000766990394) q[6], q[18];
+cp(0.000383495197) q[5], q[18];
+cp(0.000191747598) q[4], q[18];
+cp(0.000095873799) q[3], q[18];
+cp(0.000047936900) q[2], q[18];
+cp(0.000023968450) q[1], q[18];
+cp(0.000011984225) q[0], q[18];
+h q[17];
+cp(1.570796326795) q[16], q[17];
+cp(0.785398163397) q[15], q[17];
+cp(0.392699081699) q[14], q[17];
+cp(0.196349540849) q[13], q[17];
+cp(0.098174770425) q[12], q[17];
+cp(0.049087385212) q[11], q[17];
+cp(0.024543692606) q[10], q[17];
+cp(0.012271846303) q[9], q[17];
+cp(0.006135923152) q[8], q[17];
+cp(0.003067961576) q[7], q[17];
+cp(0.001533980788) q[6], q[17];
+cp(0.000766990394) q[5], q[17];
+cp(0.000383495197) q[4], q[17];
+cp(0.000191747598) q[3], q[17];
+cp(0.000095873799) q[2], q[17];
+cp(0.000047936900) q[1], q[17];
+cp(0.000023968450) q[0], q[17];
+h q[16];
+cp(1.570796326795) q[15], q[16];
+cp(0.785398163397) q[14], q[16];
+cp(0.392699081699) q[13], q[16];
+cp(0.196349540849) q[12], q[16];
+cp(0.098174770425) q[11], q[16];
+cp(0.049087385212) q[10], q[16];
+cp(0.024543692606) q[9], q[16];
+cp(0.012271846303) q[8], q[16];
+cp(0.006135923152) q[7], q[16];
+cp(0.003067961576) q[6], q[16];
+cp(0.001533980788) q[5], q[16];
+cp(0.000766990394) q[4], q[16];
+cp(0.000383495197) q[3], q[16];
+cp(0.000191747598) q[2], q[16];
+cp(0.000095873799) q[1], q[16];
+cp(0.000047936900) q[0], q[16];
+h q[15];
+cp(1.570796326795) q[14], q[15];
+cp(0.785398163397) q[13], q[15];
+cp(0.392699081699) q[12], q[15];
+cp(0.196349540849) q[11], q[15];
+cp(0.098174770425) q[10], q[15];
+cp(0.049087385212) q[9], q[15];
+cp(0.024543692606) q[8], q[15];
+cp(0.012271846303) q[7], q[15];
+cp(0.006135923152) q[6], q[15];
+cp(0.003067961576) q[5], q[15];
+cp(0.001533980788) q[4], q[15];
+cp(0.000766990394) q[3], q[15];
+cp(0.000383495197) q[2], q[15];
+cp(0.000191747598) q[1], q[15];
+cp(0.000095873799) q[0], q[15];
+h q[14];
+cp(1.570796326795) q[13], q[14];
+cp(0.785398163397) q[12], q[14];
+cp(0.392699081699) q[11], q[14];
+cp(0.196349540849) q[10], q[14];
+cp(0.098174770425) q[9], q[14];
+cp(0.049087385212) q[8], q[14];
+cp(0.024543692606) q[7], q[14];
+cp(0.012271846303) q[6], q[14];
+cp(0.006135923152) q[5], q[14];
+cp(0.003067961576) q[4], q[14];
+cp(0.001533980788) q[3], q[14];
+cp(0.000766990394) q[2], q[14];
+cp(0.000383495197) q[1], q[14];
+cp(0.000191747598) q[0], q[14];
+h q[13];
+cp(1.570796326795) q[12], q[13];
+cp(0.785398163397) q[11], q[13];
+cp(0.392699081699) q[10], q[13];
+cp(0.196349540849) q[9], q[13];
+cp(0.098174770425) q[8], q[13];
+cp(0.049087385212) q[7], q[13];
+cp(0.024543692606) q[6], q[13];
+cp(0.012271846303) q[5], q[13];
+cp(0.006135923152) q[4], q[13];
+cp(0.003067961576) q[3], q[13];
+cp(0.001533980788) q[2], q[13];
+cp(0.000766990394) q[1], q[13];
+cp(0.000383495197) q[0], q[13];
+h q[12];
+cp(1.570796326795) q[11], q[12];
+cp(0.785398163397) q[10], q[12];
+cp(0.392699081699) q[9], q[12];
+cp(0.196349540849) q[8], q[12];
+cp(0.098174770425) q[7], q[12];
+cp(0.049087385212) q[6], q[12];
+cp(0.024543692606) q[5], q[12];
+cp(0.012271846303) q[4], q[12];
+cp(0.006135923152) q[3], q[12];
+cp(0.003067961576) q[2], q[12];
+cp(0.001533980788) q[1], q[12];
+cp(0.000766990394) q[0], q[12];
+h q[11];
+cp(1.570796326795) q[10], q[11];
+cp(0.785398163397) q[9], q[11];
+cp(0.392699081699) q[8], q[11];
+cp(0.196349540849) q[7], q[11];
+cp(0.098174770425) q[6], q[11];
+cp(0.049087385212) q[5], q[11];
+cp(0.024543692606) q[4], q[11];
+cp(0.012271846303) q[3], q[11];
+cp(0.006135923152) q[2], q[11];
+cp(0.003067961576) q[1], q[11];
+cp(0.001533980788) q[0], q[11];
+h q[10];
+cp(1.570796326795) q[9], q[10];
+cp(0.785398163397) q[8], q[10];
+cp(0.392699081699) q[7], q[10];
+cp(0.196349540849) q[6], q[10];
+cp(0.098174770425) q[5], q[10];
+cp(0.049087385212) q[4], q[10];
+cp(0.024543692606) q[3], q[10];
+cp(0.012271846303) q[2], q[10];
+cp(0.006135923152) q[1], q[10];
+cp(0.003067961576) q[0], q[10];
+h q[9];
+cp(1.570796326795) q[8], q[9];
+cp(0.785398163397) q[7], q[9];
+cp(0.392699081699) q[6], q[9];
+cp(0.196349540849) q[5], q[9];
+cp(0.098174770425) q[4], q[9];
+cp(0.049087385212) q[3], q[9];
+cp(0.024543692606) q[2], q[9];
+cp(0.012271846303) q[1], q[9];
+cp(0.006135923152) q[0], q[9];
+h q[8];
+cp(1.570796326795) q[7], q[8];
+cp(0.785398163397) q[6], q[8];
+cp(0.392699081699) q[5], q[8];
+cp(0.196349540849) q[4], q[8];
+cp(0.098174770425) q[3], q[8];
+cp(0.049087385212) q[2], q[8];
+cp(0.024543692606) q[1], q[8];
+cp(0.012271846303) q[0], q[8];
+h q[7];
+cp(1.570796326795) q[6], q[7];
+cp(0.785398163397) q[5], q[7];
+cp(0.392699081699) q[4], q[7];
+cp(0.196349540849) q[3], q[7];
+cp(0.098174770425) q[2], q[7];
+cp(0.049087385212) q[1], q[7];
+cp(0.024543692606) q[0], q[7];
+h q[6];
+cp(1.570796326795) q[5], q[6];
+cp(0.785398163397) q[4], q[6];
+cp(0.392699081699) q[3], q[6];
+cp(0.196349540849) q[2], q[6];
+cp(0.098174770425) q[1], q[6];
+cp(0.049087385212) q[0], q[6];
+h q[5];
+cp(1.570796326795) q[4], q[5];
+cp(0.785398163397) q[3], q[5];
+cp(0.392699081699) q[2], q[5];
+cp(0.196349540849) q[1], q[5];
+cp(0.098174770425) q[0], q[5];
+h q[4];
+cp(1.570796326795) q[3], q[4];
+cp(0.785398163397) q[2], q[4];
+cp(0.392699081699) q[1], q[4];
+cp(0.196349540849) q[0], q[4];
+h q[3];
+cp(1.570796326795) q[2], q[3];
+cp(0.785398163397) q[1], q[3];
+cp(0.392699081699) q[0], q[3];
+h q[2];
+cp(1.570796326795) q[1], q[2];
+cp(0.785398163397) q[0], q[2];
+h q[1];
+cp(1.570796326795) q[0], q[1];
+h q[0];
+swap q[0], q[19];
+swap q[1], q[18];
+swap q[2], q[17];
+swap q[3], q[16];
+swap q[4], q[15];
+swap q[5], q[14];
+swap q[6], q[13];
+swap q[7], q[12];
+swap q[8], q[11];
+swap q[9], q[10];
+c = measure q;
@@ -0,0 +1,13 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[1] q;
+bit[1] c;
+ry(0.176432) q[0];
+rz(2.820361) q[0];
+ry(-2.814740) q[0];
+rz(-0.709981) q[0];
+ry(-1.071462) q[0];
+rz(-0.679172) q[0];
+ry(-2.380476) q[0];
+rz(0.642273) q[0];
+c = measure q;
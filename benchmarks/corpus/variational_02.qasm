@@ -0,0 +1,25 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[2] q;
+bit[2] c;
+ry(-2.814368) q[0];
+rz(-0.218419) q[0];
+ry(-0.754776) q[1];
+rz(0.672260) q[1];
+cx q[0], q[1];
+ry(-1.226397) q[0];
+rz(-1.524740) q[0];
+ry(-2.738226) q[1];
+rz(-2.600411) q[1];
+cx q[0], q[1];
+ry(-0.338412) q[0];
+rz(1.249142) q[0];
+ry(-1.869428) q[1];
+rz(0.043687) q[1];
+cx q[0], q[1];
+ry(0.567289) q[0];
+rz(2.397252) q[0];
+ry(1.581236) q[1];
+rz(1.270817) q[1];
+cx q[0], q[1];
+c = measure q;
@@ -0,0 +1,49 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[4] q;
+bit[4] c;
+ry(2.189623) q[0];
+rz(2.247831) q[0];
+ry(1.792997) q[1];
+rz(2.939366) q[1];
+ry(0.771654) q[2];
+rz(-0.656431) q[2];
+ry(0.419524) q[3];
+rz(0.220398) q[3];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+ry(-0.879918) q[0];
+rz(0.583384) q[0];
+ry(2.566465) q[1];
+rz(0.982030) q[1];
+ry(2.661061) q[2];
+rz(-1.109618) q[2];
+ry(3.127852) q[3];
+rz(1.615695) q[3];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+ry(-2.978066) q[0];
+rz(-1.041483) q[0];
+ry(0.953510) q[1];
+rz(0.419142) q[1];
+ry(0.805565) q[2];
+rz(-2.255683) q[2];
+ry(1.294862) q[3];
+rz(-2.968268) q[3];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+ry(-0.488009) q[0];
+rz(1.835585) q[0];
+ry(2.652250) q[1];
+rz(2.805293) q[1];
+ry(-0.067088) q[2];
+rz(2.185311) q[2];
+ry(0.987268) q[3];
+rz(0.231689) q[3];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+c = measure q;
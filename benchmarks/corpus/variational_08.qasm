@@ -0,0 +1,97 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[8] q;
+bit[8] c;
+ry(-1.655342) q[0];
+rz(2.407090) q[0];
+ry(-0.241210) q[1];
+rz(-2.953876) q[1];
+ry(-2.069294) q[2];
+rz(2.481523) q[2];
+ry(-1.283606) q[3];
+rz(0.361171) q[3];
+ry(1.473973) q[4];
+rz(1.292197) q[4];
+ry(-0.351537) q[5];
+rz(2.935140) q[5];
+ry(-0.080576) q[6];
+rz(0.795585) q[6];
+ry(2.756808) q[7];
+rz(1.024414) q[7];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+ry(1.075442) q[0];
+rz(0.660611) q[0];
+ry(0.744427) q[1];
+rz(-0.818933) q[1];
+ry(-1.745618) q[2];
+rz(0.885491) q[2];
+ry(-3.046402) q[3];
+rz(-2.174500) q[3];
+ry(-1.477272) q[4];
+rz(-1.176598) q[4];
+ry(-1.794979) q[5];
+rz(2.784591) q[5];
+ry(1.084159) q[6];
+rz(1.346148) q[6];
+ry(1.354739) q[7];
+rz(-2.432024) q[7];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+ry(1.558756) q[0];
+rz(1.383212) q[0];
+ry(-1.865833) q[1];
+rz(2.231169) q[1];
+ry(-3.127604) q[2];
+rz(2.749797) q[2];
+ry(-1.293557) q[3];
+rz(-1.530705) q[3];
+ry(-2.141034) q[4];
+rz(-1.551102) q[4];
+ry(-0.183271) q[5];
+rz(1.281865) q[5];
+ry(2.867217) q[6];
+rz(1.387646) q[6];
+ry(2.191490) q[7];
+rz(-2.313624) q[7];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+ry(2.439530) q[0];
+rz(-1.901343) q[0];
+ry(-1.679600) q[1];
+rz(1.314486) q[1];
+ry(-2.014657) q[2];
+rz(0.978735) q[2];
+ry(0.095953) q[3];
+rz(1.048228) q[3];
+ry(2.354076) q[4];
+rz(2.151994) q[4];
+ry(1.768104) q[5];
+rz(-2.467142) q[5];
+ry(-2.968992) q[6];
+rz(0.491747) q[6];
+ry(-1.907500) q[7];
+rz(-2.510388) q[7];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+c = measure q;
@@ -0,0 +1,145 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[12] q;
+bit[12] c;
+ry(-2.046284) q[0];
+rz(0.102684) q[0];
+ry(-0.079608) q[1];
+rz(-2.848043) q[1];
+ry(1.814294) q[2];
+rz(2.533923) q[2];
+ry(-0.794900) q[3];
+rz(3.080437) q[3];
+ry(-2.278288) q[4];
+rz(2.963847) q[4];
+ry(0.639803) q[5];
+rz(1.361991) q[5];
+ry(-2.327662) q[6];
+rz(1.455675) q[6];
+ry(3.009944) q[7];
+rz(-2.969882) q[7];
+ry(-2.011881) q[8];
+rz(-1.893843) q[8];
+ry(1.810295) q[9];
+rz(-1.893093) q[9];
+ry(-2.107716) q[10];
+rz(-3.071189) q[10];
+ry(-1.369970) q[11];
+rz(1.451186) q[11];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+ry(-0.906066) q[0];
+rz(-1.083170) q[0];
+ry(0.120461) q[1];
+rz(-0.527062) q[1];
+ry(2.240559) q[2];
+rz(-0.537127) q[2];
+ry(1.992395) q[3];
+rz(0.521247) q[3];
+ry(-2.456232) q[4];
+rz(2.547204) q[4];
+ry(-1.085284) q[5];
+rz(-1.943047) q[5];
+ry(0.588040) q[6];
+rz(1.605589) q[6];
+ry(-0.390711) q[7];
+rz(2.058812) q[7];
+ry(1.294960) q[8];
+rz(0.330426) q[8];
+ry(-0.108235) q[9];
+rz(0.143744) q[9];
+ry(-2.014498) q[10];
+rz(-2.863811) q[10];
+ry(-1.483065) q[11];
+rz(1.793649) q[11];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+ry(0.079348) q[0];
+rz(1.050934) q[0];
+ry(0.284750) q[1];
+rz(-0.370756) q[1];
+ry(1.665849) q[2];
+rz(1.313408) q[2];
+ry(-1.706149) q[3];
+rz(-1.031411) q[3];
+ry(-2.238079) q[4];
+rz(-0.463870) q[4];
+ry(-1.175969) q[5];
+rz(-2.292824) q[5];
+ry(-2.269201) q[6];
+rz(2.082620) q[6];
+ry(2.757320) q[7];
+rz(-1.586014) q[7];
+ry(-1.404326) q[8];
+rz(1.075133) q[8];
+ry(-1.507564) q[9];
+rz(0.777914) q[9];
+ry(-0.209727) q[10];
+rz(2.183732) q[10];
+ry(-1.834423) q[11];
+rz(-0.054002) q[11];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+ry(1.508020) q[0];
+rz(-1.297105) q[0];
+ry(-1.787696) q[1];
+rz(3.132755) q[1];
+ry(-0.021109) q[2];
+rz(-0.338849) q[2];
+ry(1.128150) q[3];
+rz(-2.830819) q[3];
+ry(1.315298) q[4];
+rz(-1.570367) q[4];
+ry(2.558711) q[5];
+rz(0.034383) q[5];
+ry(1.690803) q[6];
+rz(1.127767) q[6];
+ry(-1.328590) q[7];
+rz(-1.726072) q[7];
+ry(1.336913) q[8];
+rz(1.880414) q[8];
+ry(-2.677696) q[9];
+rz(2.205470) q[9];
+ry(-1.512773) q[10];
+rz(1.492790) q[10];
+ry(-0.210935) q[11];
+rz(-2.726614) q[11];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+c = measure q;
@@ -0,0 +1,193 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[16] q;
+bit[16] c;
+ry(-3.064227) q[0];
+rz(1.308066) q[0];
+ry(0.967229) q[1];
+rz(0.540357) q[1];
+ry(2.919999) q[2];
+rz(0.084232) q[2];
+ry(-2.893508) q[3];
+rz(0.721578) q[3];
+ry(1.620493) q[4];
+rz(1.094637) q[4];
+ry(2.703919) q[5];
+rz(-1.092240) q[5];
+ry(0.487621) q[6];
+rz(-0.956219) q[6];
+ry(0.383230) q[7];
+rz(-2.750641) q[7];
+ry(-0.892854) q[8];
+rz(2.912654) q[8];
+ry(2.693040) q[9];
+rz(1.929392) q[9];
+ry(0.558424) q[10];
+rz(2.013803) q[10];
+ry(1.865025) q[11];
+rz(1.294594) q[11];
+ry(-0.297573) q[12];
+rz(1.627072) q[12];
+ry(-0.046159) q[13];
+rz(-2.313443) q[13];
+ry(-2.851795) q[14];
+rz(-2.316619) q[14];
+ry(-0.662573) q[15];
+rz(-2.057632) q[15];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+ry(-0.533536) q[0];
+rz(2.991998) q[0];
+ry(1.868115) q[1];
+rz(0.837551) q[1];
+ry(-0.091029) q[2];
+rz(-2.746035) q[2];
+ry(-1.219338) q[3];
+rz(-2.960424) q[3];
+ry(-0.177494) q[4];
+rz(-1.084784) q[4];
+ry(-1.733139) q[5];
+rz(-2.665574) q[5];
+ry(-0.449917) q[6];
+rz(2.482165) q[6];
+ry(-2.208073) q[7];
+rz(-2.493912) q[7];
+ry(1.802298) q[8];
+rz(-0.850795) q[8];
+ry(3.085069) q[9];
+rz(-2.033855) q[9];
+ry(-0.500508) q[10];
+rz(-2.481568) q[10];
+ry(-1.431913) q[11];
+rz(3.063013) q[11];
+ry(-1.626550) q[12];
+rz(-2.506122) q[12];
+ry(-0.298017) q[13];
+rz(-2.359560) q[13];
+ry(2.494715) q[14];
+rz(2.548245) q[14];
+ry(0.972906) q[15];
+rz(2.510856) q[15];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+ry(0.622689) q[0];
+rz(-0.175468) q[0];
+ry(-3.002910) q[1];
+rz(-2.245331) q[1];
+ry(0.488203) q[2];
+rz(-2.294982) q[2];
+ry(2.542754) q[3];
+rz(0.340456) q[3];
+ry(-0.235112) q[4];
+rz(-1.134026) q[4];
+ry(-1.746531) q[5];
+rz(1.104602) q[5];
+ry(0.158266) q[6];
+rz(1.960332) q[6];
+ry(-1.451059) q[7];
+rz(-0.821747) q[7];
+ry(2.160161) q[8];
+rz(0.358983) q[8];
+ry(1.326193) q[9];
+rz(0.112727) q[9];
+ry(0.448747) q[10];
+rz(-1.308525) q[10];
+ry(1.347081) q[11];
+rz(2.788559) q[11];
+ry(2.263759) q[12];
+rz(-3.007039) q[12];
+ry(-1.350070) q[13];
+rz(-0.240880) q[13];
+ry(0.416387) q[14];
+rz(1.681851) q[14];
+ry(0.323662) q[15];
+rz(-0.917798) q[15];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+ry(1.489723) q[0];
+rz(2.336193) q[0];
+ry(1.128930) q[1];
+rz(1.786846) q[1];
+ry(-2.573441) q[2];
+rz(-0.953013) q[2];
+ry(2.371789) q[3];
+rz(2.867537) q[3];
+ry(2.631126) q[4];
+rz(-0.025117) q[4];
+ry(-2.106872) q[5];
+rz(1.549481) q[5];
+ry(-1.740058) q[6];
+rz(-3.057943) q[6];
+ry(1.361486) q[7];
+rz(2.404189) q[7];
+ry(-0.318560) q[8];
+rz(-1.592396) q[8];
+ry(1.356409) q[9];
+rz(-2.649671) q[9];
+ry(-0.060538) q[10];
+rz(2.001270) q[10];
+ry(1.877178) q[11];
+rz(2.110217) q[11];
+ry(-0.667615) q[12];
+rz(-0.929634) q[12];
+ry(-1.167455) q[13];
+rz(0.510597) q[13];
+ry(-1.577125) q[14];
+rz(0.559308) q[14];
+ry(-2.181095) q[15];
+rz(2.462151) q[15];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+c = measure q;
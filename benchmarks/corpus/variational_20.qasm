@@ -0,0 +1,241 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[20] q;
+bit[20] c;
+ry(0.250702) q[0];
+rz(-2.521602) q[0];
+ry(1.370657) q[1];
+rz(1.637099) q[1];
+ry(1.093270) q[2];
+rz(1.481259) q[2];
+ry(0.100748) q[3];
+rz(-3.043535) q[3];
+ry(3.002245) q[4];
+rz(-1.891991) q[4];
+ry(0.797578) q[5];
+rz(0.295893) q[5];
+ry(0.034619) q[6];
+rz(-1.027240) q[6];
+ry(-2.221400) q[7];
+rz(-2.687936) q[7];
+ry(1.617013) q[8];
+rz(1.260695) q[8];
+ry(2.860401) q[9];
+rz(-0.529542) q[9];
+ry(-1.459930) q[10];
+rz(-2.531896) q[10];
+ry(-1.563925) q[11];
+rz(-0.507585) q[11];
+ry(-2.646676) q[12];
+rz(-0.782795) q[12];
+ry(-0.948296) q[13];
+rz(-0.113617) q[13];
+ry(-2.833203) q[14];
+rz(2.547832) q[14];
+ry(-0.372729) q[15];
+rz(-0.137070) q[15];
+ry(-2.241665) q[16];
+rz(1.340512) q[16];
+ry(-1.533871) q[17];
+rz(-2.682258) q[17];
+ry(2.216227) q[18];
+rz(2.256465) q[18];
+ry(-2.541124) q[19];
+rz(0.875569) q[19];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+ry(2.055529) q[0];
+rz(1.412359) q[0];
+ry(2.903760) q[1];
+rz(1.521199) q[1];
+ry(0.404172) q[2];
+rz(-1.551282) q[2];
+ry(-0.482649) q[3];
+rz(2.808231) q[3];
+ry(-0.643460) q[4];
+rz(-1.426624) q[4];
+ry(-1.342715) q[5];
+rz(-2.923042) q[5];
+ry(-1.049623) q[6];
+rz(-1.095814) q[6];
+ry(-3.104196) q[7];
+rz(-0.319120) q[7];
+ry(-2.404376) q[8];
+rz(2.572994) q[8];
+ry(1.429234) q[9];
+rz(-0.619132) q[9];
+ry(2.008217) q[10];
+rz(1.220101) q[10];
+ry(0.968393) q[11];
+rz(-1.149372) q[11];
+ry(1.825296) q[12];
+rz(-2.417746) q[12];
+ry(-1.339737) q[13];
+rz(-2.127079) q[13];
+ry(-1.302738) q[14];
+rz(-3.045344) q[14];
+ry(-2.790767) q[15];
+rz(0.824355) q[15];
+ry(-1.171773) q[16];
+rz(-2.265887) q[16];
+ry(0.711452) q[17];
+rz(-1.360697) q[17];
+ry(-0.877410) q[18];
+rz(-1.063671) q[18];
+ry(-1.360596) q[19];
+rz(-0.132690) q[19];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+ry(-2.247895) q[0];
+rz(-0.724415) q[0];
+ry(-0.917348) q[1];
+rz(2.003661) q[1];
+ry(-1.994063) q[2];
+rz(1.808438) q[2];
+ry(-0.549761) q[3];
+rz(-1.872978) q[3];
+ry(1.305365) q[4];
+rz(2.841314) q[4];
+ry(-1.175708) q[5];
+rz(-0.432269) q[5];
+ry(2.752540) q[6];
+rz(2.448086) q[6];
+ry(0.737423) q[7];
+rz(-0.178464) q[7];
+ry(0.567042) q[8];
+rz(-0.906239) q[8];
+ry(2.177066) q[9];
+rz(0.897298) q[9];
+ry(-1.819364) q[10];
+rz(-2.607892) q[10];
+ry(1.098069) q[11];
+rz(2.570097) q[11];
+ry(-1.339103) q[12];
+rz(2.151493) q[12];
+ry(-0.882736) q[13];
+rz(-1.844968) q[13];
+ry(1.957991) q[14];
+rz(-1.272695) q[14];
+ry(0.638308) q[15];
+rz(-1.850834) q[15];
+ry(-1.042507) q[16];
+rz(-0.755679) q[16];
+ry(1.209064) q[17];
+rz(-0.137750) q[17];
+ry(2.000093) q[18];
+rz(-0.676764) q[18];
+ry(1.690492) q[19];
+rz(0.070086) q[19];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+ry(0.322784) q[0];
+rz(-1.709495) q[0];
+ry(1.124583) q[1];
+rz(1.176355) q[1];
+ry(-0.876049) q[2];
+rz(2.122489) q[2];
+ry(0.997784) q[3];
+rz(0.664357) q[3];
+ry(0.687689) q[4];
+rz(-0.701027) q[4];
+ry(3.101104) q[5];
+rz(-1.528267) q[5];
+ry(-0.927142) q[6];
+rz(2.445086) q[6];
+ry(1.389441) q[7];
+rz(-1.996737) q[7];
+ry(0.279333) q[8];
+rz(-1.781260) q[8];
+ry(-0.965471) q[9];
+rz(-1.674989) q[9];
+ry(-2.202048) q[10];
+rz(-1.927683) q[10];
+ry(1.909449) q[11];
+rz(-0.148260) q[11];
+ry(2.921926) q[12];
+rz(1.575903) q[12];
+ry(2.300775) q[13];
+rz(0.249059) q[13];
+ry(0.606118) q[14];
+rz(2.486313) q[14];
+ry(-2.729110) q[15];
+rz(-1.500403) q[15];
+ry(2.635138) q[16];
+rz(0.075556) q[16];
+ry(1.152460) q[17];
+rz(2.102857) q[17];
+ry(-1.990375) q[18];
+rz(-1.298110) q[18];
+ry(1.009284) q[19];
+rz(2.350273) q[19];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+c = measure q;
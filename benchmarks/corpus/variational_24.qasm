@@ -0,0 +1,289 @@
+OPENQASM 3.0;
+include "stdgates.inc";
+qubit[24] q;
+bit[24] c;
+ry(-2.101365) q[0];
+rz(0.756354) q[0];
+ry(-0.412269) q[1];
+rz(-0.659162) q[1];
+ry(-2.633212) q[2];
+rz(-0.933200) q[2];
+ry(-0.354215) q[3];
+rz(0.858257) q[3];
+ry(1.775069) q[4];
+rz(-2.914178) q[4];
+ry(-2.094845) q[5];
+rz(2.482113) q[5];
+ry(-1.296816) q[6];
+rz(-0.261447) q[6];
+ry(1.244372) q[7];
+rz(1.719040) q[7];
+ry(0.526412) q[8];
+rz(1.824035) q[8];
+ry(0.679105) q[9];
+rz(1.619713) q[9];
+ry(-0.728681) q[10];
+rz(2.410287) q[10];
+ry(1.432686) q[11];
+rz(-1.675298) q[11];
+ry(1.538655) q[12];
+rz(1.551873) q[12];
+ry(-1.554989) q[13];
+rz(-1.991264) q[13];
+ry(1.141788) q[14];
+rz(1.010205) q[14];
+ry(-1.622540) q[15];
+rz(-3.104674) q[15];
+ry(-1.671917) q[16];
+rz(0.667114) q[16];
+ry(-0.511488) q[17];
+rz(1.971607) q[17];
+ry(-1.141155) q[18];
+rz(-2.284546) q[18];
+ry(-3.110973) q[19];
+rz(-0.000943) q[19];
+ry(1.891461) q[20];
+rz(-2.725967) q[20];
+ry(2.308640) q[21];
+rz(0.389811) q[21];
+ry(2.639635) q[22];
+rz(-1.419501) q[22];
+ry(0.507414) q[23];
+rz(1.334527) q[23];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+cx q[19], q[20];
+cx q[20], q[21];
+cx q[21], q[22];
+cx q[22], q[23];
+ry(0.064193) q[0];
+rz(2.068630) q[0];
+ry(-2.351457) q[1];
+rz(1.323826) q[1];
+ry(-2.655345) q[2];
+rz(-2.079177) q[2];
+ry(-0.048591) q[3];
+rz(-1.998579) q[3];
+ry(-2.054221) q[4];
+rz(-0.727557) q[4];
+ry(0.575791) q[5];
+rz(-0.836608) q[5];
+ry(-1.181341) q[6];
+rz(-0.333048) q[6];
+ry(2.645378) q[7];
+rz(2.186538) q[7];
+ry(2.390375) q[8];
+rz(0.767260) q[8];
+ry(1.355465) q[9];
+rz(-1.292266) q[9];
+ry(1.313955) q[10];
+rz(1.244691) q[10];
+ry(2.685291) q[11];
+rz(-0.010621) q[11];
+ry(-0.430041) q[12];
+rz(-1.978775) q[12];
+ry(-1.998384) q[13];
+rz(-0.238247) q[13];
+ry(-3.084648) q[14];
+rz(2.671634) q[14];
+ry(-2.442876) q[15];
+rz(0.551997) q[15];
+ry(1.217333) q[16];
+rz(1.671165) q[16];
+ry(-1.867879) q[17];
+rz(-3.031865) q[17];
+ry(-1.020409) q[18];
+rz(1.408872) q[18];
+ry(-0.847476) q[19];
+rz(0.571953) q[19];
+ry(-2.081074) q[20];
+rz(-1.443589) q[20];
+ry(-1.435658) q[21];
+rz(-2.170523) q[21];
+ry(-1.600082) q[22];
+rz(0.590759) q[22];
+ry(-1.382903) q[23];
+rz(1.657652) q[23];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+cx q[19], q[20];
+cx q[20], q[21];
+cx q[21], q[22];
+cx q[22], q[23];
+ry(-0.751404) q[0];
+rz(1.727550) q[0];
+ry(-0.906268) q[1];
+rz(-0.151590) q[1];
+ry(0.854829) q[2];
+rz(-1.815035) q[2];
+ry(-2.814201) q[3];
+rz(2.986135) q[3];
+ry(2.902575) q[4];
+rz(2.001226) q[4];
+ry(-1.066062) q[5];
+rz(2.219066) q[5];
+ry(-0.315153) q[6];
+rz(-2.680739) q[6];
+ry(0.620354) q[7];
+rz(1.819461) q[7];
+ry(-2.164181) q[8];
+rz(1.517815) q[8];
+ry(-1.233816) q[9];
+rz(1.220851) q[9];
+ry(-1.425223) q[10];
+rz(1.042011) q[10];
+ry(-3.073434) q[11];
+rz(-1.936484) q[11];
+ry(-2.927350) q[12];
+rz(-1.065462) q[12];
+ry(-2.365119) q[13];
+rz(3.024629) q[13];
+ry(-1.810991) q[14];
+rz(-2.648643) q[14];
+ry(-2.189863) q[15];
+rz(2.845177) q[15];
+ry(-0.659899) q[16];
+rz(2.662679) q[16];
+ry(-1.127534) q[17];
+rz(-0.149591) q[17];
+ry(-1.700928) q[18];
+rz(2.555712) q[18];
+ry(-1.912177) q[19];
+rz(1.422088) q[19];
+ry(2.117238) q[20];
+rz(2.920385) q[20];
+ry(2.769760) q[21];
+rz(0.188484) q[21];
+ry(-1.109802) q[22];
+rz(-3.099303) q[22];
+ry(-0.554745) q[23];
+rz(-0.658031) q[23];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+cx q[19], q[20];
+cx q[20], q[21];
+cx q[21], q[22];
+cx q[22], q[23];
+ry(-0.800746) q[0];
+rz(-2.373406) q[0];
+ry(-2.690960) q[1];
+rz(-1.920743) q[1];
+ry(3.090618) q[2];
+rz(1.432618) q[2];
+ry(-1.277237) q[3];
+rz(-2.786558) q[3];
+ry(-2.535102) q[4];
+rz(-1.709383) q[4];
+ry(-2.046121) q[5];
+rz(1.437057) q[5];
+ry(1.065678) q[6];
+rz(-0.005917) q[6];
+ry(0.016838) q[7];
+rz(-0.444886) q[7];
+ry(-2.153716) q[8];
+rz(-0.404556) q[8];
+ry(-2.732606) q[9];
+rz(-2.976515) q[9];
+ry(1.685523) q[10];
+rz(1.781785) q[10];
+ry(-2.055826) q[11];
+rz(-2.581461) q[11];
+ry(0.348272) q[12];
+rz(0.014650) q[12];
+ry(1.912688) q[13];
+rz(-0.903423) q[13];
+ry(-1.904349) q[14];
+rz(-0.149036) q[14];
+ry(-0.605861) q[15];
+rz(-0.132276) q[15];
+ry(-0.821278) q[16];
+rz(0.019516) q[16];
+ry(1.880499) q[17];
+rz(-2.698102) q[17];
+ry(1.734109) q[18];
+rz(-1.540603) q[18];
+ry(-2.063005) q[19];
+rz(-0.011418) q[19];
+ry(-2.224019) q[20];
+rz(0.310572) q[20];
+ry(0.841830) q[21];
+rz(-2.267944) q[21];
+ry(-1.625609) q[22];
+rz(-2.963105) q[22];
+ry(-0.418534) q[23];
+rz(0.698554) q[23];
+cx q[0], q[1];
+cx q[1], q[2];
+cx q[2], q[3];
+cx q[3], q[4];
+cx q[4], q[5];
+cx q[5], q[6];
+cx q[6], q[7];
+cx q[7], q[8];
+cx q[8], q[9];
+cx q[9], q[10];
+cx q[10], q[11];
+cx q[11], q[12];
+cx q[12], q[13];
+cx q[13], q[14];
+cx q[14], q[15];
+cx q[15], q[16];
+cx q[16], q[17];
+cx q[17], q[18];
+cx q[18], q[19];
+cx q[19], q[20];
+cx q[20], q[21];
+cx q[21], q[22];
+cx q[22], q[23];
+c = measure q;
@@ -0,0 +1,224 @@
+"""
+hot_path.py - Microbenchmark of the worker's circuit execution hot path.
+
+Runs every circuit of the checked-in corpus (benchmarks/corpus/, see
+build_corpus.py) through the functions `execute_quantum_circuit` is built
+from, with no broker, Redis or caches, and times each stage separately:
+- parse: QASM3 parsing, simulation method choice and transpilation
+  (`prepare_circuit` without the circuit cache)
+- simulate: `run_circuits` on the pooled simulator
+- reduce: reading the counts and marginalizing them
+Each circuit runs at every shot count, and timings are the median of
+`--repeat` runs. Each circuit runs in a fresh forked process after its
+simulators are warmed up and one untimed run. This also gives the circuit's peak memory:
+- peak_python_mb: peak of Python allocations in one run (tracemalloc, in an
+  extra untimed run)
+- peak_rss_mb: growth of the process's peak resident memory, including the
+  simulator's native state (a running peak over the shot counts)
+
+The JSON report records the commit. `--compare` matches it against another
+report case by case, and the rows of one family trace its scaling curve
+over the qubit counts. A full run takes several minutes, mostly simulating
+the 24-qubit QFT; `--max-qubits 16` gives a quick one.
+
+Usage:
+    python -m benchmarks.hot_path --json "hot_path-{commit}.json"
+    python -m benchmarks.hot_path --families ghz,qft --max-qubits 16 --shots 1000
+    python -m benchmarks.hot_path --json new.json --compare hot_path-abc1234.json
+"""
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+import qiskit
+import qiskit_aer
+from app.core.resources import available_cpus
+from app.core.telemetry import observe, remove_stage_hook
+from app.workers.circuit_cache import CircuitCache
+from app.workers.method_selection import AUTO, SIMULATION_METHODS, STATEVECTOR, select_method
+from app.workers.postprocessing import LAST_BIT, marginalize_counts, resolve_clbits
+from app.workers.simulator_pool import simulator_pool
+from app.workers.tasks import run_circuits
+from benchmarks.build_corpus import CORPUS_DIR, FAMILIES
+
+SEED = 1234
+STAGES = ("parse", "simulate", "reduce")
+
+
+def load_corpus(families: List[str], max_qubits: int) -> List[Tuple[str, int, str]]:
+    """
+    Reads the corpus circuits of the given families, up to a width.
+    Returns:
+        List[Tuple[str, int, str]]: (family, qubits, QASM) by family, then width.
+    """
+    circuits = []
+    for path in glob.glob(os.path.join(CORPUS_DIR, "*.qasm")):
+        family, qubits = os.path.basename(path)[:-len(".qasm")].rsplit("_", 1)
+        if family in families and int(qubits) <= max_qubits:
+            with open(path) as f:
+                circuits.append((family, int(qubits), f.read()))
+    return sorted(circuits, key=lambda circuit: (families.index(circuit[0]), circuit[1]))
+
+
+def prepare(qasm_str: str):
+    # As tasks.prepare_circuit, but parsing every time instead of through the cache
+    qc = CircuitCache.prepare(qasm_str)
+    method = select_method(qc, AUTO)
+    if method != STATEVECTOR:
+        qc = CircuitCache.prepare(qasm_str, method=method)
+    return qc, method
+
+
+def run_once(qasm_str: str, shots: int, marginalize: str):
+    """Runs a circuit once; returns it, its method, outcome count and stage seconds"""
+    start_time = time.perf_counter()
+    qc, method = prepare(qasm_str)
+    parsed_at = time.perf_counter()
+    result = run_circuits(qc, method, shots=shots, seed=SEED)
+    simulated_at = time.perf_counter()
+    counts = marginalize_counts(result.get_counts(), resolve_clbits(marginalize, qc))
+    reduced_at = time.perf_counter()
+    return qc, method, len(counts), (parsed_at - start_time, simulated_at - parsed_at, reduced_at - simulated_at)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (2 ** 20 if sys.platform == "darwin" else 2 ** 10)
+
+
+def bench_circuit(args) -> List[dict]:
+    """
+    Benchmarks one corpus circuit at every shot count; runs in its own process.
+    """
+    family, num_qubits, qasm_str, shot_counts, repeat, marginalize = args
+    # No Redis here: stage timings must not feed the metrics buffer
+    remove_stage_hook(observe)
+    simulator_pool.warm_up()
+    for method in SIMULATION_METHODS:
+        if method != AUTO:
+            simulator_pool.warm_up(method=method)
+    # Untimed: the first run pays one-off costs (lazy imports, transpiler setup)
+    run_once(qasm_str, shot_counts[0], marginalize)
+    baseline_rss = _peak_rss_mb()
+
+    rows = []
+    for shots in shot_counts:
+        runs = [run_once(qasm_str, shots, marginalize) for _ in range(repeat)]
+        tracemalloc.start()
+        run_once(qasm_str, shots, marginalize)
+        _, peak_python = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        qc, method, outcomes, _ = runs[-1]
+        stage_ms = {stage: round(statistics.median(run[3][index] for run in runs) * 1000, 3)
+                    for index, stage in enumerate(STAGES)}
+        rows.append({
+            "family": family,
+            "qubits": num_qubits,
+            "shots": shots,
+            "method": method,
+            "gates": qc.size(),
+            "depth": qc.depth(),
+            "outcomes": outcomes,
+            **{f"{stage}_ms": value for stage, value in stage_ms.items()},
+            "total_ms": round(sum(stage_ms.values()), 3),
+            "peak_python_mb": round(peak_python / 2 ** 20, 3),
+            "peak_rss_mb": round(max(_peak_rss_mb() - baseline_rss, 0.0), 1),
+        })
+    return rows
+
+
+def compare(results: List[dict], baseline: dict):
+    """Prints each case's stage times relative to a baseline report"""
+    before = {(row["family"], row["qubits"], row["shots"]): row for row in baseline["results"]}
+    print(f"\nRelative to {baseline.get('commit') or 'baseline'} (new / old time)")
+    print(f"{'family':<12} {'qubits':>6} {'shots':>7} " + " ".join(f"{stage:>9}" for stage in STAGES + ("total",)))
+    for row in results:
+        old = before.get((row["family"], row["qubits"], row["shots"]))
+        if old is None:
+            continue
+        ratios = [row[f"{stage}_ms"] / old[f"{stage}_ms"] if old[f"{stage}_ms"] else float("nan")
+                  for stage in STAGES + ("total",)]
+        print(f"{row['family']:<12} {row['qubits']:>6} {row['shots']:>7} "
+              + " ".join(f"{ratio:>9.2f}" for ratio in ratios))
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--families", default=",".join(FAMILIES),
+                        help=f"Comma-separated families (default: {','.join(FAMILIES)})")
+    parser.add_argument("--max-qubits", type=int, default=24)
+    parser.add_argument("--shots", default="100,1000,10000", help="Comma-separated shot counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (median reported)")
+    parser.add_argument("--marginalize", default=LAST_BIT, help='"last", "none" or a register name')
+    parser.add_argument("--json", help='Write the report to this file; "{commit}" is replaced by the commit')
+    parser.add_argument("--compare", help="Report to compare the results with")
+    args = parser.parse_args(argv)
+
+    families = args.families.split(",")
+    unknown = set(families) - set(FAMILIES)
+    if unknown:
+        parser.error(f"Unknown families: {', '.join(sorted(unknown))}")
+    shot_counts = [int(shots) for shots in args.shots.split(",")]
+    circuits = load_corpus(families, args.max_qubits)
+
+    print(f"{'family':<12} {'qubits':>6} {'shots':>7} {'method':<21} "
+          f"{'parse ms':>9} {'sim ms':>9} {'reduce ms':>9} {'py MB':>7} {'rss MB':>7}")
+    results = []
+    # A fresh process per circuit: isolated caches, simulators and peak memory.
+    # The parent never simulates, so no OpenMP state is forked
+    context = multiprocessing.get_context("fork")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        jobs = [(family, num_qubits, qasm_str, shot_counts, args.repeat, args.marginalize)
+                for family, num_qubits, qasm_str in circuits]
+        for rows in pool.imap(bench_circuit, jobs):
+            for row in rows:
+                print(f"{row['family']:<12} {row['qubits']:>6} {row['shots']:>7} {row['method']:<21} "
+                      f"{row['parse_ms']:>9.2f} {row['simulate_ms']:>9.2f} {row['reduce_ms']:>9.2f} "
+                      f"{row['peak_python_mb']:>7.2f} {row['peak_rss_mb']:>7.1f}")
+            results.extend(rows)
+
+    commit = git_commit()
+    report = {
+        "benchmark": "hot_path",
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "cpus": available_cpus(),
+            "python": platform.python_version(),
+            "qiskit": qiskit.__version__,
+            "qiskit_aer": qiskit_aer.__version__,
+        },
+        "config": {"shots": shot_counts, "repeat": args.repeat, "marginalize": args.marginalize,
+                   "seed": SEED},
+        "results": results,
+    }
+    if args.json:
+        with open(args.json.replace("{commit}", commit or "unknown"), "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
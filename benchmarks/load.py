@@ -0,0 +1,400 @@
+"""
+load.py - End-to-end load and throughput benchmark of the task pipeline.
+
+Submits circuits at a fixed rate through the real path (POST /tasks ->
+Celery -> worker -> result backend -> completion event on the WebSocket)
+and reports throughput, p50/p95/p99 submit and completion latency, and
+Redis commands per task.
+
+By default it starts a local stack: a fakeredis server standing in for
+Redis (installed by requirements-dev.txt), one Celery worker and the API,
+with the worker's null executor (CIRCUIT_EXECUTOR=null), which returns a
+fixed result without parsing or simulating. The figures then measure
+orchestration overhead alone; use `--executor aer` to include simulation.
+The stand-in polls its sockets and answers each round trip in up to 10 ms,
+so its latencies are far above those of a real Redis and grow with every
+round trip added to the pipeline: compare reports only with reports of the
+same setup. `--redis server` runs a real `redis-server` from the PATH
+instead. With `--api-url`, an already running stack is loaded, and Redis
+commands are read from INFO at `--redis-url`.
+
+Redis commands include background traffic during the run (heartbeats, health
+probes, metric flushes), spread over the tasks like any other overhead.
+
+The report is written as JSON. With `--thresholds`, metrics outside their
+bounds are listed in the report and the command exits with status 1.
+
+Usage:
+    python -m benchmarks.load
+    python -m benchmarks.load --tasks 2000 --rate 200 --mix ghz:2=0.8,layered:12=0.2
+    python -m benchmarks.load --thresholds benchmarks/load_thresholds.json --json load.json
+    python -m benchmarks.load --api-url http://localhost:8000 --redis-url redis://localhost:6379/0
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+import httpx
+import redis
+import websockets
+
+
+def ghz_qasm(num_qubits: int) -> str:
+    """GHZ state preparation: one Hadamard and a CX chain"""
+    gates = " ".join(f"cx q[{i}], q[{i + 1}];" for i in range(num_qubits - 1))
+    return (f'OPENQASM 3; include "stdgates.inc"; qubit[{num_qubits}] q; bit[{num_qubits}] c; '
+            f'h q[0]; {gates} c = measure q;')
+
+
+def layered_qasm(num_qubits: int, layers: int = 10) -> str:
+    """Layers of single-qubit rotations and a brickwork of CX gates"""
+    gates = []
+    for layer in range(layers):
+        gates += [f"rx({0.1 * (layer + qubit):.2f}) q[{qubit}];" for qubit in range(num_qubits)]
+        gates += [f"cx q[{qubit}], q[{qubit + 1}];" for qubit in range(layer % 2, num_qubits - 1, 2)]
+    return (f'OPENQASM 3; include "stdgates.inc"; qubit[{num_qubits}] q; bit[{num_qubits}] c; '
+            f'{" ".join(gates)} c = measure q;')
+
+
+CIRCUIT_FAMILIES: Dict[str, Callable[[int], str]] = {"ghz": ghz_qasm, "layered": layered_qasm}
+
+
+def parse_mix(text: str) -> List[Tuple[str, int, float]]:
+    """
+    Parses a circuit mix such as "ghz:2=0.8,layered:12=0.2".
+    Returns:
+        List[Tuple[str, int, float]]: (family, qubits, weight) per entry.
+    Raises:
+        ValueError: If an entry is malformed or names an unknown family.
+    """
+    mix = []
+    for entry in text.split(","):
+        try:
+            circuit, weight = entry.split("=") if "=" in entry else (entry, "1")
+            family, qubits = circuit.split(":")
+            mix.append((family.strip(), int(qubits), float(weight)))
+        except ValueError:
+            raise ValueError(f"Invalid circuit mix entry {entry!r}, expected family:qubits=weight")
+        if family.strip() not in CIRCUIT_FAMILIES:
+            raise ValueError(f"Unknown circuit family {family!r}, expected one of {sorted(CIRCUIT_FAMILIES)}")
+    return mix
+
+
+def latency_summary(seconds: List[float]) -> Optional[dict]:
+    """
+    Summarizes latencies in milliseconds: p50, p95, p99, mean and max.
+    """
+    if not seconds:
+        return None
+    ms = sorted(value * 1000 for value in seconds)
+    if len(ms) > 1:
+        cuts = statistics.quantiles(ms, n=100, method="inclusive")
+        p50, p95, p99 = cuts[49], cuts[94], cuts[98]
+    else:
+        p50 = p95 = p99 = ms[0]
+    return {"p50": round(p50, 2), "p95": round(p95, 2), "p99": round(p99, 2),
+            "mean": round(statistics.fmean(ms), 2), "max": round(ms[-1], 2)}
+
+
+def check_thresholds(results: dict, thresholds: Dict[str, dict]) -> List[str]:
+    """
+    Compares results with regression thresholds.
+    Args:
+        results (dict): The report's results.
+        thresholds (Dict[str, dict]): {"metric.path": {"min": x, "max": y}},
+            e.g. {"completion_latency_ms.p95": {"max": 250}}.
+    Returns:
+        List[str]: One message per violated (or missing) metric.
+    """
+    violations = []
+    for metric, bounds in thresholds.items():
+        value = results
+        for part in metric.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is None:
+            violations.append(f"{metric}: not measured")
+            continue
+        if "min" in bounds and value < bounds["min"]:
+            violations.append(f"{metric}: {value} is below the minimum {bounds['min']}")
+        if "max" in bounds and value > bounds["max"]:
+            violations.append(f"{metric}: {value} is above the maximum {bounds['max']}")
+    return violations
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve_fake_redis(port: int, commands):
+    # fakeredis has no INFO: count commands as the stand-in processes them
+    from fakeredis import TcpFakeServer
+    from fakeredis._socket._fakesocket import FakeSocket
+
+    process_command = FakeSocket._process_command
+
+    def counting(self, fields):
+        with commands.get_lock():
+            commands.value += 1
+        return process_command(self, fields)
+
+    FakeSocket._process_command = counting
+    TcpFakeServer(("127.0.0.1", port), server_type="redis").serve_forever()
+
+
+class LocalStack:
+    """
+    A Redis server (fakeredis or redis-server), a Celery worker and the API,
+    run as child processes.
+    """
+
+    def __init__(self, executor: str = "null", pool: str = "solo", concurrency: int = 1,
+                 redis_server: str = "fake"):
+        self.executor = executor
+        self.redis_server = redis_server
+        self.pool = pool
+        self.concurrency = concurrency
+        self.redis_port = _free_port()
+        self.api_port = _free_port()
+        self.api_url = f"http://127.0.0.1:{self.api_port}"
+        self.redis_url = f"redis://127.0.0.1:{self.redis_port}/0"
+        self._commands = multiprocessing.get_context("spawn").Value("Q", 0)
+        self._processes: list = []
+        self._workdir = tempfile.TemporaryDirectory(prefix="qc-load-")
+
+    def __enter__(self):
+        if self.redis_server == "fake":
+            context = multiprocessing.get_context("spawn")
+            server = context.Process(target=_serve_fake_redis, args=(self.redis_port, self._commands), daemon=True)
+            server.start()
+            self._processes.append(server)
+        else:
+            self._spawn("redis", dict(os.environ), ["redis-server", "--port", str(self.redis_port),
+                                                    "--save", "", "--appendonly", "no"])
+        self._wait(lambda: redis.Redis.from_url(self.redis_url).ping(), "Redis stand-in")
+
+        env = dict(os.environ, REDIS_HOST="127.0.0.1", REDIS_PORT=str(self.redis_port), REDIS_DB="0",
+                   BROKER_URL=self.redis_url, RESULT_BACKEND=self.redis_url,
+                   CIRCUIT_EXECUTOR=self.executor,
+                   BLOB_STORE_DIR=os.path.join(self._workdir.name, "results"))
+        self._spawn("worker", env, [sys.executable, "-m", "celery", "-A", "app.core.celery_app", "worker",
+                                    "--loglevel=warning", f"--pool={self.pool}",
+                                    f"--concurrency={self.concurrency}"])
+        self._spawn("api", env, [sys.executable, "-m", "uvicorn", "app.main:app",
+                                 "--host", "127.0.0.1", "--port", str(self.api_port),
+                                 "--log-level", "warning"])
+        self._wait(lambda: httpx.get(f"{self.api_url}/health/ping").status_code == 200, "API")
+        self._wait(lambda: redis.Redis.from_url(self.redis_url).hlen("workers:heartbeat"), "worker")
+        return self
+
+    def __exit__(self, *exc):
+        for process in reversed(self._processes):
+            process.terminate()
+        for process in self._processes:
+            if isinstance(process, subprocess.Popen):
+                try:
+                    process.wait(10)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+            else:
+                process.join(10)
+        self._workdir.cleanup()
+
+    def redis_commands(self) -> Optional[int]:
+        if self.redis_server == "fake":
+            return self._commands.value
+        return info_commands(self.redis_url)
+
+    def _spawn(self, name: str, env: dict, command: List[str]):
+        log = open(os.path.join(self._workdir.name, f"{name}.log"), "wb")
+        self._processes.append(subprocess.Popen(command, env=env, stdout=log, stderr=subprocess.STDOUT))
+
+    def _wait(self, probe: Callable, name: str, timeout: float = 60.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                if probe():
+                    return
+            except (httpx.HTTPError, redis.RedisError):
+                pass
+            time.sleep(0.2)
+        raise RuntimeError(f"{name} did not start within {timeout:.0f}s (logs in {self._workdir.name})")
+
+
+def info_commands(redis_url: str) -> Optional[int]:
+    """Returns the commands processed by a Redis server, if it reports them"""
+    try:
+        return int(redis.Redis.from_url(redis_url).info("stats")["total_commands_processed"])
+    except (redis.RedisError, KeyError):
+        return None
+
+
+async def run_load(api_url: str, circuits: List[str], rate: float, shots: int,
+                   concurrency: int, timeout: float) -> dict:
+    """
+    Submits the circuits open-loop at `rate` per second and waits for their
+    completion events.
+    Each submission gets its own seed, so none is coalesced with another or
+    served from the result cache.
+    Returns:
+        dict: Counts, throughput and latency summaries.
+    """
+    submitted: Dict[str, float] = {}
+    finished: Dict[str, Tuple[float, str]] = {}
+    submit_latencies: List[float] = []
+    rejected = 0
+    all_finished = asyncio.Event()
+    submissions_done = False
+    ws_url = api_url.replace("http", "ws", 1) + "/tasks/ws"
+
+    async with httpx.AsyncClient(base_url=api_url, timeout=30,
+                                 limits=httpx.Limits(max_connections=concurrency)) as client, \
+            websockets.connect(ws_url, max_size=None) as ws:
+        send_lock = asyncio.Lock()
+
+        async def listen():
+            async for message in ws:
+                event = json.loads(message)
+                task_id = event.get("task_id")
+                if task_id in submitted and task_id not in finished:
+                    finished[task_id] = (time.perf_counter(), event.get("status"))
+                    if submissions_done and len(finished) == len(submitted):
+                        all_finished.set()
+
+        async def submit(index: int, qasm: str):
+            nonlocal rejected
+            await asyncio.sleep(max(start + index / rate - time.perf_counter(), 0))
+            sent_at = time.perf_counter()
+            try:
+                response = await client.post("/tasks", json={"qc": qasm, "shots": shots, "seed": index})
+                response.raise_for_status()
+            except httpx.HTTPError:
+                rejected += 1
+                return
+            submit_latencies.append(time.perf_counter() - sent_at)
+            task_id = response.json()["task_id"]
+            submitted[task_id] = sent_at
+            async with send_lock:
+                await ws.send(json.dumps({"subscribe": [task_id]}))
+
+        listener = asyncio.create_task(listen())
+        start = time.perf_counter()
+        await asyncio.gather(*(submit(index, qasm) for index, qasm in enumerate(circuits)))
+        submissions_done = True
+        if len(finished) == len(submitted):
+            all_finished.set()
+        try:
+            await asyncio.wait_for(all_finished.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        listener.cancel()
+
+    completion_latencies = [finished_at - submitted[task_id]
+                            for task_id, (finished_at, _) in finished.items()]
+    statuses = [status for _, status in finished.values()]
+    elapsed = (max(finished_at for finished_at, _ in finished.values()) - start) if finished else None
+    return {
+        "submitted": len(submitted),
+        "rejected": rejected,
+        "completed": statuses.count("completed"),
+        "failed": len(statuses) - statuses.count("completed"),
+        "timed_out": len(submitted) - len(finished),
+        "duration_seconds": round(elapsed, 3) if elapsed else None,
+        "throughput_per_second": round(len(finished) / elapsed, 2) if elapsed else None,
+        "submit_latency_ms": latency_summary(submit_latencies),
+        "completion_latency_ms": latency_summary(completion_latencies),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=5.0, help="Submissions per second")
+    parser.add_argument("--mix", default="ghz:2=0.8,layered:8=0.2",
+                        help=f"Circuit mix, family:qubits=weight,... (families: {', '.join(CIRCUIT_FAMILIES)})")
+    parser.add_argument("--shots", type=int, default=1024)
+    parser.add_argument("--concurrency", type=int, default=64, help="Most HTTP requests in flight")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for completions")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the circuit mix")
+    parser.add_argument("--executor", choices=("null", "aer"), default="null",
+                        help="Worker executor of the local stack")
+    parser.add_argument("--redis", choices=("fake", "server"), default="fake",
+                        help="Redis of the local stack: fakeredis, or redis-server from the PATH")
+    parser.add_argument("--pool", default="solo", help="Celery pool of the local worker")
+    parser.add_argument("--worker-concurrency", type=int, default=1)
+    parser.add_argument("--api-url", help="Load this running API instead of starting a local stack")
+    parser.add_argument("--redis-url", help="Redis of the running stack, for command counts")
+    parser.add_argument("--thresholds", help="JSON file of regression thresholds to gate on")
+    parser.add_argument("--json", help="Write the report to this file")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    rng = random.Random(args.seed)
+    picks = rng.choices(mix, weights=[weight for _, _, weight in mix], k=args.tasks)
+    circuits = [CIRCUIT_FAMILIES[family](qubits) for family, qubits, _ in picks]
+
+    def measure(api_url: str, count_commands: Callable[[], Optional[int]]) -> dict:
+        before = count_commands()
+        results = asyncio.run(run_load(api_url, circuits, args.rate, args.shots,
+                                       args.concurrency, args.timeout))
+        after = count_commands()
+        finished = results["completed"] + results["failed"]
+        results["redis_commands_per_task"] = (round((after - before) / finished, 2)
+                                              if before is not None and after is not None and finished else None)
+        return results
+
+    if args.api_url:
+        results = measure(args.api_url, lambda: info_commands(args.redis_url) if args.redis_url else None)
+    else:
+        with LocalStack(args.executor, args.pool, args.worker_concurrency, args.redis) as stack:
+            results = measure(stack.api_url, stack.redis_commands)
+
+    report = {
+        "benchmark": "load",
+        "commit": git_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "config": {
+            "target": args.api_url or "local",
+            "executor": None if args.api_url else args.executor,
+            "redis": None if args.api_url else args.redis,
+            "tasks": args.tasks, "rate": args.rate, "mix": args.mix, "shots": args.shots,
+            "concurrency": args.concurrency,
+            "worker_pool": None if args.api_url else args.pool,
+            "worker_concurrency": None if args.api_url else args.worker_concurrency,
+        },
+        "results": results,
+    }
+    if args.thresholds:
+        with open(args.thresholds) as f:
+            report["thresholds"] = json.load(f)
+        report["violations"] = check_thresholds(results, report["thresholds"])
+
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if report.get("violations"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+worker_scaling.py - Circuit throughput of the worker execution mode from 1 to N cores.
+
+For every process count P from 1 to N (the CPUs available to this container),
+runs a fixed set of circuits on P processes, each keeping Aer within its
+share of the CPUs exactly like prefork worker children do
+(`simulator_pool.set_process_count(P)` + `simulator_pool.parallel_options`).
+Narrow circuits should scale with processes, and wide circuits should do
+best with few processes and many threads.
+
+Usage:
+    python -m benchmarks.worker_scaling
+    python -m benchmarks.worker_scaling --circuits 400 --wide-qubits 22 --json scaling.json
+"""
+import argparse
+import json
+import multiprocessing
+import time
+from typing import List
+from qiskit import QuantumCircuit
+from app.core.resources import available_cpus
+from app.workers.simulator_pool import simulator_pool
+
+
+def build_circuit(num_qubits: int, layers: int, seed: int) -> QuantumCircuit:
+    """Builds a layered entangling circuit with measurements on every qubit"""
+    qc = QuantumCircuit(num_qubits, num_qubits)
+    for layer in range(layers):
+        for qubit in range(num_qubits):
+            qc.rx(0.1 * (seed + layer + qubit), qubit)
+        for qubit in range(layer % 2, num_qubits - 1, 2):
+            qc.cx(qubit, qubit + 1)
+    qc.measure(range(num_qubits), range(num_qubits))
+    return qc
+
+
+def _init_process(processes: int):
+    simulator_pool.set_process_count(processes)
+    simulator_pool.warm_up()
+
+
+def _run(args) -> int:
+    num_qubits, layers, seed, shots = args
+    qc = build_circuit(num_qubits, layers, seed)
+    simulator = simulator_pool.get()
+    simulator.run(qc, shots=shots, **simulator_pool.parallel_options(num_qubits)).result()
+    return num_qubits
+
+
+def measure(processes: int, num_qubits: int, circuits: int, layers: int, shots: int) -> dict:
+    """
+    Runs `circuits` circuits of the given width on `processes` processes.
+    Returns:
+        dict: Throughput figures for this configuration.
+    """
+    context = multiprocessing.get_context("fork")
+    jobs = [(num_qubits, layers, seed, shots) for seed in range(circuits)]
+    with context.Pool(processes, initializer=_init_process, initargs=(processes,)) as pool:
+        start_time = time.perf_counter()
+        pool.map(_run, jobs, chunksize=1)
+        elapsed = time.perf_counter() - start_time
+    return {
+        "processes": processes,
+        "threads_per_process": max(available_cpus() // processes, 1),
+        "qubits": num_qubits,
+        "circuits": circuits,
+        "seconds": round(elapsed, 3),
+        "circuits_per_second": round(circuits / elapsed, 2),
+    }
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max-processes", type=int, default=available_cpus())
+    parser.add_argument("--circuits", type=int, default=200)
+    parser.add_argument("--narrow-qubits", type=int, default=5)
+    parser.add_argument("--wide-qubits", type=int, default=20)
+    parser.add_argument("--layers", type=int, default=10)
+    parser.add_argument("--shots", type=int, default=1024)
+    parser.add_argument("--json", help="Write the results to this file as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for label, num_qubits, circuits in (
+            ("narrow", args.narrow_qubits, args.circuits),
+            # Wide circuits take far longer each: run fewer of them
+            ("wide", args.wide_qubits, max(args.circuits // 20, args.max_processes))):
+        baseline = None
+        print(f"\n{label} circuits ({num_qubits} qubits)")
+        print(f"{'processes':>9} {'threads/proc':>12} {'circuits/s':>11} {'speedup':>8}")
+        for processes in range(1, args.max_processes + 1):
+            result = measure(processes, num_qubits, circuits, args.layers, args.shots)
+            baseline = baseline or result["circuits_per_second"]
+            result["mode"] = label
+            result["speedup"] = round(result["circuits_per_second"] / baseline, 2)
+            results.append(result)
+            print(f"{processes:>9} {result['threads_per_process']:>12} "
+                  f"{result['circuits_per_second']:>11} {result['speedup']:>8}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"cpus": available_cpus(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,28 @@
 import pytest
 import httpx
 import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import websockets
+from app.core.celery_app import celery_app
+from app.core.fingerprint import circuit_fingerprint
+from app.core.redis_client import get_redis_client
 
 API_URL = "http://api:8000"  # 'api' is the service name in docker-compose
+API_LOG = os.path.join(os.path.dirname(__file__), "..", "logs", "api.log")  # shared with the api service
 QASM = 'OPENQASM 3; include "stdgates.inc"; qubit[1] q; bit[1] c; h q[0]; c = measure q;'
 
 
+def task_metadata(task_id):
+    """Metadata the worker stores for a finished task (see task_wrapper.py)"""
+    return {key.decode(): value.decode()
+            for key, value in get_redis_client().hgetall(f"task:{task_id}").items()}
+
+
 @pytest.mark.asyncio
 async def test_valid_qasm_submission_and_result():
     qasm = 'OPENQASM 3; include "stdgates.inc"; qubit[2] q; bit[2] c; h q[0]; cx q[0], q[1]; c = measure q;'
@@ -79,3 +96,653 @@ async def test_concurrent_task_execution():
     async with httpx.AsyncClient(base_url=API_URL) as client:
         task_count = 10  # Adjust to stress system (e.g., 50)
         await asyncio.gather(*(submit_and_poll(client) for _ in range(task_count)))
+
+
+@pytest.mark.asyncio
+async def test_status_lookups_are_not_held_up_by_submissions():
+    angle = time.time() % 1
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30) as client:
+        task_id = (await client.post("/tasks", json={"qc": QASM})).json()["task_id"]
+        for _ in range(15):
+            if (await client.get(f"/tasks/{task_id}")).json()["status"] == "completed":
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Task did not complete in time"
+
+        async def lookups():
+            latencies = []
+            for _ in range(20):
+                start = time.perf_counter()
+                data = (await client.get(f"/tasks/{task_id}")).json()
+                latencies.append(time.perf_counter() - start)
+                assert data["status"] == "completed"
+            return statistics.median(latencies)
+
+        baseline = await lookups()
+        # Submissions run off the event loop, so lookups interleave with a burst of them
+        circuits = [f'OPENQASM 3; include "stdgates.inc"; qubit[1] q; bit[1] c; rx({angle + i}) q[0]; c = measure q;'
+                    for i in range(50)]
+        *posts, loaded = await asyncio.gather(
+            *(client.post("/tasks", json={"qc": qasm}) for qasm in circuits), lookups())
+        assert all(post.status_code == 200 for post in posts)
+        assert len({post.json()["task_id"] for post in posts}) == len(circuits)
+        assert loaded < max(10 * baseline, 0.05), f"median lookup {loaded:.4f}s under load, {baseline:.4f}s idle"
+
+
+@pytest.mark.asyncio
+async def test_resubmitted_circuit_served_from_cache():
+    qasm = 'OPENQASM 3; include "stdgates.inc"; qubit[2] q; bit[2] c; x q[0]; c = measure q;'
+    # Same circuit with different whitespace, comments and register names
+    variant = """
+    OPENQASM 3;
+    include "stdgates.inc";
+    // cached variant
+    qubit[2] qr;
+    bit[2] cr;
+    x qr[0];
+    cr = measure qr;
+    """
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        post = await client.post("/tasks", json={"qc": qasm, "seed": 7})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            data = (await client.get(f"/tasks/{task_id}")).json()
+            if data["status"] == "completed":
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Task did not complete in time"
+
+        # The resubmission is completed immediately, without being enqueued
+        post = await client.post("/tasks", json={"qc": variant, "seed": 7})
+        assert post.status_code == 200
+        cached = (await client.get(f"/tasks/{post.json()['task_id']}")).json()
+        assert cached == data
+
+        # Cache counters are flushed to Redis within METRICS_FLUSH_INTERVAL_MS
+        for _ in range(10):
+            metrics = (await client.get("/metrics/")).json()
+            if metrics["cache_stats"]["local_hits"] + metrics["cache_stats"]["redis_hits"] >= 1:
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Cache hit was not counted"
+
+        # Unseeded runs draw a fresh sample: the same circuit is enqueued again
+        for _ in range(2):
+            enqueued = (await client.get("/metrics/")).json()["task_stats"]["total"]
+            task_id = (await client.post("/tasks", json={"qc": qasm})).json()["task_id"]
+            assert (await client.get("/metrics/")).json()["task_stats"]["total"] == enqueued + 1
+            for _ in range(15):
+                if (await client.get(f"/tasks/{task_id}")).json()["status"] == "completed":
+                    break
+                await asyncio.sleep(0.5)
+
+
+@pytest.mark.asyncio
+async def test_batch_submission_and_results():
+    circuits = [
+        'OPENQASM 3; include "stdgates.inc"; qubit[1] q; bit[1] c; c = measure q;',
+        'OPENQASM 3; include "stdgates.inc"; qubit[1] q; bit[1] c; x q[0]; c = measure q;',
+        "OPENQASM 3; bad syntax;",
+    ]
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        post = await client.post("/tasks/batch", json={"circuits": circuits})
+        assert post.status_code == 200
+        batch_id = post.json()["batch_id"]
+        task_ids = post.json()["task_ids"]
+        assert len(task_ids) == len(circuits)
+
+        for _ in range(15):
+            data = (await client.get(f"/tasks/batch/{batch_id}")).json()
+            if all(task["status"] == "completed" for task in data["tasks"].values()):
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Batch did not complete in time"
+
+        # Individual task IDs resolve to the same results as the batch view
+        results = [(await client.get(f"/tasks/{task_id}")).json()["result"]
+                   for task_id in task_ids]
+        assert results == [data["tasks"][task_id]["result"] for task_id in task_ids]
+        assert results[0] == {"0": 1024}
+        assert results[1] == {"1": 1024}
+        assert "error" in results[2]
+
+
+@pytest.mark.asyncio
+async def test_marginalization_options():
+    qasm = 'OPENQASM 3; include "stdgates.inc"; qubit[2] q; bit[2] c; x q[1]; c = measure q;'
+    expected = [
+        ("last", {"0": 1024}),
+        ("none", {"10": 1024}),
+        ("c", {"10": 1024}),
+        ([1], {"1": 1024}),
+    ]
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        for marginalize, result in expected:
+            post = await client.post("/tasks", json={"qc": qasm, "marginalize": marginalize})
+            assert post.status_code == 200
+            task_id = post.json()["task_id"]
+            for _ in range(15):
+                data = (await client.get(f"/tasks/{task_id}")).json()
+                if data["status"] == "completed":
+                    assert data["result"] == result
+                    break
+                await asyncio.sleep(0.5)
+            else:
+                assert False, f"Task {task_id} did not complete in time"
+
+
+@pytest.mark.asyncio
+async def test_marginalization_keyword_is_not_a_register_name():
+    angle = time.time() % 1
+    body = f'qubit[2] q; rz({angle}) q[0]; x q[1];'
+    named_last = f'OPENQASM 3; include "stdgates.inc"; bit[2] last; {body} last = measure q;'
+    named_foo = f'OPENQASM 3; include "stdgates.inc"; bit[2] foo; {body} foo = measure q;'
+    # The keyword and a register of the same name hash differently
+    assert circuit_fingerprint(named_last, 1024, seed=7, marginalize="last") != \
+        circuit_fingerprint(named_foo, 1024, seed=7, marginalize="foo")
+
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        # The whole register first, so a shared fingerprint would serve it from the cache
+        results = []
+        for qasm, options in ((named_foo, {"marginalize": "foo"}), (named_last, {})):
+            task_id = (await client.post("/tasks", json={"qc": qasm, "seed": 7, **options})).json()["task_id"]
+            for _ in range(15):
+                data = (await client.get(f"/tasks/{task_id}")).json()
+                if data["status"] != "pending":
+                    break
+                await asyncio.sleep(0.5)
+            results.append(data["result"])
+
+        assert results[0] == {"10": 1024}
+        # The default "last" is the final bit, even with a register named last
+        assert results[1] == {"0": 1024}
+
+
+@pytest.mark.asyncio
+async def test_parsed_circuit_cache_reuses_custom_gate_circuit():
+    qasm = ('OPENQASM 3; include "stdgates.inc"; gate bell a, b { h a; cx a, b; } '
+            'qubit[2] q; bit[2] c; bell q[0], q[1]; c = measure q;')
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        # Different options miss the result cache but share the parsed circuit
+        for marginalize in ("none", [1]):
+            post = await client.post("/tasks", json={"qc": qasm, "marginalize": marginalize})
+            task_id = post.json()["task_id"]
+            for _ in range(15):
+                data = (await client.get(f"/tasks/{task_id}")).json()
+                if data["status"] == "completed":
+                    assert "error" not in data["result"]
+                    break
+                await asyncio.sleep(0.5)
+            else:
+                assert False, f"Task {task_id} did not complete in time"
+
+        # Cache counters are flushed to Redis within METRICS_FLUSH_INTERVAL_MS
+        for _ in range(10):
+            metrics = (await client.get("/metrics/tasks")).json()
+            if metrics["circuit_cache"]["hits"] >= 1:
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Parsed circuit cache hit was not counted"
+
+
+@pytest.mark.asyncio
+async def test_task_events_stream_pushes_completion():
+    qasm = 'OPENQASM 3; include "stdgates.inc"; qubit[3] q; bit[3] c; h q; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30) as client:
+        post = await client.post("/tasks", json={"qc": qasm, "marginalize": "none"})
+        task_id = post.json()["task_id"]
+
+        events = []
+        async with client.stream("GET", f"/tasks/{task_id}/events") as response:
+            assert response.headers["content-type"].startswith("text/event-stream")
+            async for line in response.aiter_lines():
+                if line.startswith("data: "):
+                    events.append(json.loads(line[len("data: "):]))
+                    if events[-1]["status"] != "pending":
+                        break
+
+        assert events[-1]["status"] == "completed"
+        assert sum(events[-1]["result"].values()) == 1024
+
+
+@pytest.mark.asyncio
+async def test_websocket_notifies_many_tasks():
+    circuits = [
+        f'OPENQASM 3; include "stdgates.inc"; qubit[{n}] q; bit[{n}] c; h q; c = measure q;'
+        for n in range(1, 4)
+    ]
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        task_ids = []
+        for qasm in circuits:
+            post = await client.post("/tasks", json={"qc": qasm, "marginalize": [0]})
+            task_ids.append(post.json()["task_id"])
+
+    async with websockets.connect(API_URL.replace("http", "ws") + "/tasks/ws") as ws:
+        await ws.send(json.dumps({"subscribe": task_ids}))
+        received = {}
+        while len(received) < len(task_ids):
+            event = json.loads(await asyncio.wait_for(ws.recv(), timeout=15))
+            received[event["task_id"]] = event
+
+    assert set(received) == set(task_ids)
+    assert all(event["status"] == "completed" for event in received.values())
+
+
+@pytest.mark.asyncio
+async def test_websocket_survives_malformed_commands():
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        task_id = (await client.post("/tasks", json={"qc": QASM})).json()["task_id"]
+
+    async with websockets.connect(API_URL.replace("http", "ws") + "/tasks/ws") as ws:
+        for command in ("not json", "[1, 2]", '"subscribe"', '{"subscribe": "abc"}'):
+            await ws.send(command)
+            reply = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+            assert reply["error"].startswith("Invalid command")
+
+        # The connection is still usable
+        await ws.send(json.dumps({"subscribe": [task_id]}))
+        event = json.loads(await asyncio.wait_for(ws.recv(), timeout=15))
+        assert event["task_id"] == task_id
+
+
+@pytest.mark.asyncio
+async def test_bulk_task_status_lookup():
+    qasm = 'OPENQASM 3; include "stdgates.inc"; qubit[1] q; bit[1] c; h q[0]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        task_ids = [(await client.post("/tasks", json={"qc": qasm})).json()["task_id"]
+                    for _ in range(3)]
+        unknown_id = "00000000-0000-0000-0000-000000000000"
+
+        for _ in range(15):
+            post = await client.post("/tasks/status", json={"task_ids": task_ids + [unknown_id]})
+            assert post.status_code == 200
+            statuses = post.json()
+            if all(statuses[task_id]["status"] == "completed" for task_id in task_ids):
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Tasks did not complete in time"
+
+        # Same shape as GET /tasks/{task_id}
+        for task_id in task_ids:
+            single = (await client.get(f"/tasks/{task_id}")).json()
+            assert statuses[task_id] == single
+        assert statuses[unknown_id]["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_incremental_counters():
+    # A fresh rotation angle keeps the circuit out of the result cache, so it is enqueued
+    angle = time.time() % 1
+    qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[3] q; bit[3] c; rx({angle}) q[2]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        before = (await client.get("/metrics/")).json()
+        post = await client.post("/tasks", json={"qc": qasm, "marginalize": "none"})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            data = (await client.get(f"/tasks/{task_id}")).json()
+            if data["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+
+        # Workers may buffer counters for up to METRICS_FLUSH_INTERVAL_MS
+        finished_before = before["task_stats"]["completed"] + before["task_stats"]["failed"]
+        for _ in range(10):
+            after = (await client.get("/metrics/")).json()
+            finished = after["task_stats"]["completed"] + after["task_stats"]["failed"]
+            if finished > finished_before:
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Finished task was not counted"
+        assert after["task_stats"]["total"] >= before["task_stats"]["total"] + 1
+        for name in ("pending_tasks", "active_tasks", "reserved_tasks"):
+            assert isinstance(after["queue_stats"][name], int)
+            assert after["queue_stats"][name] >= 0
+
+        timing = (await client.get("/metrics/tasks")).json()["timing"]
+        assert timing["avg_execution_time_ms"] > 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_share_the_async_redis_pool_under_load():
+    # More concurrent requests than the API's pool has connections (REDIS_ASYNC_MAX_CONNECTIONS)
+    paths = ["/metrics/", "/metrics/tasks", "/metrics/prometheus", "/health/redis"] * 30
+    limits = httpx.Limits(max_connections=len(paths))
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30, limits=limits) as client:
+        responses = await asyncio.gather(*(client.get(path) for path in paths))
+
+    for path, response in zip(paths, responses):
+        assert response.status_code == 200, path
+        if path != "/metrics/prometheus":
+            assert response.json().get("status") != "error", response.json()
+
+
+@pytest.mark.asyncio
+async def test_prometheus_stage_histograms():
+    angle = time.time() % 1
+    qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[2] q; bit[2] c; ry({angle}) q[1]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        task_id = (await client.post("/tasks", json={"qc": qasm})).json()["task_id"]
+        for _ in range(15):
+            if (await client.get(f"/tasks/{task_id}")).json()["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+
+        # Observations are flushed to Redis within METRICS_FLUSH_INTERVAL_MS
+        for _ in range(10):
+            response = await client.get("/metrics/prometheus")
+            body = response.text
+            if 'qc_stage_duration_seconds_count{stage="simulate"} 0' not in body and \
+                    'qc_circuits_total{outcome="completed",qubits="1-4"}' in body:
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Stage observations were not reported"
+
+        assert response.headers["content-type"].startswith("text/plain")
+        for stage in ("http", "enqueue", "queue_wait", "parse", "simulate", "postprocess"):
+            assert f'qc_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}}' in body
+        assert "# TYPE qc_tasks_total counter" in body
+
+
+@pytest.mark.asyncio
+async def test_task_profile_not_found():
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        response = await client.get("/metrics/profiles/unknown-task")
+        assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_failed_requests_are_always_logged():
+    # Only successful requests are sampled (LOG_SUCCESS_SAMPLE_RATE); records
+    # reach the log file through a queue listener thread, off the event loop
+    request_id = f"test-{time.time()}"
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        response = await client.get(f"/metrics/profiles/{request_id}", headers={"X-Request-ID": request_id})
+        assert response.status_code == 404
+
+    for _ in range(10):
+        with open(API_LOG) as f:
+            lines = [line for line in f if request_id in line and "Request error: " in line]
+        if lines:
+            break
+        await asyncio.sleep(0.2)
+    else:
+        assert False, "Failed request was not logged"
+    record = json.loads(lines[-1].split("Request error: ", 1)[1])
+    assert record["request_id"] == request_id
+    assert record["path"] == f"/metrics/profiles/{request_id}"
+    assert record["status_code"] == 404
+    assert record["processing_time_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_health_reports_cached_worker_liveness():
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        response = await client.get("/health/")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["components"]["redis"] == "healthy"
+        assert data["staleness_seconds"] >= 0
+        for worker in data["workers"].values():
+            assert worker["status"] in ("alive", "stale")
+            assert worker["last_seen_seconds_ago"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_small_circuits_are_routed_and_tracked():
+    angle = time.time() % 1
+    qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[2] q; bit[2] c; rz({angle}) q[0]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        task_id = (await client.post("/tasks", json={"qc": qasm})).json()["task_id"]
+        for _ in range(15):
+            if (await client.get(f"/tasks/{task_id}")).json()["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+
+        # Routing accuracy is flushed to Redis within METRICS_FLUSH_INTERVAL_MS
+        for _ in range(10):
+            body = (await client.get("/metrics/prometheus")).text
+            if 'qc_routed_tasks_total{queue="small"}' in body:
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Routed task was not reported"
+        assert 'qc_routed_estimated_seconds_total{queue="small"}' in body
+        assert 'qc_queue_depth{queue="small"}' in body
+
+        queues = (await client.get("/metrics/")).json()["queue_stats"]["pending_by_queue"]
+        assert set(queues) >= {"small", "medium", "large"}
+
+
+@pytest.mark.asyncio
+async def test_duplicate_submissions_share_a_task():
+    angle = time.time() % 1
+    qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[2] q; bit[2] c; rx({angle}) q[0]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        # Identical circuits submitted concurrently coalesce onto one pending task
+        responses = await asyncio.gather(*(
+            client.post("/tasks", json={"qc": qasm}) for _ in range(5)))
+        assert len({response.json()["task_id"] for response in responses}) == 1
+
+        # A retry with the same Idempotency-Key returns the first task
+        other = qasm.replace("q[0]", "q[1]", 1)
+        headers = {"Idempotency-Key": f"test-{angle}"}
+        first = (await client.post("/tasks", json={"qc": other}, headers=headers)).json()
+        retry = (await client.post("/tasks", json={"qc": other}, headers=headers)).json()
+        assert retry["task_id"] == first["task_id"]
+
+        # The same key with a different circuit is a client error, not a retry
+        reused = await client.post("/tasks", json={"qc": qasm}, headers=headers)
+        assert reused.status_code == 422
+        assert "Idempotency-Key" in reused.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_simulation_options_and_method_selection():
+    angle = time.time() % 1
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        clifford = 'OPENQASM 3; include "stdgates.inc"; qubit[30] q; bit[30] c; h q[0]; ' \
+                   + " ".join(f"cx q[{i}], q[{i + 1}];" for i in range(29)) + " c = measure q;"
+        post = await client.post("/tasks", json={"qc": clifford, "shots": 100, "seed": 7})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            data = (await client.get(f"/tasks/{task_id}")).json()
+            if data["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+        assert sum(data["result"].values()) == 100
+
+        # Dense 40-qubit statevectors fit no memory budget
+        dense = 'OPENQASM 3; include "stdgates.inc"; qubit[40] q; bit[40] c; ' \
+                + f"rx({angle}) q[0]; " \
+                + " ".join(f"cx q[{i}], q[{(i * 7 + 3) % 40}];" for i in range(40) if i != (i * 7 + 3) % 40) \
+                + " c = measure q;"
+        post = await client.post("/tasks", json={"qc": dense})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            data = (await client.get(f"/tasks/{task_id}")).json()
+            if data["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+        assert "memory budget" in data["result"]["error"]
+
+        response = await client.post("/tasks", json={"qc": clifford, "method": "unknown"})
+        assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_explicit_method_is_held_to_the_memory_budget():
+    # All-to-all entanglement: no matrix product state bond is bounded below 2^(n/2)
+    angle = time.time() % 1
+    qasm = 'OPENQASM 3; include "stdgates.inc"; qubit[60] q; bit[60] c; ' \
+        + f"rx({angle}) q[0]; " \
+        + " ".join(f"cx q[{i}], q[{59 - i}];" for i in range(30)) \
+        + " c = measure q;"
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        post = await client.post("/tasks", json={"qc": qasm, "method": "matrix_product_state"})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            data = (await client.get(f"/tasks/{task_id}")).json()
+            if data["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+        assert "matrix product state" in data["result"]["error"]
+        assert "memory budget" in data["result"]["error"]
+
+
+@pytest.mark.asyncio
+async def test_parameter_binds_run_as_one_task():
+    qasm = 'OPENQASM 3; include "stdgates.inc"; input float theta; qubit[1] q; bit[1] c; ' \
+           'rx(theta) q[0]; c = measure q;'
+    angles = [0.0, 3.141592653589793, time.time() % 1]
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        post = await client.post("/tasks", json={
+            "qc": qasm, "parameter_binds": [{"theta": angle} for angle in angles]})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            data = (await client.get(f"/tasks/{task_id}")).json()
+            if data["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+
+        counts = data["result"]["counts"]
+        assert len(counts) == len(angles)
+        assert counts[0] == {"0": 1024}
+        assert counts[1] == {"1": 1024}
+
+
+@pytest.mark.asyncio
+async def test_large_results_round_trip_compressed():
+    # 4096 shots over 12 qubits: thousands of outcomes, above the compression threshold
+    angle = time.time() % 1
+    qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[12] q; bit[12] c; h q; rz({angle}) q[0]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        post = await client.post("/tasks", json={"qc": qasm, "marginalize": "none", "shots": 4096})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            data = (await client.get(f"/tasks/{task_id}")).json()
+            if data["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+
+        assert data["status"] == "completed"
+        assert sum(data["result"].values()) == 4096
+        assert len(data["result"]) > 1000
+        assert all(len(outcome) == 12 for outcome in data["result"])
+
+
+@pytest.mark.asyncio
+async def test_large_results_are_streamed_from_the_blob_store():
+    # Every outcome of 16 qubits: a result far above the inline limit
+    angle = time.time() % 1
+    qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[16] q; bit[16] c; h q; rz({angle}) q[0]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30) as client:
+        post = await client.post("/tasks", json={"qc": qasm, "marginalize": "none", "shots": 200000})
+        task_id = post.json()["task_id"]
+        for _ in range(15):
+            get = await client.get(f"/tasks/{task_id}")
+            data = get.json()
+            if data["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+
+        assert data["status"] == "completed"
+        assert sum(data["result"].values()) == 200000
+        assert len(data["result"]) > 60000
+
+        # Bulk status responses point to the result instead of inlining it
+        statuses = (await client.post("/tasks/status", json={"task_ids": [task_id]})).json()
+        assert statuses[task_id]["status"] == "completed"
+        assert "result" not in statuses[task_id]
+        assert f"/tasks/{task_id}" in statuses[task_id]["message"]
+
+
+@pytest.mark.asyncio
+async def test_worker_startup_is_reported():
+    angle = time.time() % 1
+    qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[1] q; bit[1] c; rx({angle}) q[0]; c = measure q;'
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        task_id = (await client.post("/tasks", json={"qc": qasm})).json()["task_id"]
+        for _ in range(15):
+            if (await client.get(f"/tasks/{task_id}")).json()["status"] != "pending":
+                break
+            await asyncio.sleep(0.5)
+
+        # The first finished task of a worker process reports its cold start
+        for _ in range(10):
+            body = (await client.get("/metrics/prometheus")).text
+            if 'qc_worker_startup_seconds_count{phase="cold_start"} 0' not in body:
+                break
+            await asyncio.sleep(0.5)
+        else:
+            assert False, "Worker startup was not reported"
+        assert 'qc_worker_startup_seconds_count{phase="worker_ready"} 0' not in body
+        assert 'qc_worker_startup_seconds_bucket{phase="restart",le="+Inf"}' in body
+
+
+@pytest.mark.asyncio
+async def test_pooled_simulators_keep_small_tasks_cheap():
+    # Simulators are built and warmed when a worker process starts, so no task
+    # pays backend initialization: tiny circuits simulate in milliseconds
+    angle = time.time() % 1
+    async with httpx.AsyncClient(base_url=API_URL) as client:
+        task_ids = []
+        for i in range(3):
+            qasm = f'OPENQASM 3; include "stdgates.inc"; qubit[1] q; bit[1] c; rx({angle + i}) q[0]; c = measure q;'
+            task_ids.append((await client.post("/tasks", json={"qc": qasm})).json()["task_id"])
+        for task_id in task_ids:
+            for _ in range(15):
+                data = (await client.get(f"/tasks/{task_id}")).json()
+                if data["status"] != "pending":
+                    break
+                await asyncio.sleep(0.5)
+            assert data["status"] == "completed"
+
+    for task_id in task_ids:
+        assert float(task_metadata(task_id)["simulate_ms"]) < 100
+
+
+@pytest.mark.asyncio
+async def test_prefork_worker_runs_circuits_side_by_side():
+    # Same sizing as the workers: WORKER_CONCURRENCY, or one process per available CPU
+    if celery_app.conf.worker_concurrency < 2:
+        pytest.skip("Workers run a single process on this host")
+    # Narrow circuits that take a fraction of a second each to parse and simulate
+    angle = time.time() % 1
+    gates = " ".join(f"rx({angle + layer / 10}) q[{i}];" for layer in range(50) for i in range(12)) \
+        + " " + " ".join(f"cx q[{i}], q[{i + 1}];" for _ in range(50) for i in range(11))
+    circuits = [f'OPENQASM 3; include "stdgates.inc"; qubit[12] q; bit[12] c; ry({i}) q[0]; {gates} c = measure q;'
+                for i in range(2)]
+    async with httpx.AsyncClient(base_url=API_URL, timeout=30) as client:
+        task_ids = [(await client.post("/tasks", json={"qc": qasm})).json()["task_id"]
+                    for qasm in circuits]
+        for task_id in task_ids:
+            for _ in range(30):
+                data = (await client.get(f"/tasks/{task_id}")).json()
+                if data["status"] != "pending":
+                    break
+                await asyncio.sleep(0.5)
+            assert data["status"] == "completed"
+
+    # Each ran in its own pool process, so their execution overlapped
+    intervals = []
+    for task_id in task_ids:
+        metadata = task_metadata(task_id)
+        completed_at = float(metadata["completed_at"])
+        intervals.append((completed_at - float(metadata["execution_time"]), completed_at))
+    (start_a, end_a), (start_b, end_b) = intervals
+    assert start_a < end_b and start_b < end_a
+
+
+def test_api_does_not_load_the_simulation_stack():
+    # Qiskit and Aer are worker-only: the API image must not pay for them
+    code = "import sys, app.main; print(sorted({'qiskit', 'qiskit_aer', 'numpy'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip().splitlines()[-1] == "[]"
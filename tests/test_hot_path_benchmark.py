@@ -0,0 +1,50 @@
+import filecmp
+import os
+from app.core.telemetry import observe, remove_stage_hook
+from benchmarks.build_corpus import CORPUS_DIR, FAMILIES, QUBIT_COUNTS, main as build_corpus
+from benchmarks.hot_path import STAGES, compare, load_corpus, run_once
+
+
+def test_checked_in_corpus_is_reproducible(tmp_path):
+    build_corpus(["--output", str(tmp_path)])
+    names = sorted(os.listdir(tmp_path))
+    assert len(names) == len(FAMILIES) * len(QUBIT_COUNTS)
+    # Seeded per family and width: regenerating gives the committed files byte for byte
+    _, mismatch, errors = filecmp.cmpfiles(CORPUS_DIR, tmp_path, names, shallow=False)
+    assert mismatch == [] and errors == []
+
+
+def test_load_corpus_filters_and_orders():
+    circuits = load_corpus(["qft", "ghz"], max_qubits=4)
+    assert [(family, qubits) for family, qubits, _ in circuits] == [
+        ("qft", 1), ("qft", 2), ("qft", 4), ("ghz", 1), ("ghz", 2), ("ghz", 4)]
+    with open(os.path.join(CORPUS_DIR, "ghz_04.qasm")) as f:
+        assert circuits[-1][2] == f.read()
+
+
+def test_run_once_times_every_stage():
+    # As in bench_circuit: stage timings must not reach the metrics in Redis
+    remove_stage_hook(observe)
+    _, _, qasm = load_corpus(["ghz"], max_qubits=2)[-1]
+    qc, method, outcomes, seconds = run_once(qasm, 100, "none")
+    assert qc.num_qubits == 2
+    assert method == "stabilizer"
+    assert outcomes == 2
+    assert len(seconds) == len(STAGES) and all(stage > 0 for stage in seconds)
+
+
+def test_compare_prints_ratios_per_case(capsys):
+    def row(qubits, parse_ms, simulate_ms):
+        return {"family": "ghz", "qubits": qubits, "shots": 100, "parse_ms": parse_ms,
+                "simulate_ms": simulate_ms, "reduce_ms": 1.0, "total_ms": parse_ms + simulate_ms + 1.0}
+
+    baseline = {"commit": "abc1234", "results": [row(2, 2.0, 4.0), row(4, 0.0, 1.0)]}
+    # The 8-qubit case has no baseline and is skipped
+    compare([row(2, 1.0, 8.0), row(4, 1.0, 1.0), row(8, 1.0, 1.0)], baseline)
+
+    lines = capsys.readouterr().out.strip().splitlines()
+    assert "abc1234" in lines[0]
+    assert lines[2].split() == ["ghz", "2", "100", "0.50", "2.00", "1.00", "1.43"]
+    # A zero baseline time has no ratio
+    assert lines[3].split()[3] == "nan"
+    assert len(lines) == 4
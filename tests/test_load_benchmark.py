@@ -0,0 +1,60 @@
+import json
+import os
+import pytest
+from benchmarks.load import CIRCUIT_FAMILIES, check_thresholds, latency_summary, parse_mix
+
+THRESHOLDS = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "load_thresholds.json")
+
+
+def test_parse_mix():
+    assert parse_mix("ghz:2=0.8,layered:12=0.2") == [("ghz", 2, 0.8), ("layered", 12, 0.2)]
+    # Weights default to 1
+    assert parse_mix("ghz:3") == [("ghz", 3, 1.0)]
+    with pytest.raises(ValueError, match="Unknown circuit family"):
+        parse_mix("qft:4=1")
+    with pytest.raises(ValueError, match="Invalid circuit mix entry"):
+        parse_mix("ghz=1")
+
+
+def test_circuit_families_declare_their_width():
+    for family, build in CIRCUIT_FAMILIES.items():
+        qasm = build(5)
+        assert "qubit[5] q;" in qasm and "bit[5] c;" in qasm, family
+
+
+def test_latency_summary_percentiles():
+    # 0 to 100 ms: the percentiles fall on the samples themselves
+    summary = latency_summary([ms / 1000 for ms in range(101)])
+    assert summary == {"p50": 50.0, "p95": 95.0, "p99": 99.0, "mean": 50.0, "max": 100.0}
+
+    assert latency_summary([0.012]) == {"p50": 12.0, "p95": 12.0, "p99": 12.0, "mean": 12.0, "max": 12.0}
+    assert latency_summary([]) is None
+
+
+def test_check_thresholds_reports_each_violation():
+    results = {"failed": 0, "throughput_per_second": 3.0, "completion_latency_ms": {"p95": 300.0}}
+    thresholds = {
+        "failed": {"max": 0},
+        "throughput_per_second": {"min": 4.5},
+        "completion_latency_ms.p95": {"max": 250},
+        "submit_latency_ms.p95": {"max": 120},
+    }
+    assert check_thresholds(results, thresholds) == [
+        "throughput_per_second: 3.0 is below the minimum 4.5",
+        "completion_latency_ms.p95: 300.0 is above the maximum 250",
+        "submit_latency_ms.p95: not measured",
+    ]
+    assert check_thresholds(results, {"failed": {"max": 0}, "throughput_per_second": {"min": 3.0}}) == []
+
+
+def test_checked_in_thresholds_name_reported_metrics():
+    with open(THRESHOLDS) as f:
+        thresholds = json.load(f)
+    summary = latency_summary([0.001])
+    # Every metric a run_load report has, at a value within any sane bound
+    results = {"rejected": 0, "failed": 0, "timed_out": 0, "throughput_per_second": 1000.0,
+               "submit_latency_ms": summary, "completion_latency_ms": summary,
+               "redis_commands_per_task": 1.0}
+    assert thresholds
+    assert all(set(bounds) <= {"min", "max"} and bounds for bounds in thresholds.values())
+    assert check_thresholds(results, thresholds) == []
@@ -0,0 +1,21 @@
+from app.core.logging_config import CappedRepr
+
+
+def test_capped_repr_renders_small_payloads_unchanged():
+    for value in ({"0": 512, "1": 512}, {"counts": [{"0": 1}, {"1": 2}]}, [], (1,), "text", None):
+        assert str(CappedRepr(value)) == str(value)
+
+
+def test_capped_repr_stops_at_max_chars():
+    class Outcome(str):
+        rendered = 0
+
+        def __repr__(self):
+            Outcome.rendered += 1
+            return super().__repr__()
+
+    counts = {Outcome(format(i, "016b")): 1 for i in range(65536)}
+    text = str(CappedRepr(counts, max_chars=100))
+    # Only the outcomes within the first 100 characters were rendered
+    assert Outcome.rendered < 10
+    assert text == str(counts)[:100] + "... [truncated (65536 entries)]"